@@ -0,0 +1,158 @@
+import numpy as np
+from settings import *
+from sprite_cache import get_variant, clear_variants
+
+# --- ÉTATS / DIRECTIONS (indices des tables de clips) ---
+IDLE, RUNNING, ATTACKING = 0, 1, 2
+DOWN, LEFT, RIGHT, UP = 0, 1, 2, 3
+FACINGS = ['down', 'left', 'right', 'up']
+STATES = ['idle', 'running', 'attacking']
+
+ATTACK_OFFSET = 30  # Décalage horizontal du sprite pendant l'attaque (l'arme dépasse)
+WALK_SPEED = 0.2    # Frames avancées par tick
+ATTACK_SPEED = 0.35
+
+
+class Clip:
+    """Une animation (état + direction) : frames partagées et rect de chaque frame précalculé."""
+    __slots__ = ('frames', 'length', 'speed', 'loop', 'boxes', 'index')
+
+    def __init__(self, frames, speed, loop=True, offset_x=0):
+        self.index = 0  # Position dans ClipTable.clips (même clip dans une autre variante)
+        self.frames = tuple(frames)  # Déjà en RLE si SPRITE_RLE (sprite_cache.Variant)
+        self.length = len(self.frames)
+        self.speed = speed
+        self.loop = loop
+        # boxes[i] = (dx, dy, w, h) : rect de la frame i par rapport au centre de la hitbox
+        self.boxes = tuple((offset_x - f.get_width() // 2, -(f.get_height() // 2), f.get_width(), f.get_height())
+                           for f in self.frames)
+
+
+class ClipTable:
+    """Tous les clips d'un type d'entité, construits une fois et partagés par toutes ses instances.
+
+    clips[état * 4 + direction] ; l'idle n'utilise que la 1ère frame de marche.
+    """
+
+    def __init__(self, walk, attack, idle_speed=0.0, key=None):
+        self.key = key  # (skin, échelle, teinte) de la variante
+        self._flashed = None  # Table flash, gardée tant que cette table vit (pas d'éviction LRU)
+        self.idle_speed = idle_speed
+        self.clips = []
+        for state in range(len(STATES)):
+            for facing, name in enumerate(FACINGS):
+                if state == IDLE:
+                    clip = Clip(walk[name][:1], idle_speed)
+                elif state == RUNNING:
+                    clip = Clip(walk[name], WALK_SPEED)
+                else:
+                    offset = -ATTACK_OFFSET if facing == RIGHT else ATTACK_OFFSET if facing == LEFT else 0
+                    clip = Clip(attack[name], ATTACK_SPEED, loop=False, offset_x=offset)
+                clip.index = len(self.clips)
+                self.clips.append(clip)
+        # named[état][direction] -> clip, pour les sprites qui gardent des chaînes
+        self.named = {state: {facing: self.clip(s, f) for f, facing in enumerate(FACINGS)}
+                      for s, state in enumerate(STATES)}
+        # Versions numpy pour les simulations groupées (EnemySwarm), indexées par état
+        self.lengths = np.array([len(self.clips[s * len(FACINGS)].frames) for s in range(len(STATES))])
+        self.speeds = np.array([self.clips[s * len(FACINGS)].speed for s in range(len(STATES))])
+        self.frame_size = walk['down'][0].get_size()
+
+    def clip(self, state, facing):
+        return self.clips[state * len(FACINGS) + facing]
+
+    def flashed(self):
+        """Table de la même variante en version flash (ennemi touché), cherchée une seule fois."""
+        if self._flashed is None:
+            skin, scale, tint = self.key
+            self._flashed = get_table(skin, self.idle_speed, tint, scale, flash=True)
+        return self._flashed
+
+
+def get_table(skin=None, idle_speed=0.0, tint=None, scale=None, flash=False):
+    """Table de clips d'une variante (sprite_cache.get_variant), partagée par toutes les entités."""
+    if skin is None: skin = DEFAULT_SKIN
+    if scale is None: scale = PLAYER_SCALE
+    variant = get_variant(skin, scale, tint, flash)
+    table = variant.tables.get(idle_speed)
+    if table is None:
+        key = (skin, scale, tuple(tint) if tint is not None else None)
+        table = variant.tables[idle_speed] = ClipTable(variant.walk, variant.attack, idle_speed, key)
+    return table
+
+
+def clear_tables():
+    clear_variants()
+
+
+class Animator:
+    """État d'animation d'une entité : clip courant, frame affichée, avancement dans le clip."""
+    __slots__ = ('table', 'clip', 'frame', 'timer', 'flash', 'flash_table')
+
+    def __init__(self, table):
+        self.table = table
+        self.reset()
+
+    def reset(self):
+        self.clip = self.table.clip(IDLE, DOWN)
+        self.frame = 0
+        self.timer = 0.0
+        self.flash = 0  # Ticks de flash restants
+        self.flash_table = None  # Table flash de self.table, prise au premier coup reçu
+
+    def set_table(self, table):
+        """Change de variante (skin, teinte) sans perdre l'avancement de l'animation."""
+        self.table = table
+        self.clip = table.clips[self.clip.index]
+        self.flash_table = table.flashed() if self.flash else None
+
+    def start_flash(self, ticks):
+        """Coup reçu : la table flash est prise ici une fois, pose() n'a plus qu'à la lire."""
+        if self.flash_table is None: self.flash_table = self.table.flashed()
+        self.flash = ticks
+
+    def restart(self):
+        self.timer = 0.0
+
+    def step(self, sprite):
+        """Avance d'un tick puis pose le sprite (entité toujours affichée, comme le joueur)."""
+        advance_all((sprite,))
+        pose(sprite)
+
+
+def advance_all(sprites):
+    """Avance d'un tick l'animation de tous les sprites (ceux qui ont un .anim) en un passage.
+
+    Le clip est choisi d'après sprite.state / sprite.facing ; à la fin d'une attaque le sprite
+    repasse en idle. Seuls les compteurs bougent : l'image et le rect sont posés par pose(),
+    uniquement pour les sprites affichés. Renvoie le nombre d'attaques terminées.
+    """
+    finished = 0
+    for sprite in sprites:
+        anim = sprite.anim
+        clip = anim.table.named[sprite.state][sprite.facing]
+        timer = anim.timer + clip.speed
+        if timer >= clip.length:
+            timer = 0.0
+            if not clip.loop:
+                sprite.is_attacking = False
+                sprite.state = 'idle'
+                clip = anim.table.named['idle'][sprite.facing]
+                finished += 1
+        anim.clip = clip
+        anim.frame = int(timer)
+        anim.timer = timer
+        if anim.flash: anim.flash -= 1
+    return finished
+
+
+def pose(sprite):
+    """Image et rect du sprite d'après son animation (le rect est modifié sur place)."""
+    anim = sprite.anim
+    clip, frame = anim.clip, anim.frame
+    if anim.flash:
+        clip = anim.flash_table.clips[clip.index]
+    sprite.image = clip.frames[frame]
+    dx, dy, w, h = clip.boxes[frame]
+    hitbox = sprite.hitbox
+    sprite.rect.update(hitbox.centerx + dx, hitbox.centery + dy, w, h)
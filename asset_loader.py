@@ -0,0 +1,74 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from settings import *
+
+# --- CHARGEMENT EN ARRIÈRE-PLAN ---
+# Les jobs (décodage PNG, agrandissement, masques, grilles) tournent sur des threads :
+# pygame et numpy relâchent le GIL pendant ces opérations. Ils ne doivent jamais
+# appeler convert() / convert_alpha() ni toucher à l'écran : c'est le rôle de
+# finish(résultat), appelé par poll() sur le thread principal.
+# Sur un seul coeur, des threads ne font que se disputer le GIL (bench_startup.py) :
+# les jobs tournent alors en série sur le thread principal, un par poll().
+
+
+class AssetLoader:
+    def __init__(self, workers=None):
+        if workers is None: workers = ASSET_LOADER_WORKERS
+        self.workers = max(1, min(workers, os.cpu_count() or 1))
+        self.executor = None
+        if self.workers > 1:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        self.queue = deque()  # En série : (future, prepare, args) pas encore lancés
+        self.jobs = {}  # future -> finish (None : rien à faire sur le thread principal)
+        self.total = 0
+        self.done = 0
+
+    def submit(self, prepare, *args, finish=None):
+        """Lance prepare(*args) sur un thread ; finish(résultat) sera appelé par poll()."""
+        if self.executor is not None:
+            future = self.executor.submit(prepare, *args)
+        else:
+            future = Future()
+            self.queue.append((future, prepare, args))
+        self.jobs[future] = finish
+        self.total += 1
+        return future
+
+    def run_next(self):
+        """En série : exécute le prochain job sur le thread principal."""
+        future, prepare, args = self.queue.popleft()
+        try:
+            future.set_result(prepare(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    def poll(self):
+        """Termine les jobs prêts (thread principal). Renvoie True quand il n'en reste aucun."""
+        if self.queue: self.run_next()
+        for future in [f for f in self.jobs if f.done()]:
+            finish = self.jobs.pop(future)
+            result = future.result()  # Relance ici l'exception éventuelle du thread
+            if finish is not None: finish(result)
+            self.done += 1
+        return not self.jobs
+
+    def ready(self, future):
+        """Job fini et son finish() déjà appelé."""
+        return future.done() and future not in self.jobs
+
+    def wait_any(self, timeout=None):
+        """Bloque jusqu'à la fin d'au moins un job (mode sans fenêtre : rien à afficher)."""
+        if self.queue:
+            self.run_next()
+        elif self.jobs:
+            wait(list(self.jobs), timeout=timeout, return_when=FIRST_COMPLETED)
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def shutdown(self):
+        self.queue.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,149 @@
+import os
+import json
+import mmap
+import struct
+import hashlib
+import numpy as np
+import pygame
+from settings import *
+import sprite_cache
+from collision import CollisionGrid
+from game_map import GameMap
+
+# --- PACK D'ASSETS PRÉCOMPILÉ ---
+# Format : MAGIC | longueur de l'en-tête (u32) | en-tête JSON | données brutes alignées sur 16 octets
+# En-tête : {'version', 'hash', 'entries': {nom: [offset, largeur, hauteur, format]}}
+MAGIC = b"PALMPAK\0"
+PACK_VERSION = 2  # 2 : collisions à la résolution source, plus d'overlay debug (construit à la demande)
+PACK_FILE = os.path.join(BASE_DIR, "assets.pack")
+
+# Planches découpées dans le pack : (fichier, lignes, colonnes), comme Player / Enemy
+SHEETS = [(WALK_SPRITE, 4, 6), (ATTACK_SPRITE, 4, 8)]
+
+
+def source_files():
+    files = [os.path.join(BASE_DIR, MAP_FILE), os.path.join(BASE_DIR, COLLISION_FILE)]
+    files += [os.path.join(SPRITE_DIR, name) for name, _, _ in SHEETS]
+    return files
+
+
+def source_hash():
+    """Empreinte des fichiers sources et des réglages qui changent le résultat."""
+    h = hashlib.sha1()
+    h.update(repr((PACK_VERSION, ZOOM_FACTOR, PLAYER_SCALE, MAP_FILE, COLLISION_FILE, SHEETS)).encode())
+    for path in source_files():
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def anim_entry(name, rows, cols, direction, index):
+    return f"anim:{name}:{rows}:{cols}:{PLAYER_SCALE}:{direction}:{index}"
+
+
+def build_pack(path=None):
+    """Étape hors-ligne : carte agrandie, collisions (résolution source) et frames dans un seul fichier."""
+    if path is None: path = PACK_FILE
+    blobs = []  # (nom, octets, largeur, hauteur, format)
+
+    game_map = GameMap()
+    blobs.append(('map', pygame.image.tobytes(game_map.image, 'RGBX'), game_map.width, game_map.height, 'RGBX'))
+    if game_map.has_collisions:
+        grid = game_map.collision
+        blobs.append(('collision', grid.packed_bits().tobytes(), grid.width, grid.height, 'bits'))
+
+    for name, rows, cols in SHEETS:
+        anims = sprite_cache.get_animations(os.path.join(SPRITE_DIR, name), rows, cols)
+        for direction, frames in anims.items():
+            for i, frame in enumerate(frames):
+                w, h = frame.get_size()
+                blobs.append((anim_entry(name, rows, cols, direction, i),
+                              pygame.image.tobytes(frame, 'RGBA'), w, h, 'RGBA'))
+
+    entries = {}
+    offset = 0
+    for name, data, w, h, fmt in blobs:
+        entries[name] = [offset, w, h, fmt]
+        offset += -(-len(data) // 16) * 16
+    header = json.dumps({'version': PACK_VERSION, 'hash': source_hash(), 'entries': entries}).encode()
+    start = -(-(len(MAGIC) + 4 + len(header)) // 16) * 16
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header)) + header)
+        f.write(b'\0' * (start - f.tell()))
+        for name, data, w, h, fmt in blobs:
+            f.write(data)
+            f.write(b'\0' * (-len(data) % 16))
+    return path
+
+
+class AssetPack:
+    """Pack mappé en mémoire : les surfaces sont construites directement sur ses octets.
+
+    Elles sont ensuite converties au format de l'écran (convert / convert_alpha), ce qui
+    les recopie : le gain est l'absence de décodage PNG, pas l'absence de copie.
+    """
+
+    def __init__(self, path=None):
+        if path is None: path = PACK_FILE
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} n'est pas un pack d'assets")
+        (size,) = struct.unpack_from('<I', self.data, len(MAGIC))
+        self.header = json.loads(self.data[len(MAGIC) + 4:len(MAGIC) + 4 + size])
+        self.start = -(-(len(MAGIC) + 4 + size) // 16) * 16
+        self.view = memoryview(self.data)
+
+    def __contains__(self, name):
+        return name in self.header['entries']
+
+    def surface(self, name):
+        offset, w, h, fmt = self.header['entries'][name]
+        begin = self.start + offset
+        return pygame.image.frombuffer(self.view[begin:begin + w * h * 4], (w, h), fmt)
+
+    def collision(self, world_size):
+        offset, w, h, fmt = self.header['entries']['collision']
+        stride = -(-w // 8)
+        bits = np.frombuffer(self.data, np.uint8, stride * h, self.start + offset).reshape(h, stride)
+        return CollisionGrid.from_packed(bits, w, h, world_size=world_size)
+
+    def install_animations(self):
+        """Remplit le cache de sprite_cache : Player / Enemy ne découpent plus rien."""
+        for name, rows, cols in SHEETS:
+            anims = {}
+            for direction in sprite_cache.DIRECTIONS[:rows]:
+                frames = []
+                i = 0
+                while anim_entry(name, rows, cols, direction, i) in self:
+                    frames.append(self.surface(anim_entry(name, rows, cols, direction, i)).convert_alpha())
+                    i += 1
+                anims[direction] = tuple(frames)
+            sprite_cache.install(os.path.join(SPRITE_DIR, name), rows, cols, PLAYER_SCALE, anims)
+
+
+def load_pack(path=None):
+    """Pack à jour (frames déjà installées dans le cache), ou None pour charger les PNG."""
+    if path is None: path = PACK_FILE
+    if not os.path.exists(path):
+        return None
+    try:
+        pack = AssetPack(path)
+    except (ValueError, OSError) as e:
+        print(f"Attention: pack d'assets illisible ({e}), chargement des PNG.")
+        return None
+    if pack.header.get('version') != PACK_VERSION or pack.header.get('hash') != source_hash():
+        print("Attention: pack d'assets obsolète (python asset_pack.py pour le reconstruire).")
+        return None
+    pack.install_animations()
+    print("Info: Assets chargés depuis le pack.")
+    return pack
+
+
+if __name__ == '__main__':
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    print(f"Pack écrit dans {build_pack()}")
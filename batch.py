@@ -0,0 +1,164 @@
+import argparse
+import contextlib
+import copy
+import csv
+import io
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from settings import *
+
+# Paramètres balayés : nom -> valeur par défaut
+PARAMS = {
+    'hp_per_level': LEVEL_HP_GAIN,
+    'damage_per_level': LEVEL_DAMAGE_GAIN,
+    'xp_growth': LEVEL_XP_GROWTH,
+    'enemy_health': 1.0,   # Multiplicateurs appliqués aux stats de waves.json
+    'enemy_damage': 1.0,
+}
+COLUMNS = ['seed'] + list(PARAMS) + ['wave', 'ticks', 'damage_taken', 'level', 'died', 'cleared', 'stuck']
+STUCK_TICKS = 600  # Ticks sans rien qui bouge ni dégâts : simulation bloquée, partie arrêtée
+
+# Une partie par processus de travail, créée une fois et réutilisée
+_game = None
+_waves = None
+
+
+def _init_worker():
+    global _game, _waves
+    from game import Game
+    from controls import BotInput
+    with contextlib.redirect_stdout(io.StringIO()):
+        _game = Game(headless=True, controls=BotInput())
+    _game.controls.attach(_game)
+    _waves = copy.deepcopy(_game.waves.waves)
+
+
+def progress(game):
+    """Ce qui change tant que la partie avance : positions du joueur et des ennemis, dégâts."""
+    return (game.player.hitbox.topleft, game.stats.damage_taken, game.stats.damage_dealt,
+            tuple(mob.hitbox.topleft for mob in game.all_enemies))
+
+
+def play(job):
+    """Joue une partie seedée jusqu'à la mort, la fin des vagues, un blocage ou max_ticks. Une ligne par vague.
+
+    Bloquée (stuck = 1) : rien n'a bougé et personne n'a pris de coup pendant stuck_ticks ;
+    la vague en cours n'est alors ni gagnée ni perdue, et la partie s'arrête là.
+    """
+    seed, params, max_ticks, stuck_ticks = job
+    if _game is None: _init_worker()
+    from controls import BotInput
+    game = _game
+
+    # Stats des ennemis mises à l'échelle à partir des vagues d'origine
+    waves = copy.deepcopy(_waves)
+    for wave in waves:
+        for group in wave['groups']:
+            stats = group['stats']
+            stats['max_health'] = stats['max_health'] * params['enemy_health']
+            stats['damage'] = stats['damage'] * params['enemy_damage']
+    game.waves.waves = waves
+
+    game.controls = BotInput(seed)
+    game.controls.attach(game)
+    with contextlib.redirect_stdout(io.StringIO()):  # Pas de "NIVEAU x !" à chaque level up
+        game.start_game()
+        game.state = 'game'
+        player = game.player
+        player.hp_per_level = params['hp_per_level']
+        player.damage_per_level = params['damage_per_level']
+        player.xp_growth = params['xp_growth']
+
+        rows = []
+        stats = game.stats  # Dégâts comptés par le bus de combat (les soins de niveau ne les masquent pas)
+        wave, start, taken = game.wave, 0, 0.0
+        last, still = progress(game), 0
+        for tick in range(max_ticks):
+            game.tick()
+            died = game.state == 'game_over'
+            if died or game.wave != wave:
+                damage = stats.damage_taken - taken
+                rows.append([seed, *params.values(), wave, tick + 1 - start, damage, player.level,
+                             int(died), int(not died), 0])
+                wave, start, taken = game.wave, tick + 1, stats.damage_taken
+            if died or game.wave > game.waves.count:
+                break
+            state = progress(game)
+            still = still + 1 if state == last else 0
+            last = state
+            if still >= stuck_ticks:
+                rows.append([seed, *params.values(), wave, tick + 1 - start, stats.damage_taken - taken,
+                             player.level, 0, 0, 1])
+                break
+        else:
+            # Temps écoulé : vague en cours ni gagnée ni perdue
+            damage = stats.damage_taken - taken
+            rows.append([seed, *params.values(), wave, max_ticks - start, damage, player.level, 0, 0, 0])
+    return rows
+
+
+def write_results(rows, prefix):
+    """Sortie en colonnes : CSV lisible + .npz (un tableau numpy par colonne)."""
+    with open(f"{prefix}.csv", 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    columns = list(zip(*rows)) if rows else [[] for _ in COLUMNS]
+    np.savez(f"{prefix}.npz", **{name: np.array(col) for name, col in zip(COLUMNS, columns)})
+
+
+def summary(rows):
+    """Par vague : parties jouées, taux de mort et de blocage, ticks moyens pour la finir, dégâts moyens."""
+    print(f"{'vague':>5} | {'parties':>7} | {'morts':>6} | {'bloquées':>8} | {'ticks':>7} | {'dégâts':>7} | {'niveau':>6}")
+    by_wave = {}
+    for row in rows:
+        by_wave.setdefault(row[COLUMNS.index('wave')], []).append(row)
+    for wave, wave_rows in sorted(by_wave.items()):
+        col = lambda name: np.array([r[COLUMNS.index(name)] for r in wave_rows], dtype=float)
+        cleared = col('cleared') == 1
+        ticks = col('ticks')[cleared].mean() if cleared.any() else float('nan')
+        print(f"{wave:>5} | {len(wave_rows):>7} | {col('died').mean():>6.1%} | {col('stuck').mean():>8.1%} | {ticks:>7.0f} | "
+              f"{col('damage_taken').mean():>7.1f} | {col('level').mean():>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulations d'équilibrage en parallèle (joueur automatique)")
+    parser.add_argument("--games", type=int, default=8, help="parties (seeds) par combinaison de paramètres")
+    parser.add_argument("--seed", type=int, default=0, help="première seed")
+    parser.add_argument("--max-ticks", type=int, default=20000)
+    parser.add_argument("--stuck-ticks", type=int, default=STUCK_TICKS,
+                        help="ticks sans progrès avant d'arrêter une partie bloquée (colonne stuck)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="batch_results", help="préfixe des fichiers .csv / .npz")
+    for name, default in PARAMS.items():
+        parser.add_argument("--" + name.replace('_', '-'), type=float, nargs="+", default=[default])
+    args = parser.parse_args()
+
+    grids = [getattr(args, name) for name in PARAMS]
+    jobs = [(args.seed + g, dict(zip(PARAMS, combo)), args.max_ticks, args.stuck_ticks)
+            for combo in itertools.product(*grids) for g in range(args.games)]
+
+    t0 = time.perf_counter()
+    rows = []
+    if args.workers <= 1:
+        for job in jobs:
+            rows.extend(play(job))
+    else:
+        with ProcessPoolExecutor(args.workers, initializer=_init_worker) as pool:
+            chunk = max(1, len(jobs) // (args.workers * 4))
+            for result in pool.map(play, jobs, chunksize=chunk):
+                rows.extend(result)
+    elapsed = time.perf_counter() - t0
+
+    write_results(rows, args.out)
+    summary(rows)
+    print(f"{len(jobs)} parties en {elapsed:.1f} s avec {args.workers} processus "
+          f"-> {len(jobs) / elapsed:.2f} parties/s. Résultats : {args.out}.csv / .npz")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import os
+import random
+import time
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from enemy import Enemy
+from animation import STATES, FACINGS, advance_all, pose
+
+
+def animate_legacy(mob):
+    # Ancien Enemy.animate : liste reconstruite, liste idle allouée, nouveau Rect à chaque frame
+    table = mob.anim.table
+    walk = {f: table.clip(1, i).frames for i, f in enumerate(FACINGS)}
+    attack = {f: table.clip(2, i).frames for i, f in enumerate(FACINGS)}
+    return walk, attack
+
+
+class LegacyAnim:
+    def __init__(self, mob):
+        self.anims_walk, self.anims_attack = animate_legacy(mob)
+        self.frame_index = 0
+
+    def animate(self, mob):
+        if mob.state == 'attacking':
+            current_list = self.anims_attack[mob.facing]
+            speed = 0.35
+        elif mob.state == 'running':
+            current_list = self.anims_walk[mob.facing]
+            speed = 0.2
+        else:
+            current_list = [self.anims_walk[mob.facing][0]]
+            speed = 0
+        self.frame_index += speed
+        if self.frame_index >= len(current_list):
+            if mob.state == 'attacking':
+                mob.is_attacking = False
+                mob.state = 'idle'
+            self.frame_index = 0
+        idx = int(self.frame_index)
+        if idx >= len(current_list): idx = 0
+        mob.image = current_list[idx]
+        old_center = mob.hitbox.center
+        mob.rect = mob.image.get_rect()
+        mob.rect.center = old_center
+        if mob.state == 'attacking':
+            if mob.facing == 'right': mob.rect.x -= 30
+            elif mob.facing == 'left': mob.rect.x += 30
+
+
+def shuffle_states(mobs, rng):
+    for mob in mobs:
+        mob.state = rng.choice(STATES)
+        mob.facing = rng.choice(FACINGS)
+        mob.is_attacking = mob.state == 'attacking'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût de l'animation par tick : ancien animate() contre advance_all")
+    parser.add_argument("-n", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--visible-max", type=int, default=200, help="sprites à l'écran (posés) par tick")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(args.seed)
+    print("ms/tick (budget à 60 FPS : 16.7 ms)")
+    for n in args.n:
+        mobs = [Enemy(rng.randrange(1000), rng.randrange(1000)) for _ in range(n)]
+        legacy = [LegacyAnim(mob) for mob in mobs]
+
+        shuffle_states(mobs, random.Random(args.seed))
+        t0 = time.perf_counter()
+        for _ in range(args.frames):
+            for mob, anim in zip(mobs, legacy):
+                anim.animate(mob)
+        before = (time.perf_counter() - t0) / args.frames * 1000
+
+        shuffle_states(mobs, random.Random(args.seed))
+        t0 = time.perf_counter()
+        for _ in range(args.frames):
+            advance_all(mobs)
+        after = (time.perf_counter() - t0) / args.frames * 1000
+
+        # Rendu : pose() seulement pour les sprites à l'écran (ici au plus visible_max)
+        shown = mobs[:args.visible_max]
+        t0 = time.perf_counter()
+        for _ in range(args.frames):
+            advance_all(mobs)
+            for mob in shown: pose(mob)
+        posed = (time.perf_counter() - t0) / args.frames * 1000
+        print(f"{n:>6} sprites | animate() {before:7.3f} | advance_all {after:7.3f} (x{before / after:.1f}) "
+              f"| + pose de {len(shown)} {posed:7.3f} (x{before / posed:.1f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import os
+import random
+import time
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from settings import *
+from game_map import GameMap
+
+
+def move_probes(game_map, box, dx, dy):
+    # Comportement d'avant (Player.update) : 3 points par axe, retour en arrière si un mur est touché
+    box.x += dx
+    if game_map.check_wall(box.centerx, box.centery) or \
+       game_map.check_wall(box.left, box.centery) or \
+       game_map.check_wall(box.right, box.centery):
+        box.x -= dx
+    box.y += dy
+    if game_map.check_wall(box.centerx, box.centery) or \
+       game_map.check_wall(box.centerx, box.top) or \
+       game_map.check_wall(box.centerx, box.bottom):
+        box.y -= dy
+
+
+def move_edges(game_map, box, dx, dy):
+    # Sondes empilées pour être exact : tout le bord avant, pixel par pixel
+    for step_x, step_y, n in ((1 if dx > 0 else -1, 0, abs(dx)), (0, 1 if dy > 0 else -1, abs(dy))):
+        for _ in range(n):
+            if step_x:
+                x = box.right if step_x > 0 else box.left - 1
+                hit = any(game_map.check_wall(x, y) for y in range(box.top, box.bottom))
+            else:
+                y = box.bottom if step_y > 0 else box.top - 1
+                hit = any(game_map.check_wall(x, y) for x in range(box.left, box.right))
+            if hit: break
+            box.move_ip(step_x, step_y)
+
+
+def move_swept(game_map, box, dx, dy):
+    game_map.move_box(box, dx, dy)
+
+
+def in_wall(game_map, box):
+    xs, ys = np.meshgrid(np.arange(box.left, box.right), np.arange(box.top, box.bottom))
+    return game_map.any_wall(xs, ys)
+
+
+def run(game_map, boxes, moves, fn):
+    boxes = [box.copy() for box in boxes]
+    t0 = time.perf_counter()
+    for tick_moves in moves:
+        for box, (dx, dy) in zip(boxes, tick_moves):
+            fn(game_map, box, dx, dy)
+    elapsed = time.perf_counter() - t0
+    stuck = sum(in_wall(game_map, box) for box in boxes)
+    return elapsed * 1e6 / (len(moves) * len(boxes)), stuck
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collisions : sondes ponctuelles / hitbox balayée")
+    parser.add_argument("-n", type=int, default=100, help="entités")
+    parser.add_argument("--ticks", type=int, default=30)
+    parser.add_argument("--speed", type=int, nargs="+", default=[5, 15, 40], help="pixels par tick")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    game_map = GameMap()
+    game_map.collision.wall_mask()  # Construit hors mesure
+    rng = random.Random(args.seed)
+
+    boxes = []
+    while len(boxes) < args.n:
+        box = pygame.Rect(rng.randrange(game_map.width - 60), rng.randrange(game_map.height - 65), 60, 65)
+        if not in_wall(game_map, box): boxes.append(box)
+
+    methods = [("3 sondes", move_probes), ("bords", move_edges), ("balayage", move_swept)]
+    print(f"{'vitesse':>7} | " + " | ".join(f"{name:>20}" for name, _ in methods) + "   (us/déplacement, dans un mur)")
+    for speed in args.speed:
+        moves = [[(rng.choice((-speed, 0, speed)), rng.choice((-speed, 0, speed))) for _ in boxes]
+                 for _ in range(args.ticks)]
+        cells = []
+        for _, fn in methods:
+            cost, stuck = run(game_map, boxes, moves, fn)
+            cells.append(f"{cost:9.1f} us {stuck:>5} /{len(boxes)}")
+        print(f"{speed:>7} | " + " | ".join(f"{c:>20}" for c in cells))
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
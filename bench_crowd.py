@@ -0,0 +1,56 @@
+import argparse
+import time
+
+import numpy as np
+from settings import *
+import crowd
+
+
+def naive_separation(xs, ys, radius=CROWD_RADIUS, push=CROWD_PUSH):
+    # Toutes les paires (N²), même formule que crowd.separation
+    dx = xs[:, None] - xs[None, :]
+    dy = ys[:, None] - ys[None, :]
+    dist = np.hypot(dx, dy)
+    near = dist < radius
+    np.fill_diagonal(near, False)
+    safe = np.where(near & (dist > 0), dist, 1.0)
+    weight = np.where(near, (1 - safe / radius) / safe, 0.0)
+    fx = (dx * weight).sum(axis=1) * push
+    fy = (dy * weight).sum(axis=1) * push
+    norm = np.hypot(fx, fy)
+    scale = np.where(norm > push, push / np.maximum(norm, 1e-9), 1.0)
+    return fx * scale, fy * scale
+
+
+def timed(fn, xs, ys, ticks):
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        fn(xs, ys)
+    return (time.perf_counter() - t0) / ticks * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Séparation de foule : grille triée contre toutes les paires")
+    parser.add_argument("-n", type=int, nargs="+", default=[100, 1000, 5000, 20000, 50000])
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--density", type=float, default=1.0,
+                        help="mobs par case de CROWD_RADIUS de côté (la zone grandit avec N)")
+    parser.add_argument("--naive-max", type=int, default=5000, help="au-delà, pas de mesure en N²")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    crowd.BRUTE_FORCE_MAX = 0  # On mesure la grille à toutes les tailles
+    print(f"{'mobs':>6} | {'paires':>8} | {'grille ms':>9} | {'us/mob':>6} | {'N² ms':>9}")
+    for n in args.n:
+        side = np.sqrt(n / args.density) * CROWD_RADIUS
+        xs = rng.random(n) * side
+        ys = rng.random(n) * side
+        pairs = len(crowd.close_pairs(xs, ys, CROWD_RADIUS)[0])
+        grid = timed(crowd.separation, xs, ys, args.ticks)
+        naive = f"{timed(naive_separation, xs, ys, max(1, args.ticks // 4)):9.2f}" if n <= args.naive_max else "        -"
+        print(f"{n:>6} | {pairs:>8} | {grid:9.2f} | {grid * 1000 / n:6.2f} | {naive}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import time
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from collision import CollisionGrid, RunLengthGrid
+from game_map import DebugOverlay
+
+
+def mo(size):
+    return f"{size / 2**20:8.2f}"
+
+
+def legacy_bytes(width, height):
+    # Comportement d'avant, à la taille du monde : image des collisions agrandie (RGBA, le temps
+    # du chargement), pygame.Mask, bits de CollisionGrid et overlay debug RGBA complet
+    scaled_col = width * height * 4
+    mask = -(-width // 64) * 8 * height
+    bits = -(-width // 8) * height
+    debug = width * height * 4
+    return mask + bits + debug, scaled_col
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mémoire des collisions + overlay debug : avant / résolution source")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 4],
+                        help="Carte de collisions source agrandie xN (simule une grande carte)")
+    parser.add_argument("--zoom", type=float, default=ZOOM_FACTOR)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    source = pygame.image.load(os.path.join(BASE_DIR, COLLISION_FILE))
+    view = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    print(f"Mo (ZOOM_FACTOR {args.zoom}), image de la carte non comptée (identique)")
+    print(f"{'source':>11} | {'monde':>11} | {'avant':>8} | {'pic chgt':>8} | {'bits':>8} | "
+          f"{'plages':>8} | {'debug':>8} | {'chgt ms':>7}")
+    for scale in args.scale:
+        w, h = source.get_width() * scale, source.get_height() * scale
+        col = pygame.transform.scale(source, (w, h)) if scale != 1 else source
+        world = (int(w * args.zoom), int(h * args.zoom))
+        before, peak = legacy_bytes(*world)
+
+        t0 = time.perf_counter()
+        mask = pygame.mask.from_threshold(col, (0, 0, 0), (2, 2, 2))
+        grid = CollisionGrid.from_mask(mask, world_size=world)
+        load = (time.perf_counter() - t0) * 1000
+        runs = RunLengthGrid.from_grid(grid)
+
+        # Overlay debug : seulement les tuiles d'un écran
+        overlay = DebugOverlay(grid, world)
+        overlay.blit(pygame.Surface(view.size, pygame.SRCALPHA), (0, 0), view.move(world[0] // 3, world[1] // 3))
+
+        print(f"{w:>5}x{h:<5} | {world[0]:>5}x{world[1]:<5} | {mo(before)} | {mo(before + peak)} | "
+              f"{mo(grid.nbytes())} | {mo(runs.nbytes())} | {mo(overlay.nbytes())} | {load:7.1f}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
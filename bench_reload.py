@@ -0,0 +1,48 @@
+import argparse
+import os
+import time
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from game import Game
+
+
+def drain(game):
+    while game.loader.jobs:
+        game.loader.wait_any()
+        game.loader.poll()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Réglage modifié : relance complète / rechargement à chaud")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    game = Game(headless=True)
+    drain(game)
+    relaunch = (time.perf_counter() - t0) * 1000
+    print(f"relance complète (Game())    : {relaunch:8.1f} ms")
+
+    # Deux valeurs par réglage : la 1re passe remplit les caches (planches, variantes)
+    changes = [("ZOOM_FACTOR", (2.0, ZOOM_FACTOR)), ("PLAYER_SCALE", (3.0, PLAYER_SCALE)),
+               ("DEBUG_MODE", (not DEBUG_MODE, DEBUG_MODE)), ("MOB_SPEED", (MOB_SPEED + 1, MOB_SPEED))]
+    for name, values in changes:
+        times = []
+        for _ in range(args.repeat):
+            for value in values:
+                t0 = time.perf_counter()
+                game.config.set(**{name: value})
+                times.append((time.perf_counter() - t0) * 1000)
+                drain(game)  # Travail en arrière-plan (navigation, teintes) hors mesure
+        first, rest = times[0], sorted(times[1:])[len(times[1:]) // 2]
+        print(f"{name:<28} : {rest:8.1f} ms  (1re fois {first:.1f} ms, x{relaunch / max(rest, 1e-3):.0f})")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
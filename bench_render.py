@@ -0,0 +1,85 @@
+import argparse
+import os
+import random
+import time
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from animation import get_table
+from render_queue import RenderQueue
+
+
+class FakeMob:
+    def __init__(self, rng, table, width, height):
+        clip = table.clips[rng.randrange(len(table.clips))]
+        self.image = clip.frames[rng.randrange(clip.length)]
+        self.rect = self.image.get_rect(topleft=(rng.randrange(width), rng.randrange(height)))
+        self.hitbox = self.rect.inflate(-100, -95)
+        self.max_health = 100
+        self.health = rng.choice((100, 100, rng.randrange(1, 100)))  # Un tiers de blessés
+
+
+def plain(frame):
+    # Copie sans RLE (frames d'avant SPRITE_RLE)
+    return pygame.image.frombytes(pygame.image.tobytes(frame, 'RGBA'), frame.get_size(), 'RGBA').convert_alpha()
+
+
+def draw_legacy(screen, mobs, cam_x, cam_y, images=None):
+    # Comportement d'avant : tri, puis une copie de rect, un blit et deux draw.rect par mob
+    mobs = sorted(mobs, key=lambda mob: mob.hitbox.bottom)
+    for mob in mobs:
+        r = mob.rect.copy()
+        r.x -= cam_x
+        r.y -= cam_y
+        screen.blit(images[mob.image] if images else mob.image, r)
+        if mob.health == mob.max_health: continue
+        x, y = mob.rect.x - cam_x, mob.rect.y - cam_y - 10
+        pygame.draw.rect(screen, (0, 0, 0), (x, y, mob.rect.width, 5))
+        pygame.draw.rect(screen, (255, 0, 0), (x, y, mob.rect.width * mob.health / mob.max_health, 5))
+
+
+def draw_queue(screen, mobs, cam_x, cam_y, queue):
+    queue.submit_sprites(mobs)
+    queue.submit_health(mobs)
+    queue.flush(screen, (cam_x, cam_y))
+
+
+def timed(fn, frames):
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t0) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rendu des entités : blit par mob / file de rendu + Surface.blits")
+    parser.add_argument("-n", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    table = get_table()
+    rng = random.Random(args.seed)
+    queue = RenderQueue()
+
+    images = {frame: plain(frame) for clip in table.clips for frame in clip.frames}
+
+    print(f"{'mobs':>6} | {'avant ms':>9} | {'blit RLE ms':>11} | {'file ms':>9} | {'us/mob avant':>12} | {'us/mob file':>11}")
+    for n in args.n:
+        mobs = [FakeMob(rng, table, SCREEN_WIDTH, SCREEN_HEIGHT) for _ in range(n)]
+        draw_queue(screen, mobs, 0, 0, queue)  # Barres de vie en cache hors mesure
+        legacy = timed(lambda: draw_legacy(screen, mobs, 0, 0, images), args.frames)
+        rle = timed(lambda: draw_legacy(screen, mobs, 0, 0), args.frames)
+        batched = timed(lambda: draw_queue(screen, mobs, 0, 0, queue), args.frames)
+        print(f"{n:>6} | {legacy:9.2f} | {rle:11.2f} | {batched:9.2f} | {legacy * 1000 / n:12.2f} | {batched * 1000 / n:11.2f}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
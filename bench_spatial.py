@@ -0,0 +1,92 @@
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from spatial_grid import SpatialGroup
+from enemy import Enemy
+
+MAP_W, MAP_H = 1344, 1728  # sale3.png avec ZOOM_FACTOR = 1.5
+
+
+def jitter(mobs, rng):
+    for mob in mobs:
+        mob.hitbox.x = min(max(mob.hitbox.x + rng.randint(-4, 4), 0), MAP_W - mob.hitbox.w)
+        mob.hitbox.y = min(max(mob.hitbox.y + rng.randint(-4, 4), 0), MAP_H - mob.hitbox.h)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+def queries(group, attack, view):
+    group.sprites_in_rect(attack)
+    group.sprites_in_rect(view)
+
+
+def bench(n, frames, rng):
+    mobs = [Enemy(rng.randint(100, MAP_W - 100), rng.randint(100, MAP_H - 100)) for _ in range(n)]
+    grid = SpatialGroup(MAP_W, MAP_H, GRID_CELL_SIZE, *mobs, min_sprites=0)
+    scan = SpatialGroup(MAP_W, MAP_H, GRID_CELL_SIZE, *mobs, min_sprites=float('inf'))
+    attack = pygame.Rect(MAP_W // 2, MAP_H // 2, 60, 65)
+    view = pygame.Rect(MAP_W // 4, MAP_H // 4, SCREEN_WIDTH, SCREEN_HEIGHT).inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+
+    totals = [0.0] * 3
+    for _ in range(frames):
+        jitter(mobs, rng)
+        totals[0] += timed(grid.relocate_all)
+        totals[1] += timed(queries, grid, attack, view)
+        totals[2] += timed(queries, scan, attack, view)
+    ms = [t / frames * 1000 for t in totals]
+    print(f"{n:>6} | {ms[0]:9.3f} | {ms[1]:9.3f} | {ms[2]:9.3f}")
+    # Requêtes seules, puis coût total (la grille paie aussi sa mise à jour)
+    return (ms[1], ms[2]), (ms[0] + ms[1], ms[2])
+
+
+def break_even(rows):
+    """Plus petit nombre de mobs à partir duquel la grille gagne (et le reste), par interpolation."""
+    if not rows or rows[-1][1] >= rows[-1][2]:
+        return None
+    i = len(rows) - 1
+    while i > 0 and rows[i - 1][1] < rows[i - 1][2]:
+        i -= 1
+    if i == 0:
+        return rows[0][0]
+    (n0, g0, s0), (n1, g1, s1) = rows[i - 1], rows[i]
+    # Écart balayage - grille linéaire entre n0 (>= 0 perdu) et n1 (gagné)
+    return round(n0 + (n1 - n0) * (g0 - s0) / ((g0 - s0) - (g1 - s1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût par frame de la grille spatiale")
+    parser.add_argument("-n", type=int, nargs="+", default=[10, 30, 100, 300, 1000, 3000, 5000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(args.seed)
+    print("ms/frame | maj grille | attaque+caméra (grille) | attaque+caméra (balayage C)")
+    names = ("attaque+caméra (requêtes seules)", "attaque+caméra + maj grille")
+    series = [[] for _ in names]
+    for n in sorted(args.n):
+        for rows, (grid, scan) in zip(series, bench(n, args.frames, rng)):
+            rows.append((n, grid, scan))
+    print("seuil de rentabilité (à reporter dans GRID_MIN_SPRITES) :")
+    for name, rows in zip(names, series):
+        n = break_even(rows)
+        print(f"  {name:<33}: " + (f"grille plus rapide à partir d'environ {n} mobs" if n is not None
+                                     else "la grille ne gagne pas sur les tailles mesurées"))
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
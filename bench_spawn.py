@@ -0,0 +1,69 @@
+import argparse
+import os
+import time
+import tracemalloc
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import sprite_cache
+import animation
+from enemy import Enemy
+
+
+def frames_bytes(enemies):
+    """Mémoire des frames réellement référencées (une surface comptée une fois)."""
+    seen = {}
+    for mob in enemies:
+        for clip in mob.anim.table.clips:
+            for frame in clip.frames:
+                seen[id(frame)] = frame.get_width() * frame.get_height() * frame.get_bytesize()
+    return sum(seen.values())
+
+
+def spawn(n, use_cache):
+    if not use_cache:
+        # Comportement d'avant : chaque ennemi relit et redécoupe ses planches
+        mobs = []
+        for i in range(n):
+            sprite_cache.clear_cache()
+            animation.clear_tables()
+            mobs.append(Enemy(400 + i, 328))
+        return mobs
+    return [Enemy(400 + i, 328) for i in range(n)]
+
+
+def run(n, use_cache):
+    sprite_cache.clear_cache()
+    animation.clear_tables()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    mobs = spawn(n, use_cache)
+    elapsed = (time.perf_counter() - t0) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    label = "cache" if use_cache else "sans cache"
+    print(f"{label:>10} | {n:>5} ennemis | {elapsed:9.2f} ms | "
+          f"frames {frames_bytes(mobs) / 2**20:8.2f} MB | python {peak / 2**20:6.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark d'apparition des ennemis")
+    parser.add_argument("-n", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--no-baseline", action="store_true",
+                        help="ne mesure pas le chargement sans cache")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    for n in args.n:
+        if not args.no_baseline:
+            run(n, use_cache=False)
+        run(n, use_cache=True)
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
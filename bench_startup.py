@@ -0,0 +1,77 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+import sprite_cache
+import asset_pack
+from game_map import GameMap, prepare_map
+from asset_loader import AssetLoader
+
+
+def load_png():
+    sprite_cache.clear_cache()
+    t0 = time.perf_counter()
+    GameMap()
+    for name, rows, cols in asset_pack.SHEETS:
+        sprite_cache.get_animations(os.path.join(SPRITE_DIR, name), rows, cols)
+    return time.perf_counter() - t0
+
+
+def load_threaded():
+    # Décodage sur les threads d'AssetLoader (en série sur un seul coeur), convert() seuls
+    # sur le thread principal
+    sprite_cache.clear_cache()
+    t0 = time.perf_counter()
+    loader = AssetLoader()
+    loader.submit(prepare_map, finish=lambda data: GameMap(prepared=data))
+    for name, rows, cols in asset_pack.SHEETS:
+        path = os.path.join(SPRITE_DIR, name)
+        install = lambda anims, key=(path, rows, cols): \
+            sprite_cache.install(*key, PLAYER_SCALE, sprite_cache.finish_animations(anims))
+        loader.submit(sprite_cache.prepare_animations, path, rows, cols, finish=install)
+    while not loader.poll():
+        loader.wait_any()
+    loader.shutdown()
+    return time.perf_counter() - t0
+
+
+def load_packed():
+    sprite_cache.clear_cache()
+    t0 = time.perf_counter()
+    pack = asset_pack.load_pack()
+    GameMap(pack)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temps de chargement : PNG contre pack d'assets")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--rebuild", action="store_true", help="reconstruit le pack avant la mesure")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if args.rebuild or asset_pack.load_pack() is None:
+        t0 = time.perf_counter()
+        asset_pack.build_pack()
+        print(f"Pack construit en {(time.perf_counter() - t0) * 1000:.0f} ms "
+              f"({os.path.getsize(asset_pack.PACK_FILE) / 2**20:.1f} MB)")
+
+    png = min(load_png() for _ in range(args.runs)) * 1000
+    threaded = min(load_threaded() for _ in range(args.runs)) * 1000
+    packed = min(load_packed() for _ in range(args.runs)) * 1000
+    print(f"PNG           : {png:8.1f} ms")
+    workers = AssetLoader().workers
+    print(f"PNG (chargeur): {threaded:8.1f} ms  (x{png / threaded:.1f}, {os.cpu_count()} coeurs, "
+          + (f"{workers} threads)" if workers > 1 else "en série)"))
+    print(f"pack          : {packed:8.1f} ms  (x{png / packed:.1f})")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from game_map import GameMap
+from player import Player
+from enemy import Enemy
+from enemy_swarm import EnemySwarm
+from animation import advance_all
+from spatial_grid import SpatialGroup
+
+
+def free_spots(game_map, n, rng):
+    spots = []
+    while len(spots) < n:
+        x = rng.randint(100, game_map.width - 100)
+        y = rng.randint(200, game_map.height - 100)
+        if not game_map.check_wall(x, y - 80):
+            spots.append((x, y))
+    return spots
+
+
+def bench_objects(game_map, player, spots, frames):
+    group = SpatialGroup(game_map.width, game_map.height)
+    for x, y in spots:
+        group.add(Enemy(x, y))
+    t0 = time.perf_counter()
+    for frame in range(frames):
+        group.update(player, game_map, frame * TICK_MS)
+        advance_all(group)
+    return (time.perf_counter() - t0) / frames * 1000
+
+
+def bench_swarm(game_map, player, spots, frames):
+    group = SpatialGroup(game_map.width, game_map.height)
+    swarm = EnemySwarm(game_map, group)
+    for x, y in spots:
+        swarm.spawn(x, y)
+    t0 = time.perf_counter()
+    for frame in range(frames):
+        swarm.step(player, frame * TICK_MS)
+    return (time.perf_counter() - t0) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enemy.update par objet contre EnemySwarm.step")
+    parser.add_argument("-n", type=int, nargs="+", default=[100, 500, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    game_map = GameMap()
+    rng = random.Random(args.seed)
+    budget = 1000 / FPS
+    print(f"ms/frame (budget à {FPS} FPS : {budget:.1f} ms)")
+    for n in args.n:
+        spots = free_spots(game_map, n, rng)
+        # Joueur invincible : on mesure la poursuite, pas la fin de partie
+        player = Player(game_map.width // 2, game_map.height - 330)
+        player.take_damage = lambda amount: None
+        t_obj = bench_objects(game_map, player, spots, args.frames)
+        t_swarm = bench_swarm(game_map, player, spots, args.frames)
+        print(f"{n:>6} ennemis | objets {t_obj:8.3f} | swarm {t_swarm:8.3f} | x{t_obj / t_swarm:5.1f}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
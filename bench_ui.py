@@ -0,0 +1,93 @@
+import argparse
+import os
+import time
+
+# Pas de fenêtre pour les benchmarks
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+import text_cache
+from ui import UI
+
+
+class FakePlayer:
+    health = 80
+    max_health = 100
+    current_xp = 35
+    max_xp = 100
+    level = 2
+
+
+def hud_legacy(ui, player):
+    # Comportement d'avant : barres + deux font.render à chaque frame
+    screen = ui.display_surface
+    ui.show_bar(screen, player.health, player.max_health, ui.health_bar_rect, HEALTH_COLOR)
+    txt_hp = ui.font.render(f"{int(player.health)}/{player.max_health}", True, UI_BORDER_COLOR)
+    screen.blit(txt_hp, (ui.health_bar_rect.right + 10, 10))
+    ui.show_bar(screen, player.current_xp, player.max_xp, ui.xp_bar_rect, XP_COLOR)
+    txt_lvl = ui.font.render(f"Lvl {player.level}", True, LEVEL_TEXT_COLOR)
+    screen.blit(txt_lvl, (ui.xp_bar_rect.right + 10, 32))
+
+
+def gameover_legacy(screen, font, font_big):
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    overlay.fill((50, 0, 0))
+    overlay.set_alpha(180)
+    screen.blit(overlay, (0, 0))
+    screen.blit(font_big.render("GAME OVER", True, (255, 0, 0)), (300, 400))
+    screen.blit(font.render("Appuie sur 'R' pour Recommencer", True, (255, 255, 255)), (100, 500))
+
+
+def gameover_cached(screen, overlay, font, font_big):
+    screen.blit(overlay, (0, 0))
+    screen.blit(text_cache.render_text(font_big, "GAME OVER", (255, 0, 0)), (300, 400))
+    screen.blit(text_cache.render_text(font, "Appuie sur 'R' pour Recommencer", (255, 255, 255)), (100, 500))
+
+
+def timed(fn, frames):
+    t0 = time.perf_counter()
+    for i in range(frames):
+        fn(i)
+    return (time.perf_counter() - t0) * 1e6 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût de l'UI par frame, avant / après le cache de textes")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--change-every", type=int, default=30,
+                        help="la vie change toutes les N frames (0 : jamais)")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    ui = UI()
+    player = FakePlayer()
+    font = pygame.font.SysFont("Arial", FONT_SIZE, bold=True)
+    font_big = pygame.font.SysFont("Arial", 80, bold=True)
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    overlay.fill((50, 0, 0))
+    overlay.set_alpha(180)
+
+    def hit(i):
+        if args.change_every and i % args.change_every == 0:
+            player.health = 100 - (i // args.change_every) % 100
+
+    rows = [
+        ("HUD", lambda i: (hit(i), hud_legacy(ui, player)), lambda i: (hit(i), ui.display(player))),
+        ("game over", lambda i: gameover_legacy(screen, font, font_big),
+         lambda i: gameover_cached(screen, overlay, font, font_big)),
+    ]
+    for label, before, after in rows:
+        text_cache.clear_cache()
+        t_before = timed(before, args.frames)
+        t_after = timed(after, args.frames)
+        print(f"{label:>10} | avant {t_before:8.1f} us/frame | après {t_after:8.1f} us/frame "
+              f"| x{t_before / t_after:.1f}")
+    print(f"Cache de textes : {text_cache.cache_stats()}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
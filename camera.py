@@ -0,0 +1,118 @@
+import pygame
+from settings import *
+
+
+class Camera:
+    """Caméra du monde : suivi avec zone morte et lissage, balayage du menu, zoom.
+
+    La position (x, y) est flottante (défilement sous-pixel) ; le dessin utilise
+    offset, la position arrondie au pixel. Avec un zoom différent de 1, le monde
+    est dessiné sur la surface view (taille écran / zoom) puis agrandie à l'écran.
+    """
+
+    def __init__(self, map_width, map_height, screen_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.screen_size = screen_size
+        self.map_size = (map_width, map_height)
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+        self.view_size = screen_size  # Zone monde visible : écran / zoom
+        self.view = None  # Surface intermédiaire quand le monde est zoomé
+        self.pan_speed = list(CAMERA_PAN_SPEED)
+        self.set_zoom(CAMERA_ZOOM)
+
+    def set_map(self, map_width, map_height):
+        self.map_size = (map_width, map_height)
+        self.x, self.y = self._clamp(self.x, self.y)
+
+    # --- ZOOM ---
+    def set_zoom(self, zoom):
+        zoom = max(CAMERA_ZOOM_MIN, min(zoom, CAMERA_ZOOM_MAX))
+        # Le centre de la vue reste au même endroit du monde
+        cx, cy = self.x + self.view_size[0] / 2, self.y + self.view_size[1] / 2
+        self.zoom = zoom
+        self.view_size = (round(self.screen_size[0] / zoom), round(self.screen_size[1] / zoom))
+        self.view = None if zoom == 1 else pygame.Surface(self.view_size).convert()
+        self.x, self.y = self._clamp(cx - self.view_size[0] / 2, cy - self.view_size[1] / 2)
+
+    def zoom_by(self, factor):
+        self.set_zoom(self.zoom * factor)
+
+    # --- DÉPLACEMENT ---
+    def _clamp(self, x, y):
+        """Vue gardée dans la carte ; centrée sur un axe où la carte est plus petite que la vue."""
+        (vw, vh), (mw, mh) = self.view_size, self.map_size
+        x = -(vw - mw) / 2 if mw < vw else max(0, min(x, mw - vw))
+        y = -(vh - mh) / 2 if mh < vh else max(0, min(y, mh - vh))
+        return x, y
+
+    def follow(self, target, dt=None, snap=False):
+        """Suit target (centre, coordonnées monde).
+
+        Tant que la cible reste dans la zone morte (CAMERA_DEAD_ZONE, centrée sur la vue),
+        la caméra ne bouge pas ; sinon elle rejoint la position qui ramène la cible au bord
+        de la zone, en parcourant CAMERA_LERP de l'écart par tick (indépendant du FPS).
+        """
+        if dt is None: dt = TICK_MS
+        vw, vh = self.view_size
+        dzw, dzh = CAMERA_DEAD_ZONE[0] / self.zoom, CAMERA_DEAD_ZONE[1] / self.zoom
+        goal_x, goal_y = self.x, self.y
+        left, top = self.x + (vw - dzw) / 2, self.y + (vh - dzh) / 2
+        if target[0] < left: goal_x += target[0] - left
+        elif target[0] > left + dzw: goal_x += target[0] - left - dzw
+        if target[1] < top: goal_y += target[1] - top
+        elif target[1] > top + dzh: goal_y += target[1] - top - dzh
+        if snap:
+            goal_x, goal_y = target[0] - vw / 2, target[1] - vh / 2
+        goal_x, goal_y = self._clamp(goal_x, goal_y)
+        if snap or CAMERA_LERP >= 1:
+            self.x, self.y = goal_x, goal_y
+            return
+        t = 1 - (1 - CAMERA_LERP) ** (dt / TICK_MS)
+        self.x += (goal_x - self.x) * t
+        self.y += (goal_y - self.y) * t
+        # Arrivée : on se pose exactement, la caméra immobile garde le rendu par zones sales
+        if abs(goal_x - self.x) < 0.5: self.x = goal_x
+        if abs(goal_y - self.y) < 0.5: self.y = goal_y
+
+    def pan(self, dt):
+        """Balayage du menu : la vue traverse la carte et rebondit sur ses bords."""
+        (vw, vh), (mw, mh) = self.view_size, self.map_size
+        for axis, (size, limit) in enumerate(((vw, mw), (vh, mh))):
+            pos = (self.x, self.y)[axis] + self.pan_speed[axis] * dt / 1000
+            if pos <= 0 or pos >= limit - size:
+                self.pan_speed[axis] = abs(self.pan_speed[axis]) if pos <= 0 else -abs(self.pan_speed[axis])
+            if axis == 0: self.x = pos
+            else: self.y = pos
+        self.x, self.y = self._clamp(self.x, self.y)
+
+    # --- MONDE -> ÉCRAN ---
+    @property
+    def offset(self):
+        """Position arrondie au pixel, à soustraire aux coordonnées monde."""
+        return round(self.x), round(self.y)
+
+    @property
+    def visible(self):
+        """Rect monde visible (pour le culling)."""
+        ox, oy = self.offset
+        return pygame.Rect(ox, oy, *self.view_size)
+
+    def target(self, screen):
+        """Surface où dessiner le monde cette frame."""
+        return screen if self.view is None else self.view
+
+    def to_screen(self, x, y):
+        ox, oy = self.offset
+        return x - ox, y - oy
+
+    def draw_rects(self, surface, color, rects, width=0):
+        """pygame.draw.rect pour des rects monde."""
+        ox, oy = self.offset
+        for r in rects:
+            pygame.draw.rect(surface, color, (r.x - ox, r.y - oy, r.w, r.h), width)
+
+    def present(self, screen):
+        """Agrandit la vue zoomée à l'écran (rien à faire sans zoom)."""
+        if self.view is not None:
+            pygame.transform.scale(self.view, self.screen_size, screen)
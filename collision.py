@@ -0,0 +1,421 @@
+import bisect
+import copy
+import numpy as np
+import pygame
+
+class CollisionGrid:
+    """Murs de la carte stockés en bits (1 bit par pixel) pour des requêtes groupées.
+
+    Les coordonnées sont en pixels monde. Tout point hors de la carte est un mur.
+    """
+
+    def __init__(self, walls, build_sdf=False, sdf_max=32, world_size=None):
+        walls = np.asarray(walls, dtype=bool)
+        height, width = walls.shape
+        # Lignes compressées : l'octet x >> 3 contient le pixel x au bit 7 - (x & 7)
+        self._set_bits(np.packbits(walls, axis=1), width, height, world_size)
+        self.sdf = signed_distance(walls, sdf_max) if build_sdf else None
+
+    def _set_bits(self, bits, width, height, world_size):
+        self.bits = bits
+        self.width, self.height = width, height
+        self.stride = bits.shape[1]
+        self._raw = bits.tobytes()  # Accès scalaire sans passer par numpy
+        self._set_world(world_size)
+        self._mask = None    # pygame.Mask des murs (résolution de la grille), pour move_box
+        self._blocks = {}    # Masques pleins (w, h) balayés contre les murs
+
+    def _set_world(self, world_size):
+        # Grille plus petite que le monde (résolution source) : x_grille = x * width // world_w,
+        # exactement la correspondance de pygame.transform.scale (plus proche voisin)
+        self.world_w, self.world_h = world_size if world_size is not None else (self.width, self.height)
+        self.scaled = (self.world_w, self.world_h) != (self.width, self.height)
+
+    @classmethod
+    def from_packed(cls, bits, width, height, world_size=None):
+        grid = cls.__new__(cls)
+        grid._set_bits(bits, width, height, world_size)
+        grid.sdf = None
+        return grid
+
+    def rescaled(self, world_size):
+        """Mêmes murs lus à une autre taille de monde (changement de ZOOM_FACTOR)."""
+        grid = copy.copy(self)  # Données partagées : seule la correspondance monde -> grille change
+        grid._set_world(world_size)
+        return grid
+
+    def packed_bits(self):
+        """Murs en bits (lignes compressées, comme self.bits) : format du pack d'assets."""
+        return self.bits
+
+    @classmethod
+    def from_mask(cls, mask, **kwargs):
+        grid = cls(mask_to_array(mask), **kwargs)
+        if mask.get_size() == (grid.width, grid.height):
+            grid._mask = mask
+        return grid
+
+    # --- REQUÊTES PONCTUELLES ---
+    def is_wall(self, x, y):
+        if x < 0 or x >= self.world_w or y < 0 or y >= self.world_h:
+            return True
+        x = int(x); y = int(y)
+        if self.scaled:
+            x = x * self.width // self.world_w
+            y = y * self.height // self.world_h
+        return self._raw[y * self.stride + (x >> 3)] & (0x80 >> (x & 7)) != 0
+
+    # --- REQUÊTES GROUPÉES ---
+    def walls_at(self, xs, ys):
+        """Tableau de booléens : chaque point (xs[i], ys[i]) est-il dans un mur ?"""
+        xs = floor_int(xs)
+        ys = floor_int(ys)
+        inside = (xs >= 0) & (xs < self.world_w) & (ys >= 0) & (ys < self.world_h)
+        cx = np.where(inside, xs, 0)
+        cy = np.where(inside, ys, 0)
+        if self.scaled:
+            cx = cx * self.width // self.world_w
+            cy = cy * self.height // self.world_h
+        hit = (self.bits[cy, cx >> 3] >> (7 - (cx & 7)).astype(np.uint8)) & 1
+        return ~inside | hit.astype(bool)
+
+    def _grid_axes(self, rect):
+        # Colonnes / lignes de la grille sous chaque pixel de rect (zone monde dans la carte)
+        gx = np.arange(rect.left, rect.right)
+        gy = np.arange(rect.top, rect.bottom)
+        if self.scaled:
+            gx = gx * self.width // self.world_w
+            gy = gy * self.height // self.world_h
+        return gx, gy
+
+    def walls_in(self, rect):
+        """Murs d'une zone monde (contenue dans la carte) : booléens (lignes, colonnes)."""
+        gx, gy = self._grid_axes(rect)
+        hit = (self.bits[gy[:, None], gx >> 3] >> (7 - (gx & 7)).astype(np.uint8)) & 1
+        return hit.astype(bool)
+
+    def any_wall(self, xs, ys):
+        return bool(self.walls_at(xs, ys).any())
+
+    def any_wall_in(self, rect):
+        """Vrai si un pixel de mur touche rect (zone monde) ; hors de la carte, c'est un mur."""
+        if rect.left < 0 or rect.top < 0 or rect.right > self.world_w or rect.bottom > self.world_h:
+            return True
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        ga, gb = rect.left * self.width // self.world_w, (rect.right - 1) * self.width // self.world_w
+        glo, ghi = rect.top * self.height // self.world_h, (rect.bottom - 1) * self.height // self.world_h
+        return self._first_wall(ga, gb, glo, ghi, True, True) is not None
+
+    def max_shift(self, xs, ys, dx, dy):
+        """Déplacement autorisé de N entités sondées par K points chacune.
+
+        xs, ys : positions des points de sonde, forme (N, K).
+        dx, dy : déplacement voulu par entité, forme (N,) ; un seul des deux
+        axes doit être non nul pour une entité donnée (on résout axe par axe).
+        Renvoie la fraction (N,) du déplacement réalisable, dans [0, 1] : on
+        avance pixel par pixel et on s'arrête juste avant le premier mur.
+        """
+        xs = np.atleast_2d(np.asarray(xs, dtype=float))
+        ys = np.atleast_2d(np.asarray(ys, dtype=float))
+        dx = np.asarray(dx, dtype=float).reshape(-1)
+        dy = np.asarray(dy, dtype=float).reshape(-1)
+        length = np.maximum(np.abs(dx), np.abs(dy))
+        steps = int(np.ceil(length.max())) if length.size else 0
+        if steps == 0:
+            return np.ones(len(length))
+
+        # t[s] = fraction parcourue au pas s (le dernier pas tombe pile sur la cible)
+        safe_len = np.where(length > 0, length, 1)
+        t = np.minimum(np.arange(1, steps + 1)[None, :] / safe_len[:, None], 1.0)  # (N, S)
+        px = xs[:, None, :] + (dx[:, None] * t)[:, :, None]  # (N, S, K)
+        py = ys[:, None, :] + (dy[:, None] * t)[:, :, None]
+        blocked = self.walls_at(px, py).any(axis=2)  # (N, S)
+
+        first = np.where(blocked.any(axis=1), blocked.argmax(axis=1), steps)
+        allowed = np.where(first > 0, t[np.arange(len(t)), np.maximum(first - 1, 0)], 0.0)
+        return np.where(first == steps, 1.0, allowed)
+
+    def box_walls(self, w, h):
+        """Murs vus par une boîte w x h : le pixel (x, y) est un mur si la boîte de coin
+        haut-gauche (x, y) touche un mur ou sort de la carte (grille à la taille du monde).
+
+        Sonder le seul coin sur cette grille (max_shift) balaie toute la boîte, au pixel près.
+        """
+        walls = self.walls_in(pygame.Rect(0, 0, self.world_w, self.world_h))
+        # Somme des murs sur chaque boîte par image intégrale
+        sums = np.zeros((self.world_h + 1, self.world_w + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(walls, axis=0, dtype=np.int32), axis=1, out=sums[1:, 1:])
+        del walls
+        blocked = np.ones((self.world_h, self.world_w), dtype=bool)
+        if w <= self.world_w and h <= self.world_h:
+            inside = sums[h:, w:] - sums[:-h, w:] - sums[h:, :-w] + sums[:-h, :-w]
+            blocked[:self.world_h - h + 1, :self.world_w - w + 1] = inside > 0
+        return CollisionGrid(blocked)
+
+    # --- DÉPLACEMENT BALAYÉ D'UNE BOÎTE ---
+    def wall_mask(self):
+        """Murs sous forme de pygame.Mask, construit au premier besoin."""
+        if self._mask is None:
+            walls = np.unpackbits(self.packed_bits(), axis=1)[:, :self.width].T * np.uint8(255)
+            surf = pygame.surfarray.make_surface(np.dstack((walls, walls, walls)))
+            self._mask = pygame.mask.from_threshold(surf, (255, 255, 255), (1, 1, 1))
+        return self._mask
+
+    def _block(self, w, h):
+        block = self._blocks.get((w, h))
+        if block is None:
+            block = self._blocks[(w, h)] = pygame.Mask((w, h), fill=True)
+        return block
+
+    def _sweep(self, pos, lo, size, span, d, horizontal):
+        """Déplacement autorisé (entier, même signe que d) d'une boîte le long d'un axe.
+
+        pos / size : position et taille de la boîte sur l'axe du mouvement,
+        lo / span : idem sur l'autre axe. La bande balayée est testée en une fois
+        contre le masque des murs ; sur contact, on la rétrécit jusqu'au premier mur.
+        """
+        world, other = (self.world_w, self.world_h) if horizontal else (self.world_h, self.world_w)
+        grid, grid_other = (self.width, self.height) if horizontal else (self.height, self.width)
+        # Bande balayée [a, b] (pixels monde, bornée à la carte : au-delà, c'est un mur)
+        if d > 0:
+            a, b = pos + size, min(pos + size + d, world) - 1
+        else:
+            a, b = max(pos + d, 0), pos - 1
+        lo, hi = max(lo, 0), min(lo + span, other) - 1
+        if a > b or lo > hi:
+            return 0
+
+        # Passage en coordonnées de la grille (même arrondi que is_wall)
+        ga, gb = a * grid // world, b * grid // world
+        glo, ghi = lo * grid_other // other, hi * grid_other // other
+        first = self._first_wall(ga, gb, glo, ghi, horizontal, d > 0)
+
+        if first is None:
+            return b + 1 - pos - size if d > 0 else a - pos
+        if d > 0:
+            wall = -(-first * world // grid)               # 1er pixel monde de la cellule
+            return max(wall - pos - size, 0)
+        wall = -(-(first + 1) * world // grid) - 1         # Dernier pixel monde de la cellule
+        return min(wall + 1 - pos, 0)
+
+    def _first_wall(self, ga, gb, glo, ghi, horizontal, forward):
+        """Mur le plus proche du départ dans la bande [ga, gb] x [glo, ghi] (grille).
+
+        Renvoie sa coordonnée sur l'axe du mouvement (la plus petite si forward, sinon
+        la plus grande), ou None si la bande est libre.
+        """
+        mask = self.wall_mask()
+        first = None
+        while ga <= gb:
+            w, h = gb - ga + 1, ghi - glo + 1
+            if horizontal:
+                hit = mask.overlap(self._block(w, h), (ga, glo))
+            else:
+                hit = mask.overlap(self._block(h, w), (glo, ga))
+            if hit is None:
+                break
+            first = hit[0] if horizontal else hit[1]
+            if forward: gb = first - 1
+            else: ga = first + 1
+        return first
+
+    def move_box(self, rect, dx, dy):
+        """Déplace rect (sur place) de (dx, dy) sans qu'aucun de ses pixels n'entre dans un mur.
+
+        Toute la boîte est balayée (x puis y, ce qui permet de glisser le long des murs) :
+        pas d'effet tunnel, quelle que soit la vitesse. Renvoie le déplacement réel.
+        """
+        x, y = rect.x, rect.y
+        rect.x += dx  # Arrondi de pygame.Rect, comme un déplacement direct
+        moved_x = self._sweep(x, y, rect.width, rect.height, rect.x - x, True) if rect.x != x else 0
+        rect.x = x + moved_x
+        rect.y += dy
+        moved_y = self._sweep(y, rect.x, rect.height, rect.width, rect.y - y, False) if rect.y != y else 0
+        rect.y = y + moved_y
+        return moved_x, moved_y
+
+    def clearance_at(self, xs, ys):
+        """Distance (pixels, plafonnée) au mur le plus proche ; négative dans un mur."""
+        if self.sdf is None:
+            raise ValueError("CollisionGrid construit sans champ de distance (build_sdf=False)")
+        xs = np.clip(np.asarray(xs).astype(np.intp), 0, self.world_w - 1)
+        ys = np.clip(np.asarray(ys).astype(np.intp), 0, self.world_h - 1)
+        if self.scaled:
+            return self.sdf[ys * self.height // self.world_h, xs * self.width // self.world_w] \
+                * (self.world_w / self.width)
+        return self.sdf[ys, xs]
+
+    def nbytes(self):
+        """Mémoire occupée (octets) : murs, champ de distance et masque de move_box s'il existe."""
+        size = self.bits.nbytes + (self.sdf.nbytes if self.sdf is not None else 0)
+        if self._mask is not None:
+            size += -(-self.width // 64) * 8 * self.height  # pygame.Mask : mots de 64 bits par ligne
+        return size
+
+
+class RunLengthGrid(CollisionGrid):
+    """CollisionGrid dont les murs sont stockés en plages par ligne (résolution source).
+
+    Chaque plage [début, fin[ de pixels murs est rangée sous la clé y * (width + 1) + x,
+    dans deux tableaux triés : un point est dans un mur si la dernière plage qui commence
+    avant lui n'est pas finie (searchsorted). Les murs d'une carte sont des blocs : bien
+    moins de mémoire que 1 bit par pixel sur les grandes cartes, requêtes un peu plus lentes.
+    Mêmes réponses que la grille de bits dont elle vient, au pixel près.
+    """
+
+    ROWS_PER_CHUNK = 256  # Lignes décompressées à la fois pendant la construction
+
+    def __init__(self, walls, world_size=None):
+        walls = np.asarray(walls, dtype=bool)
+        height, width = walls.shape
+        self._set_runs(np.packbits(walls, axis=1), width, height, world_size)
+
+    @classmethod
+    def from_grid(cls, grid):
+        runs = cls.__new__(cls)
+        runs._set_runs(grid.packed_bits(), grid.width, grid.height, (grid.world_w, grid.world_h))
+        runs.sdf = grid.sdf
+        return runs
+
+    def _set_runs(self, bits, width, height, world_size):
+        self.width, self.height = width, height
+        self.key = width + 1
+        dtype = np.int32 if height * self.key < 2**31 - 1 else np.int64
+        starts, ends = [np.array([-1], dtype)], [np.array([-1], dtype)]  # Sentinelle avant la 1re plage
+        for y0 in range(0, height, self.ROWS_PER_CHUNK):
+            walls = np.unpackbits(bits[y0:y0 + self.ROWS_PER_CHUNK], axis=1)[:, :width].astype(np.int8)
+            edges = np.diff(walls, axis=1, prepend=0, append=0)  # +1 : début de plage, -1 : fin
+            ys, xs = np.nonzero(edges == 1)
+            starts.append(((ys + y0) * self.key + xs).astype(dtype))
+            ys, xs = np.nonzero(edges == -1)
+            ends.append(((ys + y0) * self.key + xs).astype(dtype))
+        last = np.array([np.iinfo(dtype).max], dtype)  # Sentinelle après la dernière
+        self.starts = np.concatenate(starts + [last])
+        self.ends = np.concatenate(ends + [last])
+        self._starts_view, self._ends_view = memoryview(self.starts), memoryview(self.ends)  # is_wall sans numpy
+        self.sdf = None
+        self._set_world(world_size)
+        self._mask = None
+        self._blocks = {}
+
+    @property
+    def runs(self):
+        return len(self.starts) - 2
+
+    def packed_bits(self):
+        bits = np.zeros((self.height, -(-self.width // 8)), dtype=np.uint8)
+        for y0 in range(0, self.height, self.ROWS_PER_CHUNK):
+            y1 = min(y0 + self.ROWS_PER_CHUNK, self.height)
+            bits[y0:y1] = np.packbits(self._rows(y0, y1), axis=1)
+        return bits
+
+    def _rows(self, y0, y1):
+        # Lignes [y0, y1[ décompressées en booléens
+        edges = np.zeros((y1 - y0) * self.key + 1, dtype=np.int8)
+        lo, hi = self.starts.searchsorted([y0 * self.key, y1 * self.key])
+        edges[self.starts[lo:hi] - y0 * self.key] = 1  # Plages disjointes : indices tous distincts
+        edges[self.ends[lo:hi] - y0 * self.key] -= 1
+        return np.cumsum(edges[:-1]).reshape(y1 - y0, self.key)[:, :self.width] > 0
+
+    def _hits(self, keys):
+        keys = keys.astype(self.starts.dtype)  # Même type que les plages : pas de copie dans searchsorted
+        i = self.starts.searchsorted(keys, 'right') - 1
+        return keys < self.ends[i]
+
+    # --- REQUÊTES ---
+    def is_wall(self, x, y):
+        if x < 0 or x >= self.world_w or y < 0 or y >= self.world_h:
+            return True
+        x = int(x); y = int(y)
+        if self.scaled:
+            x = x * self.width // self.world_w
+            y = y * self.height // self.world_h
+        key = y * self.key + x
+        return key < self._ends_view[bisect.bisect_right(self._starts_view, key) - 1]
+
+    def walls_at(self, xs, ys):
+        xs = floor_int(xs)
+        ys = floor_int(ys)
+        inside = (xs >= 0) & (xs < self.world_w) & (ys >= 0) & (ys < self.world_h)
+        cx = np.where(inside, xs, 0)
+        cy = np.where(inside, ys, 0)
+        if self.scaled:
+            cx = cx * self.width // self.world_w
+            cy = cy * self.height // self.world_h
+        return ~inside | self._hits(cy * self.key + cx)
+
+    def walls_in(self, rect):
+        gx, gy = self._grid_axes(rect)
+        return self._hits(gy[:, None] * self.key + gx)
+
+    def _first_wall(self, ga, gb, glo, ghi, horizontal, forward):
+        # Bande bornée à la grille : hors de la carte, une clé déborderait sur la ligne voisine
+        ga, gb = max(ga, 0), min(gb, (self.width if horizontal else self.height) - 1)
+        if ga > gb: return None
+        if horizontal:
+            # Une requête par ligne de la bande : plage qui touche [ga, gb] la plus proche du départ
+            rows = np.arange(glo, ghi + 1, dtype=self.starts.dtype) * self.key
+            if forward:
+                x = np.maximum(self.starts[self.ends.searchsorted(rows + ga, 'right')] - rows, ga)
+                x = x[x <= gb]
+                return int(x.min()) if len(x) else None
+            x = np.minimum(self.ends[self.starts.searchsorted(rows + gb, 'right') - 1] - rows - 1, gb)
+            x = x[x >= ga]
+            return int(x.max()) if len(x) else None
+        # Vertical : lignes [ga, gb] qui ont un mur entre les colonnes glo et ghi
+        rows = np.arange(ga, gb + 1, dtype=self.starts.dtype) * self.key
+        hit = self.starts[self.ends.searchsorted(rows + glo, 'right')] - rows <= ghi
+        if not hit.any(): return None
+        return ga + int(hit.argmax() if forward else len(hit) - 1 - hit[::-1].argmax())
+
+    def nbytes(self):
+        size = self.starts.nbytes + self.ends.nbytes + (self.sdf.nbytes if self.sdf is not None else 0)
+        if self._mask is not None:
+            size += -(-self.width // 64) * 8 * self.height
+        return size
+
+
+def floor_int(values):
+    """Coordonnées -> pixels entiers, arrondies vers le bas comme int() pour x >= 0.
+
+    astype seul tronque vers zéro : x dans ]-1, 0[ tomberait sur la colonne 0 au lieu
+    d'être hors de la carte (mur), contrairement à is_wall.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        values = np.floor(values)
+    return values.astype(np.intp)
+
+
+def mask_to_array(mask):
+    """pygame.Mask -> tableau numpy de booléens (lignes, colonnes)."""
+    surf = mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 255))
+    return pygame.surfarray.array_red(surf).T > 0
+
+
+def _distance_to(mask, max_dist):
+    # Distance de Tchebychev jusqu'au plus proche pixel de mask, par dilatations successives
+    dist = np.full(mask.shape, max_dist, dtype=np.int8)
+    front = mask.copy()
+    dist[front] = 0
+    for d in range(1, max_dist):
+        grown = front.copy()
+        grown[1:, :] |= front[:-1, :]
+        grown[:-1, :] |= front[1:, :]
+        grown[:, 1:] |= grown[:, :-1].copy()
+        grown[:, :-1] |= grown[:, 1:].copy()
+        new = grown & ~front
+        if not new.any():
+            break
+        dist[new] = d
+        front = grown
+    return dist
+
+
+def signed_distance(walls, max_dist=32):
+    """Champ de distance signé plafonné à max_dist (int8) : > 0 hors des murs, <= 0 dedans."""
+    max_dist = min(max_dist, 127)
+    outside = _distance_to(walls, max_dist)
+    inside = _distance_to(~walls, max_dist)
+    return np.where(walls, 1 - inside, outside).astype(np.int8)
@@ -0,0 +1,148 @@
+from collections import namedtuple
+from settings import *
+
+# --- ÉVÉNEMENTS DE COMBAT ---
+# source : entité qui frappe (None pour un coup groupé de l'essaim), target : entité touchée
+Damage = namedtuple('Damage', 'source target amount')
+Kill = namedtuple('Kill', 'killer victim xp')
+
+
+class EventBus:
+    """File d'événements : emit() pendant le tick, flush() les distribue par lots.
+
+    Chaque abonné d'un type reçoit une seule fois la liste de ses événements, dans
+    l'ordre d'émission. Les événements émis pendant la distribution (une mort après
+    des dégâts) partent dans le lot suivant du même flush().
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.handlers = {}  # type d'événement -> [handler(events)]
+
+    def subscribe(self, kind, handler):
+        self.handlers.setdefault(kind, []).append(handler)
+
+    def unsubscribe(self, kind, handler):
+        self.handlers.get(kind, []).remove(handler)
+
+    def emit(self, event):
+        self.pending.append(event)
+
+    def flush(self):
+        while self.pending:
+            batch, self.pending = self.pending, []
+            by_kind = {}
+            for event in batch:
+                by_kind.setdefault(type(event), []).append(event)
+            for kind, events in by_kind.items():
+                for handler in self.handlers.get(kind, ()):
+                    handler(events)
+
+    def clear(self):
+        self.pending.clear()
+
+
+class Attack:
+    """Une attaque en cours : les cibles touchées pendant la fenêtre de frappe, une fois chacune."""
+    __slots__ = ('attacker', 'query', 'reach', 'damage', 'hit')
+
+    def __init__(self, attacker, query, reach, damage):
+        self.attacker = attacker
+        self.query = query  # rect -> entités touchées
+        self.reach = reach
+        self.damage = damage
+        self.hit = set()
+
+
+def attack_rect(hitbox, facing, reach):
+    """Zone de frappe : la hitbox décalée de reach vers l'avant."""
+    if facing == 'right': return hitbox.move(reach, 0)
+    if facing == 'left': return hitbox.move(-reach, 0)
+    if facing == 'down': return hitbox.move(0, reach)
+    return hitbox.move(0, -reach)
+
+
+class CombatSystem:
+    """Attaques en cours et application des dégâts.
+
+    update() ne regarde que les attaques actives : pendant les frames ATTACK_HIT_FRAMES
+    de l'animation, la zone de frappe interroge l'index spatial des cibles. Les coups
+    deviennent des événements Damage ; flush() les applique et émet les Kill.
+    """
+
+    def __init__(self):
+        self.bus = EventBus()
+        self.attacks = {}  # attaquant -> Attack (une seule attaque par entité)
+        self.debug_rects = []  # Zones de frappe actives (affichées en DEBUG_MODE)
+        self.bus.subscribe(Damage, self.apply_damage)
+
+    def reset(self):
+        self.attacks.clear()
+        self.bus.clear()
+        self.debug_rects.clear()
+
+    def start_attack(self, attacker, targets, reach, damage=None):
+        """targets : SpatialGroup (requête par sprites_in_rect) ou une seule entité."""
+        if hasattr(targets, 'sprites_in_rect'):
+            query = targets.sprites_in_rect
+        else:
+            query = lambda rect: (targets,) if rect.colliderect(targets.hitbox) else ()
+        self.attacks[attacker] = Attack(attacker, query, reach, damage)
+
+    def update(self):
+        first, last = ATTACK_HIT_FRAMES
+        self.debug_rects.clear()
+        done = []
+        for attacker, attack in self.attacks.items():
+            if not attacker.is_attacking or attacker.health <= 0:
+                done.append(attacker)
+                continue
+            if not first <= attacker.anim.frame <= last: continue
+            rect = attack_rect(attacker.hitbox, attacker.facing, attack.reach)
+            if DEBUG_MODE: self.debug_rects.append(rect)
+            damage = attack.damage if attack.damage is not None else attacker.damage
+            for target in attack.query(rect):
+                if target in attack.hit: continue
+                attack.hit.add(target)
+                self.bus.emit(Damage(attacker, target, damage))
+        for attacker in done:
+            del self.attacks[attacker]
+
+    def hit(self, source, target, amount):
+        """Coup porté hors d'une Attack (essaim : un seul événement pour tous les mobs)."""
+        self.bus.emit(Damage(source, target, amount))
+
+    def flush(self):
+        self.bus.flush()
+
+    def apply_damage(self, events):
+        for event in events:
+            target = event.target
+            if target.health <= 0: continue  # Déjà mort plus tôt dans le lot
+            target.take_damage(event.amount)
+            if target.health <= 0:
+                self.bus.emit(Kill(event.source, target, getattr(target, 'xp_reward', 0)))
+
+
+class CombatStats:
+    """Compteurs de la partie, abonnés au bus (simulations, écran de fin)."""
+
+    def __init__(self, bus, player=None):
+        self.player = player
+        self.reset()
+        bus.subscribe(Damage, self.on_damage)
+        bus.subscribe(Kill, self.on_kill)
+
+    def reset(self, player=None):
+        if player is not None: self.player = player
+        self.damage_taken = 0.0
+        self.damage_dealt = 0.0
+        self.kills = 0
+
+    def on_damage(self, events):
+        for event in events:
+            if event.target is self.player: self.damage_taken += event.amount
+            else: self.damage_dealt += event.amount
+
+    def on_kill(self, events):
+        self.kills += sum(1 for event in events if event.victim is not self.player)
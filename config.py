@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import settings
+from settings import *
+
+# --- RÉGLAGES À CHAUD ---
+# Les modules lisent les réglages par "from settings import *" : chacun a sa propre
+# copie des noms. Quand settings.py change, Config le réexécute, remplace les valeurs
+# modifiées dans tous les modules du jeu qui les avaient importées, puis appelle
+# seulement les reconstructions qui dépendent des noms modifiés (voir depends()).
+# Tout ce qui lit un réglage à chaque frame / tick (vitesses, DEBUG_MODE, ...) suit
+# donc sans rien faire ; les caches construits au chargement s'enregistrent ici.
+
+_MISSING = object()
+
+
+def read_settings(path):
+    """Exécute settings.py dans un espace de noms neuf : {NOM: valeur} des réglages."""
+    with open(path, encoding='utf-8') as f:
+        code = compile(f.read(), path, 'exec')
+    namespace = {'__file__': path, '__name__': 'settings'}
+    exec(code, namespace)
+    return {name: value for name, value in namespace.items() if name.isupper()}
+
+
+class Config:
+    def __init__(self, module=settings, poll_ms=None):
+        if poll_ms is None: poll_ms = CONFIG_POLL_MS
+        self.module = module
+        self.path = module.__file__
+        self.poll_ms = poll_ms
+        self.values = {name: value for name, value in vars(module).items() if name.isupper()}
+        self.mtime = os.path.getmtime(self.path)
+        self.next_poll = 0
+        self.deps = []  # (noms, reconstruction), dans l'ordre d'enregistrement
+        self.changed = set()  # Noms modifiés par le dernier changement (lisible par les reconstructions)
+
+    def depends(self, names, rebuild):
+        """rebuild() sera appelé (une fois) quand l'un des réglages names change."""
+        self.deps.append((frozenset(names), rebuild))
+
+    def poll(self, now_ms):
+        """Relit settings.py s'il a été modifié (au plus une fois toutes les poll_ms)."""
+        if now_ms < self.next_poll: return set()
+        self.next_poll = now_ms + self.poll_ms
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return set()
+        if mtime == self.mtime: return set()
+        self.mtime = mtime
+        return self.reload()
+
+    def reload(self):
+        try:
+            values = read_settings(self.path)
+        except Exception as e:  # Fichier en cours d'édition : on garde les réglages actuels
+            print(f"ERREUR: settings.py invalide ({e!r}), réglages inchangés.")
+            return set()
+        return self.set(**values)
+
+    def set(self, **values):
+        """Applique des réglages (fichier relu, console, benchmark). Renvoie les noms modifiés."""
+        changed = {name: value for name, value in values.items()
+                   if self.values.get(name, _MISSING) != value}
+        if not changed: return set()
+        t0 = time.perf_counter()
+        self.publish(changed)
+        self.changed = set(changed)
+        rebuilt = []
+        for names, rebuild in self.deps:
+            if names & changed.keys():
+                rebuild()
+                rebuilt.append(rebuild.__name__)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"Info: réglages modifiés : {', '.join(sorted(changed))} "
+              f"({', '.join(rebuilt) or 'pris en compte directement'}, {elapsed:.0f} ms)")
+        return set(changed)
+
+    def publish(self, changed):
+        """Nouvelles valeurs dans settings et dans les modules du jeu qui les ont importées."""
+        base = os.path.dirname(os.path.abspath(self.path))
+        modules = [m for m in list(sys.modules.values())
+                   if os.path.dirname(os.path.abspath(getattr(m, '__file__', None) or os.sep)) == base]
+        for name, value in changed.items():
+            old = self.values.get(name, _MISSING)
+            setattr(self.module, name, value)
+            for module in modules:
+                # Même objet que l'ancien réglage : c'est le nom importé depuis settings
+                if old is not _MISSING and vars(module).get(name, _MISSING) is old:
+                    setattr(module, name, value)
+            self.values[name] = value
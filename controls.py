@@ -0,0 +1,161 @@
+import random
+import pygame
+from settings import *
+
+class KeyboardInput:
+    """Entrées réelles : clavier + file d'événements pygame."""
+
+    def get_events(self):
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+
+class ScriptedKeys:
+    """Remplace le tableau de pygame.key.get_pressed() : keys[K_LEFT] -> bool."""
+
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+# Une boucle de déplacements avec une attaque au début de chaque segment
+DEFAULT_SCRIPT = [
+    (40, {pygame.K_LEFT}, {pygame.K_a}),
+    (40, {pygame.K_UP}, {pygame.K_a}),
+    (40, {pygame.K_RIGHT}, {pygame.K_a}),
+    (40, {pygame.K_DOWN}, {pygame.K_a}),
+    (20, set(), {pygame.K_a}),
+]
+
+
+class ScriptedInput:
+    """Entrées jouées depuis un script, un tick à la fois.
+
+    script : liste de (durée en ticks, touches maintenues, touches tapées).
+    Les touches tapées produisent un KEYDOWN au premier tick du segment.
+    get_events() fait avancer le script d'un tick : Game l'appelle une fois par tick.
+    """
+
+    def __init__(self, script=DEFAULT_SCRIPT, loop=True):
+        self.script = [(ticks, ScriptedKeys(held), tuple(tapped)) for ticks, held, tapped in script]
+        self.loop = loop
+        self.segment = 0
+        self.remaining = 0
+        self.keys = ScriptedKeys()
+        self.tick = 0
+
+    def get_events(self):
+        self.tick += 1
+        if self.remaining == 0:
+            if self.segment >= len(self.script):
+                if not self.loop:
+                    self.keys = ScriptedKeys()
+                    return []
+                self.segment = 0
+            ticks, self.keys, tapped = self.script[self.segment]
+            self.segment += 1
+            self.remaining = max(ticks, 1) - 1
+            return [pygame.event.Event(pygame.KEYDOWN, key=key) for key in tapped]
+        self.remaining -= 1
+        return []
+
+    def get_pressed(self):
+        return self.keys
+
+
+class BotInput:
+    """Joueur automatique pour les simulations : s'aligne sur l'ennemi le plus proche et frappe.
+
+    Un ennemi derrière un mur est rejoint par le champ de flux du jeu (game.flow) : le
+    chemin qu'il suivrait vers le joueur, pris à l'envers.
+    seed rend la partie reproductible (hésitations et temps de réaction tirés au hasard).
+    Il faut appeler attach(game) avant le premier tick.
+    """
+
+    def __init__(self, seed=0, reaction=0.5, reach=90):
+        self.rng = random.Random(seed)
+        self.reaction = reaction  # Probabilité de frapper à chaque tick quand un ennemi est à portée
+        self.reach = reach        # Distance max (axe de l'attaque) pour frapper
+        self.game = None
+        self.keys = ScriptedKeys()
+        self.last_pos = None  # Position du joueur au tick précédent (bloqué contre un mur ?)
+
+    def attach(self, game):
+        self.game = game
+
+    def target(self, player):
+        cx, cy = player.hitbox.center
+        best, best_d = None, None
+        for mob in self.game.all_enemies:
+            d = abs(mob.hitbox.centerx - cx) + abs(mob.hitbox.centery - cy)
+            if best is None or d < best_d:
+                best, best_d = mob, d
+        return best
+
+    def get_events(self):
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)] if self.game.state == 'game_over' else []
+        player = self.game.player
+        mob = self.target(player)
+        if mob is None or player.is_attacking:
+            self.keys = ScriptedKeys()
+            return events
+
+        blocked = bool(self.keys.held) and player.hitbox.topleft == self.last_pos
+        self.last_pos = player.hitbox.topleft
+        waypoint = self.waypoint(player, mob)
+        if waypoint is not None:
+            self.keys = ScriptedKeys(self.keys_towards(player, *waypoint, blocked))
+            return events
+
+        dx = mob.hitbox.centerx - player.hitbox.centerx
+        dy = mob.hitbox.centery - player.hitbox.centery
+        # Attaque sur l'axe dominant : d'abord s'aligner sur l'autre axe, puis s'approcher
+        if abs(dx) >= abs(dy):
+            along, across = dx, dy
+            forward = pygame.K_RIGHT if dx > 0 else pygame.K_LEFT
+            side = pygame.K_DOWN if dy > 0 else pygame.K_UP
+            facing = 'right' if dx > 0 else 'left'
+        else:
+            along, across = dy, dx
+            forward = pygame.K_DOWN if dy > 0 else pygame.K_UP
+            side = pygame.K_RIGHT if dx > 0 else pygame.K_LEFT
+            facing = 'down' if dy > 0 else 'up'
+
+        held = set()
+        if abs(across) > player.hitbox.h // 2: held.add(side)
+        if abs(along) > self.reach: held.add(forward)
+        elif player.facing != facing: held.add(forward)  # Un pas pour se tourner vers lui
+        elif not held and self.rng.random() < self.reaction:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.keys = ScriptedKeys(held)
+        return events
+
+    def waypoint(self, player, mob):
+        """Centre de la prochaine case du chemin vers mob, None si rien ne les sépare."""
+        flow = self.game.flow
+        # Aucun mur entre les deux hitbox : s'aligner sur lui ne bute sur rien
+        if flow is None or not self.game.map.any_wall_in(player.hitbox.union(mob.hitbox)):
+            return None
+        own = flow.cell_of(*player.hitbox.center)
+        # Dernière case du chemin (pris depuis le mob) avant celle du joueur
+        cells = [cell for cell in flow.path(*mob.hitbox.center) if cell != own]
+        if not cells: return None
+        r, c = cells[-1]
+        return (c + 0.5) * flow.cell_size, (r + 0.5) * flow.cell_size
+
+    def keys_towards(self, player, x, y, blocked=False):
+        # Les deux axes à la fois : le joueur se recentre sur le couloir en avançant. Il fait des
+        # pas de MOVE_SPEED : à moins d'un pas de l'axe, il ne corrige que s'il bute sur un coin
+        dx, dy = x - player.hitbox.centerx, y - player.hitbox.centery
+        slack = 1 if blocked else MOVE_SPEED
+        held = set()
+        if abs(dx) >= slack: held.add(pygame.K_RIGHT if dx > 0 else pygame.K_LEFT)
+        if abs(dy) >= slack: held.add(pygame.K_DOWN if dy > 0 else pygame.K_UP)
+        return held
+
+    def get_pressed(self):
+        return self.keys
@@ -0,0 +1,110 @@
+import numpy as np
+from settings import *
+
+# Cases voisines (la case elle-même comprise) : avec des cases de côté radius,
+# deux mobs à moins de radius l'un de l'autre sont forcément dans des cases voisines
+OFFSETS = np.array([(ox, oy) for ox in (-1, 0, 1) for oy in (-1, 0, 1)])
+BRUTE_FORCE_MAX = 64  # En dessous, toutes les paires d'un coup coûtent moins cher que la grille
+
+
+def close_pairs(xs, ys, radius):
+    """Paires (i, j), i != j, de points à moins de radius l'un de l'autre.
+
+    Phase large par grille triée : chaque point reçoit le numéro de sa case, les
+    points sont triés par case, puis chaque point ne regarde que les 9 cases autour
+    de la sienne (table début / taille par case). Le coût suit le nombre
+    de voisins réels et non N². Chaque paire sort dans les deux sens.
+    """
+    n = len(xs)
+    if n <= BRUTE_FORCE_MAX:
+        dx = xs[:, None] - xs[None, :]
+        dy = ys[:, None] - ys[None, :]
+        near = dx * dx + dy * dy < radius * radius
+        np.fill_diagonal(near, False)
+        return np.nonzero(near)
+    gx = np.floor(xs / radius).astype(np.int64)
+    gy = np.floor(ys / radius).astype(np.int64)
+    gx -= gx.min() - 1  # Marge d'une case : les voisins d'un bord restent positifs
+    gy -= gy.min() - 1
+    stride = int(gy.max()) + 2
+    keys = gx * stride + gy
+    order = np.argsort(keys, kind='stable')
+
+    # Les 9 cases voisines de chaque point en une fois : tableau (N, 9) aplati
+    target = (keys[:, None] + OFFSETS[:, 0] * stride + OFFSETS[:, 1]).ravel()
+    size = (int(gx.max()) + 2) * stride
+    if size <= 4 * n + 4096:
+        # Table dense début / taille de chaque case (cas courant : mobs sur la carte)
+        cell_count = np.bincount(keys, minlength=size)
+        cell_start = np.cumsum(cell_count) - cell_count
+        start, count = cell_start[target], cell_count[target]
+    else:
+        # Points très dispersés : recherche dichotomique dans les clés triées
+        sorted_keys = keys[order]
+        start = np.searchsorted(sorted_keys, target, 'left')
+        count = np.searchsorted(sorted_keys, target, 'right') - start
+    total = int(count.sum())
+    i = np.repeat(np.arange(n).repeat(len(OFFSETS)), count)
+    # Position de chaque candidat dans sa case : 0, 1, ... count - 1
+    rank = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+    j = order[np.repeat(start, count) + rank]
+    dx = xs[i] - xs[j]
+    dy = ys[i] - ys[j]
+    near = (i != j) & (dx * dx + dy * dy < radius * radius)
+    return i[near], j[near]
+
+
+def separation(xs, ys, radius=None, push=None):
+    """Poussée (fx, fy) de chaque point, en pixels par tick, loin de ses voisins trop proches.
+
+    Chaque voisin à distance d < radius pousse de (1 - d / radius) dans la direction
+    opposée ; la somme est plafonnée à push. Deux mobs sur le même pixel sont écartés
+    selon x, dans un sens fixé par leur indice (résultat déterministe pour les replays).
+    """
+    if radius is None: radius = CROWD_RADIUS
+    if push is None: push = CROWD_PUSH
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if len(xs) < 2:
+        return np.zeros(len(xs)), np.zeros(len(xs))
+    i, j = close_pairs(xs, ys, radius)
+    if len(i) == 0:
+        return np.zeros(len(xs)), np.zeros(len(xs))
+    dx = xs[i] - xs[j]
+    dy = ys[i] - ys[j]
+    dist = np.hypot(dx, dy)
+    same = dist == 0
+    dx = np.where(same, np.sign(i - j), dx)
+    dist = np.where(same, 1.0, dist)
+    weight = (1 - dist / radius) / dist
+    fx = np.bincount(i, dx * weight, minlength=len(xs)) * push
+    fy = np.bincount(i, dy * weight, minlength=len(xs)) * push
+    norm = np.hypot(fx, fy)
+    scale = np.where(norm > push, push / np.maximum(norm, 1e-9), 1.0)
+    return fx * scale, fy * scale
+
+
+class Crowd:
+    """Séparation des ennemis-sprites : une passe groupée par tick, avant leurs update().
+
+    Chaque mob reçoit mob.push = (fx, fy), ajouté à son déplacement (Enemy.update) sauf
+    s'il touche le joueur.
+    """
+
+    def __init__(self, radius=None, push=None):
+        if radius is None: radius = CROWD_RADIUS
+        if push is None: push = CROWD_PUSH
+        self.radius = radius
+        self.push = push
+
+    def forces(self, xs, ys):
+        return separation(xs, ys, self.radius, self.push)
+
+    def apply(self, sprites):
+        mobs = sprites.sprites()
+        if not mobs: return
+        xs = np.fromiter((mob.hitbox.centerx for mob in mobs), float, len(mobs))
+        ys = np.fromiter((mob.hitbox.centery for mob in mobs), float, len(mobs))
+        fx, fy = self.forces(xs, ys)
+        for mob, px, py in zip(mobs, fx.tolist(), fy.tolist()):
+            mob.push = (px, py)
@@ -1,11 +1,25 @@
 import pygame
-import os
 import math
 from settings import *
+from animation import Animator, get_table
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, start_x, start_y, max_health=100, damage=10, xp_reward=20):
+    def __init__(self, start_x, start_y, max_health=100, damage=10, xp_reward=20, skin=None, tint=None):
+        if skin is None: skin = DEFAULT_SKIN
         super().__init__()
+        self.attack_range = 30
+        self.attack_cooldown = 2000
+        self.pool = None     # EnemyPool qui récupère l'ennemi à sa mort
+        self.pooled = False
+        self.anim = None     # Créé par reset()
+        self.reset(start_x, start_y, max_health, damage, xp_reward, skin, tint)
+
+    def reset(self, start_x, start_y, max_health=100, damage=10, xp_reward=20, skin=None, tint=None):
+        """Remet l'ennemi à neuf (à la création ou quand il sort de la réserve).
+
+        skin / tint : variante de sprite (élites d'une vague, voir waves.json).
+        """
+        if skin is None: skin = DEFAULT_SKIN
         self.x = start_x
         self.y = start_y
         
@@ -14,54 +28,27 @@ class Enemy(pygame.sprite.Sprite):
         self.damage = damage
         self.xp_reward = xp_reward # Combien d'XP il donne
 
-        self.attack_range = 30
-        self.attack_cooldown = 2000
-        self.last_attack_time = 0
+        self.last_attack_time = -self.attack_cooldown  # Peut attaquer dès son apparition
+        self.push = (0.0, 0.0)  # Poussée de la foule pour ce tick (crowd.Crowd)
         
         self.facing = 'down'
         self.state = 'idle'
         self.is_attacking = False
-        self.frame_index = 0
-        self.animation_speed = 0.2
-        
-        self.load_sprites()
+        table = get_table(skin, tint=tint)  # Clips partagés par tous les ennemis du même type
+        if self.anim is None:
+            self.anim = Animator(table)
+        else:
+            self.anim.table = table
+            self.anim.reset()
         
-        self.image = self.anims_walk['down'][0]
+        self.image = self.anim.clip.frames[0]
         self.rect = self.image.get_rect()
         self.rect.midbottom = (self.x, self.y)
         self.hitbox = self.rect.inflate(-100, -95)
 
-    def load_sprites(self):
-        path_walk = os.path.join(SPRITE_DIR, WALK_SPRITE)
-        sheet_walk = pygame.image.load(path_walk).convert_alpha()
-        self.anims_walk = self.cut_sheet(sheet_walk, 4, 6)
-        
-        path_attack = os.path.join(SPRITE_DIR, ATTACK_SPRITE)
-        sheet_attack = pygame.image.load(path_attack).convert_alpha()
-        if sheet_attack.get_width() % 8 != 0:
-            new_w = (sheet_attack.get_width() // 8 + 1) * 8
-            sheet_attack = pygame.transform.scale(sheet_attack, (new_w, sheet_attack.get_height()))
-        self.anims_attack = self.cut_sheet(sheet_attack, 4, 8)
-
-    def cut_sheet(self, sheet, rows, cols):
-        w = sheet.get_width() // cols
-        h = sheet.get_height() // rows
-        anims = {}
-        dirs = ['down', 'left', 'right', 'up']
-        for r in range(rows):
-            d = dirs[r]
-            frames = []
-            for c in range(cols):
-                rect = pygame.Rect(c*w, r*h, w, h)
-                sub = sheet.subsurface(rect)
-                scaled = pygame.transform.scale(sub, (int(w * PLAYER_SCALE), int(h * PLAYER_SCALE)))
-                frames.append(scaled)
-            anims[d] = frames
-        return anims
-
-    def update(self, player, game_map):
+    def update(self, player, game_map, now, flow=None, combat=None):
+        # L'animation est avancée ensuite pour tous les ennemis d'un coup (animation.advance_all)
         if self.is_attacking:
-            self.animate()
             return 
 
         target_x = player.hitbox.centerx
@@ -71,99 +58,62 @@ class Enemy(pygame.sprite.Sprite):
         dy_val = target_y - self.hitbox.centery
         dist = math.hypot(dx_val, dy_val)
 
+        # Sans poursuite, seule la foule fait bouger le mob
+        move_x, move_y = self.push
+
         if self.hitbox.colliderect(player.hitbox):
+            # Au contact, la foule ne l'écarte pas du joueur (il resterait à pousser dans le vide)
+            move_x = move_y = 0.0
             self.state = 'idle'
             if abs(dx_val) > abs(dy_val):
                 self.facing = 'right' if dx_val > 0 else 'left'
             else:
                 self.facing = 'down' if dy_val > 0 else 'up'
-            self.check_attack(player)
+            self.check_attack(player, now, combat)
+            if self.is_attacking: return
 
         elif dist > 5:
-            move_x = (dx_val / dist) * MOB_SPEED
-            move_y = (dy_val / dist) * MOB_SPEED
-            
-            self.hitbox.x += move_x
-            if game_map.check_wall(self.hitbox.centerx, self.hitbox.centery):
-                self.hitbox.x -= move_x
-            
-            self.hitbox.y += move_y
-            if game_map.check_wall(self.hitbox.centerx, self.hitbox.centery):
-                self.hitbox.y -= move_y
-                
-            self.rect.center = self.hitbox.center
-            self.x = self.rect.midbottom[0]
-            self.y = self.rect.midbottom[1]
+            dir_x, dir_y = dx_val / dist, dy_val / dist
+            if flow is not None:
+                # Champ de flux : contourne les murs au lieu de foncer droit dedans
+                dir_x, dir_y = flow.direction(self.hitbox.centerx, self.hitbox.centery, dir_x, dir_y)
+            move_x += dir_x * MOB_SPEED
+            move_y += dir_y * MOB_SPEED
 
             self.state = 'running'
             
-            if abs(move_x) > abs(move_y):
-                self.facing = 'right' if move_x > 0 else 'left'
+            # Orientation d'après la poursuite (la poussée de la foule ne fait pas pivoter)
+            if abs(dir_x) > abs(dir_y):
+                self.facing = 'right' if dir_x > 0 else 'left'
             else:
-                self.facing = 'down' if move_y > 0 else 'up'
+                self.facing = 'down' if dir_y > 0 else 'up'
         
         else:
             self.state = 'idle'
 
-        self.animate()
+        if move_x or move_y:
+            moved_x, moved_y = game_map.move_box(self.hitbox, move_x, move_y)
+            if self.state == 'running' and flow is not None and moved_x * dir_x + moved_y * dir_y < MOB_SPEED / 2:
+                # Bloqué alors que le chemin passe : décalé du couloir, on se recentre dessus
+                side_x, side_y = flow.lane_step(self.hitbox.centerx, self.hitbox.centery, MOB_SPEED)
+                if side_x or side_y: game_map.move_box(self.hitbox, side_x, side_y)
+            self.rect.center = self.hitbox.center
+            self.x = self.rect.midbottom[0]
+            self.y = self.rect.midbottom[1]
 
-    def check_attack(self, player):
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_attack_time > self.attack_cooldown:
+    def check_attack(self, player, now, combat=None):
+        # now : temps de jeu en ms (Game.time_ms), le cooldown suit les ticks et non l'horloge murale
+        if now - self.last_attack_time > self.attack_cooldown:
             self.is_attacking = True
             self.state = 'attacking'
-            self.frame_index = 0
-            self.last_attack_time = current_time
-            player.take_damage(self.damage)
-
-    def animate(self):
-        current_list = []
-        speed = 0.2
-        if self.state == 'attacking':
-            current_list = self.anims_attack[self.facing]
-            speed = 0.35 
-        elif self.state == 'running':
-            current_list = self.anims_walk[self.facing]
-            speed = self.animation_speed
-        else:
-            current_list = [self.anims_walk[self.facing][0]]
-            speed = 0
-
-        self.frame_index += speed
-        if self.frame_index >= len(current_list):
-            if self.state == 'attacking':
-                self.is_attacking = False
-                self.state = 'idle'
-                self.frame_index = 0
-            else:
-                self.frame_index = 0
-
-        idx = int(self.frame_index)
-        if idx >= len(current_list): idx = 0
-        self.image = current_list[idx]
-        
-        old_center = self.hitbox.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
-        
-        if self.state == 'attacking':
-            offset = 30
-            if self.facing == 'right': self.rect.x -= offset
-            elif self.facing == 'left': self.rect.x += offset
+            self.anim.restart()
+            self.last_attack_time = now
+            # Les dégâts tombent pendant la fenêtre de frappe de l'animation (combat.CombatSystem)
+            if combat is not None: combat.start_attack(self, player, self.attack_range)
 
     def take_damage(self, amount):
         self.health -= amount
+        self.anim.start_flash(HIT_FLASH_TICKS)
         if self.health <= 0:
             self.kill()
-
-    # NOUVEAU : Barre de vie flottante
-    def draw_health(self, surface, camera_x, camera_y):
-        if self.health == self.max_health: return
-        x = self.rect.x - camera_x
-        y = self.rect.y - camera_y - 10
-        width = self.rect.width
-        height = 5
-        ratio = self.health / self.max_health
-        current_width = width * ratio
-        pygame.draw.rect(surface, (0,0,0), (x, y, width, height))
-        pygame.draw.rect(surface, (255,0,0), (x, y, current_width, height))
\ No newline at end of file
+            if self.pool is not None: self.pool.release(self)
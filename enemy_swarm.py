@@ -0,0 +1,310 @@
+import numpy as np
+import pygame
+from settings import *
+from enemy import Enemy
+from animation import IDLE, RUNNING, ATTACKING, DOWN, LEFT, RIGHT, UP, FACINGS, STATES, ATTACK_OFFSET, get_table
+
+
+class SwarmEnemy(Enemy):
+    """Vue légère sur une ligne de EnemySwarm, compatible avec Game.all_enemies."""
+
+    def __init__(self, swarm, index):
+        pygame.sprite.Sprite.__init__(self)
+        self.swarm = swarm
+        self.index = index
+        self.image = swarm.clips[IDLE][DOWN][0]
+        self.rect = self.image.get_rect()
+        self.hitbox = pygame.Rect(0, 0, swarm.hitbox_w, swarm.hitbox_h)
+
+    # Les statistiques vivent dans les tableaux du swarm (figées à la mort du mob)
+    def _field(self, name):
+        if self.index < 0:
+            return self.final[name]
+        return getattr(self.swarm, name)[self.index]
+
+    @property
+    def health(self): return float(self._field('health'))
+    @property
+    def max_health(self): return float(self._field('max_health'))
+    @property
+    def damage(self): return float(self._field('damage'))
+    @property
+    def xp_reward(self): return int(self._field('xp_reward'))
+    @property
+    def facing(self): return FACINGS[self._field('facing')]
+    @property
+    def state(self): return STATES[self._field('state')]
+    @property
+    def is_attacking(self): return self._field('state') == ATTACKING
+    @property
+    def frame_index(self): return float(self._field('frame_index'))
+    @property
+    def x(self): return self.rect.midbottom[0]
+    @property
+    def y(self): return self.rect.midbottom[1]
+
+    def update(self, *args):
+        # Le déplacement est calculé en bloc par EnemySwarm.step
+        pass
+
+    def take_damage(self, amount):
+        if self.index < 0: return
+        self.swarm.health[self.index] -= amount
+        if self.swarm.health[self.index] <= 0:
+            self.swarm.remove(self)
+
+
+class EnemySwarm:
+    """Simulation groupée des ennemis : un tableau numpy par attribut."""
+
+    FIELDS = ('cx', 'cy', 'health', 'max_health', 'damage', 'xp_reward',
+              'last_attack_time', 'facing', 'state', 'frame_index', 'cells')
+
+    def __init__(self, game_map, group, capacity=64):
+        self.map = game_map
+        self.group = group  # SpatialGroup qui contient les vues
+
+        # Mêmes clips qu'Enemy : clips[état][direction] -> frames
+        table = get_table()
+        self.clips = [[table.clip(s, f).frames for f in range(len(FACINGS))] for s in range(len(STATES))]
+        self.clip_len = table.lengths
+        self.clip_speed = table.speeds
+
+        self.frame_w, self.frame_h = table.frame_size
+        hitbox = pygame.Rect((0, 0), table.frame_size).inflate(-100, -95)
+        self.hitbox_w, self.hitbox_h = hitbox.size
+        # Murs vus par la hitbox : déplacements balayés avec un seul point de sonde par mob
+        self.walls = game_map.box_walls(self.hitbox_w, self.hitbox_h)
+
+        self.attack_cooldown = 2000
+        self.attack_range = 30
+        self.count = 0
+        self.views = []
+        self.free_views = []  # Vues de mobs morts, réutilisées au prochain spawn
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        def grow(name, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        grow('cx', np.float64)            # Centre de la hitbox
+        grow('cy', np.float64)
+        grow('health', np.float64)
+        grow('max_health', np.float64)
+        grow('damage', np.float64)
+        grow('xp_reward', np.int32)
+        grow('last_attack_time', np.int64)
+        grow('facing', np.int8)
+        grow('state', np.int8)
+        grow('frame_index', np.float64)
+        grow('cells', np.int64)           # Case de grille du coin haut-gauche de la hitbox, empaquetée
+        self.capacity = capacity
+
+    # --- CYCLE DE VIE ---
+    def spawn(self, start_x, start_y, max_health=100, damage=10, xp_reward=20, skin=None, tint=None):
+        """Même signature qu'Enemy : (start_x, start_y) est le bas du sprite.
+
+        skin / tint sont ignorés : l'essaim dessine tous ses ennemis avec la table par défaut.
+        """
+        if skin is None: skin = DEFAULT_SKIN
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.count
+        self.cx[i] = start_x
+        self.cy[i] = start_y - self.frame_h / 2
+        self.health[i] = self.max_health[i] = max_health
+        self.damage[i] = damage
+        self.xp_reward[i] = xp_reward
+        self.last_attack_time[i] = -self.attack_cooldown
+        self.facing[i] = DOWN
+        self.state[i] = IDLE
+        self.frame_index[i] = 0
+        self.cells[i] = np.iinfo(np.int64).min  # Aucune case : relocate au premier tick
+        self.count += 1
+
+        if self.free_views:
+            view = self.free_views.pop()
+            view.index = i
+        else:
+            view = SwarmEnemy(self, i)
+        self.views.append(view)
+        self._sync_one(i)
+        self.group.add(view)
+        return view
+
+    def remove(self, view):
+        # On bouche le trou avec la dernière ligne pour garder les tableaux denses
+        i = view.index
+        last = self.count - 1
+        view.final = {name: getattr(self, name)[i] for name in self.FIELDS}
+        if i != last:
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+            moved = self.views[last]
+            moved.index = i
+            self.views[i] = moved
+        self.views.pop()
+        self.count -= 1
+        view.index = -1
+        view.kill()
+        self.free_views.append(view)
+
+    def clear(self):
+        for view in self.views:
+            view.final = {name: getattr(self, name)[view.index] for name in self.FIELDS}
+            view.index = -1
+            view.kill()
+        self.free_views.extend(self.views)
+        self.views = []
+        self.count = 0
+
+    # --- SIMULATION ---
+    def step(self, player, now, flow=None, crowd=None, combat=None):
+        n = self.count
+        if n == 0: return
+        cx, cy = self.cx[:n], self.cy[:n]
+        state, facing = self.state[:n], self.facing[:n]
+        # Poussée de la foule calculée sur les positions de début de tick
+        move_x, move_y = crowd.forces(cx, cy) if crowd is not None else (np.zeros(n), np.zeros(n))
+
+        free = state != ATTACKING  # Un mob qui attaque ne bouge pas
+        dx = player.hitbox.centerx - cx
+        dy = player.hitbox.centery - cy
+        dist = np.hypot(dx, dy)
+
+        # Contact : même test que Rect.colliderect entre les deux hitbox
+        touching = free & (np.abs(dx) * 2 < self.hitbox_w + player.hitbox.w) \
+                        & (np.abs(dy) * 2 < self.hitbox_h + player.hitbox.h)
+        chasing = free & ~touching & (dist > 5)
+        state[free] = IDLE
+
+        # Contact -> pas de poussée de la foule, face au joueur + attaque si le cooldown est écoulé
+        if touching.any():
+            move_x[touching] = 0.0
+            move_y[touching] = 0.0
+            facing[touching] = self._facing_of(dx[touching], dy[touching])
+            ready = touching & (now - self.last_attack_time[:n] > self.attack_cooldown)
+            if ready.any():
+                state[ready] = ATTACKING
+                self.frame_index[:n][ready] = 0
+                self.last_attack_time[:n][ready] = now
+
+        # Poursuite (+ poussée de la foule) et glissement le long des murs (axe x puis axe y)
+        heading_x, heading_y = np.zeros(n), np.zeros(n)
+        if chasing.any():
+            idx = np.nonzero(chasing)[0]
+            safe = dist[idx]
+            dir_x, dir_y = dx[idx] / safe, dy[idx] / safe
+            if flow is not None:
+                dir_x, dir_y = flow.directions(cx[idx], cy[idx], dir_x, dir_y)
+            move_x[idx] += dir_x * MOB_SPEED
+            move_y[idx] += dir_y * MOB_SPEED
+            heading_x[idx], heading_y[idx] = dir_x, dir_y
+            state[idx] = RUNNING
+            facing[idx] = self._facing_of(dir_x, dir_y)
+        idx = np.nonzero((state != ATTACKING) & ((move_x != 0) | (move_y != 0)))[0]
+        if len(idx):
+            moved_x, moved_y = self._move(idx, move_x[idx], move_y[idx])
+            if flow is not None:
+                # Bloqué alors que le chemin passe : décalé du couloir, on se recentre dessus (comme Enemy)
+                stuck = (state[idx] == RUNNING) & \
+                        (moved_x * heading_x[idx] + moved_y * heading_y[idx] < MOB_SPEED / 2)
+                if stuck.any():
+                    idx = idx[stuck]
+                    side_x, side_y = flow.lane_steps(cx[idx], cy[idx], MOB_SPEED)
+                    self._move(idx, side_x, side_y)
+
+        attacking = state == ATTACKING
+        before = self.frame_index[:n].copy() if attacking.any() else None
+        self._animate(n)
+        if before is not None and combat is not None:
+            self._strike(player, combat, attacking, before, n)
+        self._sync(n)
+
+    def _move(self, idx, mx, my):
+        """Déplace les mobs idx de (mx, my) sans qu'aucun pixel de leur hitbox n'entre dans un mur.
+
+        Comme CollisionGrid.move_box (x puis y), mais en un seul point par mob : le coin
+        haut-gauche de sa hitbox, sondé sur les murs vus par la hitbox (self.walls).
+        Renvoie le déplacement réel.
+        """
+        cx, cy = self.cx, self.cy
+        x0, y0 = cx[idx], cy[idx]
+        zeros = np.zeros(len(idx))
+        top = (y0 - self.hitbox_h / 2)[:, None]
+        cx[idx] = x1 = x0 + mx * self.walls.max_shift((x0 - self.hitbox_w / 2)[:, None], top, mx, zeros)
+        cy[idx] = y0 + my * self.walls.max_shift((x1 - self.hitbox_w / 2)[:, None], top, zeros, my)
+        return cx[idx] - x0, cy[idx] - y0
+
+    def _strike(self, player, combat, attacking, before, n):
+        """Mobs dont l'animation entre ce tick dans la fenêtre de frappe (même zone qu'Enemy)."""
+        first = ATTACK_HIT_FRAMES[0]
+        striking = attacking & (before < first) & (self.frame_index[:n] >= first)
+        if not striking.any(): return
+        idx = np.nonzero(striking)[0]
+        facing = self.facing[:n][idx]
+        r = self.attack_range
+        cx = self.cx[:n][idx] + np.where(facing == RIGHT, r, np.where(facing == LEFT, -r, 0))
+        cy = self.cy[:n][idx] + np.where(facing == DOWN, r, np.where(facing == UP, -r, 0))
+        hit = (np.abs(player.hitbox.centerx - cx) * 2 < self.hitbox_w + player.hitbox.w) \
+            & (np.abs(player.hitbox.centery - cy) * 2 < self.hitbox_h + player.hitbox.h)
+        if hit.any():
+            combat.hit(None, player, float(self.damage[:n][idx][hit].sum()))
+
+    @staticmethod
+    def _facing_of(dx, dy):
+        horizontal = np.abs(dx) > np.abs(dy)
+        return np.where(horizontal, np.where(dx > 0, RIGHT, LEFT),
+                        np.where(dy > 0, DOWN, UP)).astype(np.int8)
+
+    def _animate(self, n):
+        state, fi = self.state[:n], self.frame_index[:n]
+        fi += self.clip_speed[state]
+        length = self.clip_len[state]
+        wrapped = fi >= length
+        state[wrapped & (state == ATTACKING)] = IDLE
+        fi[wrapped] = 0
+
+    # --- SYNCHRO DES VUES (image, rect, hitbox, grille) ---
+    def _rects(self, n):
+        cx, cy = self.cx[:n], self.cy[:n]
+        hx = (cx - self.hitbox_w / 2).astype(np.int64)
+        hy = (cy - self.hitbox_h / 2).astype(np.int64)
+        offset = np.where(self.state[:n] == ATTACKING,
+                          np.where(self.facing[:n] == RIGHT, -ATTACK_OFFSET,
+                                   np.where(self.facing[:n] == LEFT, ATTACK_OFFSET, 0)), 0)
+        rx = (cx - self.frame_w / 2).astype(np.int64) + offset
+        ry = (cy - self.frame_h / 2).astype(np.int64)
+        return hx, hy, rx, ry
+
+    def _sync_one(self, i):
+        hx, hy, rx, ry = self._rects(self.count)
+        view = self.views[i]
+        view.hitbox.topleft = (int(hx[i]), int(hy[i]))
+        view.rect.topleft = (int(rx[i]), int(ry[i]))
+
+    def _sync(self, n):
+        hx, hy, rx, ry = self._rects(n)
+        state = self.state[:n]
+        frame = np.where(state == IDLE, 0, self.frame_index[:n].astype(np.int64))
+        clips = self.clips
+        for view, s, f, k, a, b, c, d in zip(self.views, state.tolist(), self.facing[:n].tolist(),
+                                             frame.tolist(), hx.tolist(), hy.tolist(),
+                                             rx.tolist(), ry.tolist()):
+            view.image = clips[s][f][k]
+            view.hitbox.topleft = (a, b)
+            view.rect.topleft = (c, d)
+
+        # Grille spatiale : on ne touche qu'aux mobs dont le coin haut-gauche a changé de case
+        # (la case de SpatialGroup, empaquetée dans un seul entier)
+        if not self.group.indexed: return
+        cs = self.group.cell_size
+        key = (hx // cs) * 65536 + hy // cs
+        changed = np.nonzero(key != self.cells[:n])[0]
+        for i in changed.tolist():
+            self.group.relocate(self.views[i])
+        self.cells[:n] = key
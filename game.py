@@ -1,23 +1,56 @@
 import pygame
+import os
 import sys
 from settings import *
-from game_map import GameMap
+from game_map import GameMap, prepare_map
+from tiled_map import TiledGameMap
 from player import Player
-from enemy import Enemy
 from ui import UI  # IMPORT UI
+from spatial_grid import SpatialGroup
+from enemy_swarm import EnemySwarm
+from controls import KeyboardInput
+from profiler import FrameProfiler
+from menu_renderer import MenuBackground
+from renderer import WorldRenderer
+from asset_pack import load_pack
+from pathfinding import FlowField
+from crowd import Crowd
+from camera import Camera
+from render_queue import RenderQueue, clear_health_bars
+from config import Config
+from combat import CombatSystem, CombatStats, Kill
+from text_cache import render_text
+from waves import EnemyPool, WaveScheduler
+from animation import advance_all, pose, get_table
+import sprite_cache
+from asset_loader import AssetLoader
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, controls=None):
+        # Mode sans fenêtre : pilote vidéo factice, aucun rendu (tests, benchmarks)
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        self.controls = controls if controls is not None else KeyboardInput()
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
+        self.renderer = WorldRenderer(self.screen)
         self.running = True
+        self.lag = 0
+        self.ticks = 0  # Horloge de jeu : ticks de simulation depuis le lancement
         
         self.state = 'menu'
         self.font = pygame.font.SysFont("Arial", FONT_SIZE, bold=True)
         self.font_gameover = pygame.font.SysFont("Arial", 80, bold=True)
         self.ui = UI() # UI INSTANCE
+
+        # Voile du game over : construit une seule fois
+        self.gameover_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.gameover_overlay.fill((50, 0, 0))
+        self.gameover_overlay.set_alpha(180)
         
         btn_w, btn_h = 200, 80
         self.play_button = pygame.Rect(
@@ -26,195 +59,468 @@ class Game:
             btn_w, btn_h
         )
 
-        self.menu_cam_x = 0
-        self.menu_cam_y = 0
-        self.menu_cam_speed_x = 2
-        self.menu_cam_speed_y = 1
+        self.camera = Camera(0, 0)
+        self.render_queue = RenderQueue()
+        self.menu_background = MenuBackground()
         
-        self.map = GameMap()
-        self.all_enemies = pygame.sprite.Group()
+        self.waves = WaveScheduler()
+        self.crowd = Crowd() if CROWD_SEPARATION else None
+        self.loader = AssetLoader()
+        self.preloaded = {}  # (carte, collisions) -> job de prepare_map en cours ou fini
+        self.map_index = MAPS.index((MAP_FILE, COLLISION_FILE)) if (MAP_FILE, COLLISION_FILE) in MAPS else 0
+        self.load_assets()
+        self.config = Config()
+        self.watch_settings()
         
-        self.camera_x = 0
-        self.camera_y = 0
-        self.debug_attack_rect = None
+        self.combat = CombatSystem()
+        self.stats = CombatStats(self.combat.bus)
+        self.combat.bus.subscribe(Kill, self.on_kills)
+        self.profiler = FrameProfiler()
         
         self.start_game()
 
+    # --- CHARGEMENT ---
+    def load_assets(self):
+        """Carte et skins préparés sur les threads du chargeur, écran de chargement en attendant.
+
+        La carte n'est installée qu'une fois les skins prêts : set_map (navigation, réserve
+        d'ennemis) lit la table du skin par défaut, sinon décodée sur le thread principal.
+        """
+        pack = load_pack() if ASSET_PACK else None
+        future = None
+        if MAP_TILED:
+            game_map = TiledGameMap()
+        elif pack is not None and 'map' in pack:
+            game_map = GameMap(pack)  # Octets déjà prêts dans le pack
+        else:
+            future = self.loader.submit(prepare_map)
+        self.load_skins()
+        self.set_map(GameMap(prepared=future.result()) if future is not None else game_map)
+        self.wait_loading("Chargement...")  # Navigation de la carte
+
+    def load_skins(self, wait=True):
+        """Skins du joueur et ennemis des vagues, avec leur flash, préparés sur les threads du chargeur."""
+        looks = [(skin, tint, flash) for skin, tint in
+                 [(skin, None) for skin in PLAYER_LEVEL_SKINS] + sorted(self.waves.variants(), key=repr)
+                 for flash in (False, True)]
+        for skin in sorted({skin for skin, _, _ in looks}):
+            if skin not in SKINS: continue
+            tints = [(tint, flash) for s, tint, flash in looks if s == skin and (tint, flash) != (None, False)]
+            if not sprite_cache.is_loaded(skin):
+                finish = lambda anims, skin=skin, tints=tints: self.install_skin(skin, anims, tints)
+            else:
+                # Skin déjà là (pack, redécoupe en cours de partie) : seulement ses teintes manquantes
+                tints = [(tint, flash) for tint, flash in tints
+                         if not sprite_cache.has_variant(skin, PLAYER_SCALE, tint, flash)]
+                if not tints: continue
+                finish = lambda anims, skin=skin, tints=tints: self.install_tints(skin, anims, tints)
+            self.loader.submit(sprite_cache.prepare_skin, skin, PLAYER_SCALE, finish=finish)
+        if not wait: return
+        self.wait_loading("Chargement...")
+        # Variantes pas encore construites : sur le thread principal
+        sprite_cache.preload_variants((skin, PLAYER_SCALE, tint, flash) for skin, tint, flash in looks)
+
+    def install_skin(self, skin, anims, tints):
+        walk, attack = (sprite_cache.finish_animations(a) for a in anims)
+        sprite_cache.install_variant(skin, PLAYER_SCALE, walk, attack)
+        self.install_tints(skin, anims, tints)
+
+    def install_tints(self, skin, anims, tints):
+        # Les teintes partent à leur tour sur les threads, depuis les frames non converties
+        for tint, flash in tints:
+            self.loader.submit(sprite_cache.prepare_tint, anims, tint, flash,
+                               finish=lambda tinted, tint=tint, flash=flash: sprite_cache.install_variant(
+                                   skin, PLAYER_SCALE, *(sprite_cache.finish_animations(a) for a in tinted), tint, flash))
+
+    def set_map(self, game_map):
+        """Installe une carte et refait tout ce qui en dépend (grille spatiale, navigation, réserve)."""
+        self.map = game_map
+        self.all_enemies = SpatialGroup(self.map.width, self.map.height)
+        self.swarm = EnemySwarm(self.map, self.all_enemies) if ENEMY_BATCH_MODE else None
+        self.rebuild_flow()
+        self.camera.set_map(self.map.width, self.map.height)
+        self.pool = EnemyPool(self.all_enemies)
+        if self.swarm is None: self.pool.reserve(self.waves.peak())
+        self.menu_background.invalidate()
+        self.renderer.invalidate()
+        if DEBUG_MODE:
+            print("Info: mémoire de la carte : " + ", ".join(
+                f"{name} {size / 2**20:.2f} Mo" for name, size in self.map.footprint().items()))
+
+    def rebuild_flow(self):
+        self.flow = None
+        if ENEMY_PATHFINDING:
+            # La grille de navigation ne lit que les bits de collision : construite sur un thread
+            game_map = self.map
+            hitbox = pygame.Rect((0, 0), get_table().frame_size).inflate(-100, -95)
+            self.loader.submit(FlowField, game_map, NAV_CELL_SIZE, hitbox.size,
+                               finish=lambda flow: setattr(self, 'flow', flow) if self.map is game_map else None)
+
+    # --- RÉGLAGES À CHAUD (config.py) ---
+    def watch_settings(self):
+        """Ce qu'il faut refaire quand un réglage change ; le reste est relu à chaque tick."""
+        depends = self.config.depends
+        depends(('ZOOM_FACTOR', 'MAP_FILE', 'COLLISION_FILE', 'MAP_TILED', 'MAP_TILE_SIZE', 'COLLISION_RLE'),
+                self.reload_map)
+        depends(('PLAYER_SCALE', 'SKINS', 'DEFAULT_SKIN', 'PLAYER_LEVEL_SKINS', 'SPRITE_RLE', 'HIT_FLASH_COLOR'),
+                self.reload_sprites)
+        depends(('DEBUG_MODE', 'DEBUG_TILE_SIZE', 'DEBUG_TILE_BUDGET_MB'), self.reload_debug)
+        depends(('ENEMY_PATHFINDING', 'NAV_CELL_SIZE'), self.rebuild_flow)
+        depends(('ENEMY_BATCH_MODE', 'GRID_CELL_SIZE'), self.reload_enemies)
+        depends(('CROWD_SEPARATION', 'CROWD_RADIUS', 'CROWD_PUSH'), self.reload_crowd)
+        depends(('HEALTH_BAR_BUCKETS', 'HEALTH_BAR_MOB_HEIGHT'), clear_health_bars)
+        depends(('CAMERA_ZOOM', 'CAMERA_ZOOM_MIN', 'CAMERA_ZOOM_MAX'), self.reload_camera)
+
+    def reload_map(self):
+        """ZOOM_FACTOR : même carte réagrandie (PNG source relu) ; MAP_FILE : autre carte.
+
+        La partie continue : sur la même carte, joueur et ennemis sont replacés à l'échelle.
+        """
+        self.preloaded.clear()  # Préparées avec les anciens réglages
+        mobs, width = self.live_enemies(), self.map.width
+        if not self.config.changed & {'MAP_FILE', 'COLLISION_FILE', 'MAP_TILED', 'MAP_TILE_SIZE'}:
+            self.map.rescale()
+            self.set_map(self.map)
+        elif MAP_TILED:
+            self.set_map(TiledGameMap())
+        else:
+            self.load_map(MAP_FILE, COLLISION_FILE)
+        if self.config.changed & {'MAP_FILE', 'COLLISION_FILE'}:
+            self.enter_map()
+        else:
+            self.keep_run(mobs, self.map.width / width)
+
+    def reload_sprites(self):
+        """PLAYER_SCALE, skins : frames redécoupées depuis les planches déjà décodées.
+
+        Seuls le skin par défaut et les variantes des ennemis en vie sont refaits tout de
+        suite ; les autres skins, teintes et flashs suivent en arrière-plan.
+        """
+        sprite_cache.clear_cache()
+        mobs = self.live_enemies()
+        self.set_map(self.map)  # Taille des mobs : grille de navigation et réserve à refaire
+        self.keep_run(mobs)
+        self.load_skins(wait=False)
+
+    def reload_debug(self):
+        self.map.rebuild_debug()
+        self.renderer.invalidate()
+
+    def reload_enemies(self):
+        mobs = self.live_enemies()
+        self.set_map(self.map)
+        self.keep_run(mobs)
+
+    def reload_crowd(self):
+        self.crowd = Crowd() if CROWD_SEPARATION else None
+
+    def reload_camera(self):
+        self.camera.set_zoom(CAMERA_ZOOM)
+        self.renderer.invalidate()
+
+    def preload_map(self, map_file, collision_file):
+        """Prépare une carte en arrière-plan ; change_map la prendra sans attendre si elle est prête."""
+        key = (map_file, collision_file)
+        if key not in self.preloaded:
+            self.preloaded[key] = self.loader.submit(prepare_map, map_file, collision_file)
+        return self.preloaded[key]
+
+    def load_map(self, map_file, collision_file):
+        future = self.preload_map(map_file, collision_file)
+        self.wait_loading("Chargement de la carte...", future)
+        del self.preloaded[(map_file, collision_file)]
+        self.set_map(GameMap(prepared=future.result()))
+        self.wait_loading("Chargement de la carte...")
+
+    def change_map(self, map_file, collision_file):
+        self.load_map(map_file, collision_file)
+        self.enter_map()
+
+    def next_map(self):
+        """Carte suivante de MAPS, puis préchargement de celle d'après."""
+        self.map_index = (self.map_index + 1) % len(MAPS)
+        self.change_map(*MAPS[self.map_index])
+        self.preload_map(*MAPS[(self.map_index + 1) % len(MAPS)])
+
+    # --- PARTIE EN COURS APRÈS UNE RECONSTRUCTION ---
+    def live_enemies(self):
+        """Ennemis vivants (bas du sprite, PV, arguments de create_enemy), avant de refaire leur conteneur."""
+        mobs = []
+        for mob in self.all_enemies:
+            # SwarmEnemy n'a pas d'animateur : l'essaim dessine tout avec la table par défaut
+            key = mob.anim.table.key if self.swarm is None else (None, None, None)
+            mobs.append((mob.x, mob.y, mob.health, {'max_health': mob.max_health, 'damage': mob.damage,
+                                                   'xp_reward': mob.xp_reward, 'skin': key[0], 'tint': key[2]}))
+        return mobs
+
+    def keep_run(self, mobs, ratio=1.0):
+        """Même carte reconstruite (échelle, sprites, grille, mode des ennemis) : la partie continue.
+
+        Joueur et ennemis vivants sont replacés (positions multipliées par ratio) ; niveau,
+        vague, apparitions à venir et compteurs ne bougent pas.
+        """
+        self.combat.reset()  # Attaques en cours : elles interrogent l'ancienne grille
+        x, y = self.player.hitbox.center
+        self.player.place(x * ratio, y * ratio)
+        for x, y, health, stats in mobs:
+            mob = self.create_enemy(x * ratio, y * ratio, **stats)
+            if self.swarm is not None: self.swarm.health[mob.index] = health
+            else: mob.health = health
+        self.camera.follow(self.player.hitbox.center, snap=True)
+
+    def enter_map(self):
+        """Autre carte en cours de partie : le joueur repart du départ, la vague en cours recommence."""
+        self.combat.reset()
+        x, y = self.start_position()
+        self.player.place(x, y - self.player.rect.height // 2)
+        self.spawn_wave()
+        self.camera.follow(self.player.hitbox.center, snap=True)
+
+    def wait_loading(self, label, future=None):
+        """Attend un job (ou tous) : la fenêtre reste réactive et affiche la progression.
+
+        Les événements sont lus directement (pas via self.controls) : l'attente ne
+        compte pas dans un enregistrement de partie.
+        """
+        while not (self.loader.ready(future) if future is not None else not self.loader.jobs):
+            if self.loader.poll(): continue
+            if self.headless:
+                self.loader.wait_any()
+                continue
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.loader.shutdown()
+                    pygame.quit()
+                    sys.exit()
+            self.draw_loading(label)
+            self.clock.tick(FPS)
+        self.loader.poll()
+
+    def draw_loading(self, label):
+        self.screen.fill(COLOR_BG)
+        txt = render_text(self.font, label, COLOR_TEXT)
+        self.screen.blit(txt, txt.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)))
+        bar = pygame.Rect(0, 0, SCREEN_WIDTH // 2, UI_BAR_HEIGHT)
+        bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30)
+        self.ui.show_bar(self.screen, self.loader.done, max(self.loader.total, 1), bar, XP_COLOR)
+        pygame.display.flip()
+
+    @property
+    def time_ms(self):
+        """Temps de jeu en ms, utilisé à la place de pygame.time.get_ticks() (cooldowns)."""
+        return self.ticks * TICK_MS
+
+    def start_position(self):
+        return self.map.width // 2, self.map.height - 330
+
     def start_game(self):
-        start_x = self.map.width // 2
-        start_y = self.map.height - 330
-        self.player = Player(start_x, start_y)
+        self.player = Player(*self.start_position(), self.controls)
+        self.combat.reset()
+        self.stats.reset(self.player)
+        # Les ennemis restants retournent dans la réserve
+        if self.swarm is not None: self.swarm.clear()
+        else: self.pool.release_all()
         self.all_enemies.empty()
         self.wave = 1
         self.spawn_wave()
 
     def spawn_wave(self):
-        if self.wave == 1:
-            # XP REWARD AJOUTÉ (20)
-            for i in range(3):
-                mob = Enemy(400 + (i * 40), 328, max_health=100, damage=5, xp_reward=20)
-                self.all_enemies.add(mob)
-        elif self.wave == 2:
-            # XP REWARD AJOUTÉ (40)
-            for i in range(5):
-                mob = Enemy(350 + (i * 40), 328, max_health=150, damage=10, xp_reward=40)
-                self.all_enemies.add(mob)
-        elif self.wave == 3:
-            # XP REWARD BOSS (500)
-            boss = Enemy(444, 328, max_health=500, damage=20, xp_reward=500)
-            self.all_enemies.add(boss)
+        # Les ennemis de la vague apparaissent au fil des ticks (voir waves.json)
+        self.waves.begin(self.wave)
+
+    def create_enemy(self, x, y, **stats):
+        # En mode groupé, l'ennemi est une vue sur les tableaux du swarm
+        if self.swarm is not None:
+            return self.swarm.spawn(x, y, **stats)
+        return self.pool.acquire(x, y, **stats)
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.controls.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3: self.profiler.toggle()
+                if event.key == pygame.K_F4: self.profiler.dump()
+                if event.key == pygame.K_F5 and DEBUG_MODE: self.next_map()
             
             if self.state == 'menu':
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if self.play_button.collidepoint(event.pos):
                         self.state = 'game'
-                        self.update_camera() 
+                        self.camera.follow(self.player.hitbox.center, snap=True)
 
             elif self.state == 'game':
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_a:
-                        self.player.trigger_attack()
-                        self.check_attack_hit()
+                        self.attack()
                     if event.key == pygame.K_ESCAPE:
                         self.state = 'menu'
+                if event.type == pygame.MOUSEWHEEL and event.y:
+                    self.camera.zoom_by(CAMERA_ZOOM_STEP ** event.y)
+                    self.renderer.invalidate()
 
             elif self.state == 'game_over':
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
                         self.start_game()
                         self.state = 'game'
+                        self.camera.follow(self.player.hitbox.center, snap=True)
                     if event.key == pygame.K_ESCAPE:
                         self.state = 'menu'
 
-    def check_attack_hit(self):
-        attack_rect = self.player.hitbox.copy()
-        range_attack = 50 
-        if self.player.facing == 'right': attack_rect.x += range_attack
-        elif self.player.facing == 'left': attack_rect.x -= range_attack
-        elif self.player.facing == 'down': attack_rect.y += range_attack
-        elif self.player.facing == 'up': attack_rect.y -= range_attack
+    def attack(self):
+        # Les coups tombent pendant la fenêtre de frappe de l'animation (CombatSystem.update)
+        if self.player.is_attacking: return
+        self.player.trigger_attack()
+        self.combat.start_attack(self.player, self.all_enemies, PLAYER_ATTACK_REACH)
 
-        if DEBUG_MODE: self.debug_attack_rect = attack_rect
+    def on_kills(self, events):
+        # XP donnée au joueur pour les mobs qu'il a tués
+        for event in events:
+            if event.killer is self.player:
+                self.player.gain_xp(event.xp)
 
-        for mob in self.all_enemies:
-            if attack_rect.colliderect(mob.hitbox):
-                mob.take_damage(self.player.damage)
-                # DONNER XP SI MORT
-                if mob.health <= 0:
-                    self.player.gain_xp(mob.xp_reward)
-
-    def update_camera(self):
-        target_x = self.player.rect.centerx - SCREEN_WIDTH // 2
-        target_y = self.player.rect.centery - SCREEN_HEIGHT // 2
-        target_x = max(0, min(target_x, self.map.width - SCREEN_WIDTH))
-        target_y = max(0, min(target_y, self.map.height - SCREEN_HEIGHT))
-        if self.map.width < SCREEN_WIDTH: target_x = -(SCREEN_WIDTH - self.map_width) // 2
-        if self.map.height < SCREEN_HEIGHT: target_y = -(SCREEN_HEIGHT - self.map_height) // 2
-        self.camera_x = target_x
-        self.camera_y = target_y
-
-    def update_menu_camera(self):
-        self.menu_cam_x += self.menu_cam_speed_x
-        self.menu_cam_y += self.menu_cam_speed_y
-        if self.menu_cam_x <= 0 or self.menu_cam_x >= self.map.width - SCREEN_WIDTH: self.menu_cam_speed_x *= -1
-        if self.menu_cam_y <= 0 or self.menu_cam_y >= self.map.height - SCREEN_HEIGHT: self.menu_cam_speed_y *= -1
-
-    def draw_game_world(self, cam_x, cam_y):
-        self.screen.blit(self.map.image, (-cam_x, -cam_y))
-        if DEBUG_MODE and self.map.has_collisions: self.screen.blit(self.map.debug_surface, (-cam_x, -cam_y))
-
-        draw_rect_player = self.player.rect.copy()
-        draw_rect_player.x -= cam_x
-        draw_rect_player.y -= cam_y
-        self.screen.blit(self.player.image, draw_rect_player)
-        
-        for mob in self.all_enemies:
-            draw_rect_mob = mob.rect.copy()
-            draw_rect_mob.x -= cam_x
-            draw_rect_mob.y -= cam_y
-            self.screen.blit(mob.image, draw_rect_mob)
-            # Barre vie mob
-            mob.draw_health(self.screen, cam_x, cam_y)
-
-            if DEBUG_MODE:
-                hb_mob = mob.hitbox.copy()
-                hb_mob.x -= cam_x
-                hb_mob.y -= cam_y
-                pygame.draw.rect(self.screen, (0, 0, 255), hb_mob, 2)
+    def draw_game_world(self):
+        camera = self.camera
+        surface = camera.target(self.screen)
+        cam_x, cam_y = camera.offset
+        # Seuls les mobs proches de la caméra sont dessinés (la file de rendu les trie en y)
+        view = camera.visible.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+        self.map.prefetch(view)
+        visible = self.all_enemies.sprites_in_rect(view)
+        if self.swarm is None:
+            for mob in visible: pose(mob)  # Image / rect calculés seulement pour les mobs affichés
+
+        # Zones écran des éléments mobiles : si la caméra est fixe, on ne reconstruit que celles-ci
+        if camera.view is not None: self.renderer.invalidate()  # Vue zoomée : agrandie en entier
+        rects = [self.player.rect.move(-cam_x, -cam_y), self.ui.area]
+        for mob in visible:
+            r = mob.rect
+            rects.append(pygame.Rect(r.x - cam_x, r.y - cam_y - 10, r.w, r.h + 10))  # + barre de vie
+        if DEBUG_MODE:
+            rects.extend(rect.move(-cam_x, -cam_y) for rect in self.combat.debug_rects)
+        dirty = self.renderer.plan(cam_x, cam_y, rects)
+        if dirty is None:
+            self.renderer.restore(self.map, cam_x, cam_y, surface=surface)
+        else:
+            for rect in dirty:
+                self.renderer.restore(self.map, cam_x, cam_y, rect)
+
+        queue = self.render_queue
+        queue.submit_sprite(self.player)
+        queue.submit_sprites(visible)
+        queue.submit_health(visible)  # Barres vie mobs
+        queue.flush(surface, (cam_x, cam_y))
 
         if DEBUG_MODE:
-            hb_player = self.player.hitbox.copy()
-            hb_player.x -= cam_x
-            hb_player.y -= cam_y
-            pygame.draw.rect(self.screen, (0, 0, 255), hb_player, 2)
-            if self.debug_attack_rect:
-                draw_att = self.debug_attack_rect.copy()
-                draw_att.x -= cam_x
-                draw_att.y -= cam_y
-                pygame.draw.rect(self.screen, (255, 0, 0), draw_att, 2)
-                self.debug_attack_rect = None
+            camera.draw_rects(surface, (0, 0, 255), [mob.hitbox for mob in visible] + [self.player.hitbox], 2)
+            camera.draw_rects(surface, (255, 0, 0), self.combat.debug_rects, 2)
+        camera.present(self.screen)
+
+    def update_game(self):
+        """Un tick de simulation (joueur, ennemis, vagues), sans rendu."""
+        self.ticks += 1
+        with self.profiler.section('player_update'):
+            self.player.update(self.map)
+        
+        if self.flow is not None:
+            with self.profiler.section('pathfinding'):
+                self.flow.update(*self.player.hitbox.center)
+
+        with self.profiler.section('enemies_update'):
+            if self.swarm is not None:
+                self.swarm.step(self.player, self.time_ms, self.flow, self.crowd, self.combat)
+            else:
+                if self.crowd is not None: self.crowd.apply(self.all_enemies)
+                self.all_enemies.update(self.player, self.map, self.time_ms, self.flow, self.combat)
+                advance_all(self.all_enemies)
+
+        # Coups des attaques en cours puis dégâts / morts / XP, par lots
+        with self.profiler.section('combat'):
+            self.combat.update()
+            self.combat.flush()
+
+        if self.player.health <= 0:
+            self.state = 'game_over'
+        
+        with self.profiler.section('waves'):
+            self.waves.update(self.create_enemy)
+
+        if len(self.all_enemies) == 0 and self.waves.idle and self.wave <= self.waves.count:
+            self.wave += 1
+            self.spawn_wave()
+
+    def tick(self):
+        """Événements + un tick de simulation, sans rendu.
+
+        En jeu, run() lit les entrées une fois par tick (et non par frame) : la partie ne
+        dépend que de la suite des entrées, ce qui permet de la rejouer à l'identique.
+        Hors jeu (menu, game over), c'est le même appel que dans run() : événements seuls.
+        """
+        playing = self.state == 'game'
+        with self.profiler.section('handle_events'):
+            self.handle_events()
+        if playing and self.state == 'game':
+            self.update_game()
 
     def run(self):
         while self.running:
-            self.handle_events()
+            if CONFIG_WATCH: self.config.poll(pygame.time.get_ticks())
+            if self.loader.jobs: self.loader.poll()  # Jobs lancés en cours de partie (réglages, cartes)
+            if self.state != 'game':
+                with self.profiler.section('handle_events'):
+                    self.handle_events()
             
             if self.state == 'menu':
-                self.update_menu_camera()
-                self.draw_game_world(self.menu_cam_x, self.menu_cam_y)
-                
-                small_w = SCREEN_WIDTH // 10
-                small_h = SCREEN_HEIGHT // 10
-                current = self.screen.copy()
-                small = pygame.transform.smoothscale(current, (small_w, small_h))
-                blurred = pygame.transform.smoothscale(small, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.screen.blit(blurred, (0, 0))
+                self.camera.pan(self.clock.get_time())
+                with self.profiler.section('menu_background'):
+                    self.menu_background.draw(self.screen, self.map, *self.camera.offset)
                 
                 mouse_pos = pygame.mouse.get_pos()
                 btn_color = COLOR_BUTTON_HOVER if self.play_button.collidepoint(mouse_pos) else COLOR_BUTTON
                 pygame.draw.rect(self.screen, btn_color, self.play_button, border_radius=12)
                 pygame.draw.rect(self.screen, (255,255,255), self.play_button, 2, border_radius=12)
                 
-                txt = self.font.render("JOUER", True, COLOR_TEXT)
+                txt = render_text(self.font, "JOUER", COLOR_TEXT)
                 self.screen.blit(txt, txt.get_rect(center=self.play_button.center))
 
             elif self.state == 'game':
-                self.player.update(self.map)
-                
-                if self.player.health <= 0:
-                    self.state = 'game_over'
-                
-                for mob in self.all_enemies:
-                    mob.update(self.player, self.map)
-                
-                if len(self.all_enemies) == 0 and self.wave < 4:
-                    self.wave += 1
-                    self.spawn_wave()
-                
-                self.update_camera()
-                self.screen.fill(COLOR_BG)
-                self.draw_game_world(self.camera_x, self.camera_y)
+                # Pas de temps fixe : la logique avance par ticks de TICK_MS, quel que soit le rendu
+                self.lag += self.clock.get_time()
+                steps = 0
+                while self.lag >= TICK_MS and steps < MAX_CATCHUP_TICKS and self.state == 'game':
+                    self.tick()
+                    self.lag -= TICK_MS
+                    steps += 1
+                if steps == MAX_CATCHUP_TICKS: self.lag = 0  # Trop en retard : on abandonne le rattrapage
+
+                with self.profiler.section('update_camera'):
+                    self.camera.follow(self.player.hitbox.center, self.clock.get_time())
+                if self.profiler.enabled: self.renderer.invalidate()  # L'overlay couvre l'écran
+                with self.profiler.section('draw_game_world'):
+                    self.draw_game_world()
                 
                 # AFFICHER L'UI
-                self.ui.display(self.player)
+                with self.profiler.section('ui_display'):
+                    self.ui.display(self.player)
 
             elif self.state == 'game_over':
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.fill((50, 0, 0))
-                overlay.set_alpha(180)
-                self.screen.blit(overlay, (0,0))
+                self.screen.blit(self.gameover_overlay, (0,0))
                 
-                txt_go = self.font_gameover.render("GAME OVER", True, (255, 0, 0))
+                txt_go = render_text(self.font_gameover, "GAME OVER", (255, 0, 0))
                 self.screen.blit(txt_go, txt_go.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50)))
                 
-                txt_restart = self.font.render("Appuie sur 'R' pour Recommencer", True, (255, 255, 255))
+                txt_restart = render_text(self.font, "Appuie sur 'R' pour Recommencer", (255, 255, 255))
                 self.screen.blit(txt_restart, txt_restart.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50)))
 
-            pygame.display.flip()
+            self.profiler.draw(self.screen)
+            with self.profiler.section('display_flip'):
+                if self.state == 'game':
+                    self.renderer.present()
+                else:
+                    pygame.display.flip()
+                    self.renderer.invalidate()
+            self.profiler.end_frame()
             self.clock.tick(FPS)
         
         pygame.quit()
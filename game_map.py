@@ -1,70 +1,219 @@
 import pygame
 import os
+from collections import OrderedDict
+import numpy as np
 from settings import *
+from collision import CollisionGrid, RunLengthGrid
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+def collision_storage(grid):
+    """Mêmes murs au format de COLLISION_RLE : plages par ligne ou bits."""
+    if COLLISION_RLE and not isinstance(grid, RunLengthGrid):
+        return RunLengthGrid.from_grid(grid)
+    if not COLLISION_RLE and isinstance(grid, RunLengthGrid):
+        bits = CollisionGrid.from_packed(grid.packed_bits(), grid.width, grid.height, (grid.world_w, grid.world_h))
+        bits.sdf = grid.sdf
+        return bits
+    return grid
+
+
+def empty_collision(size):
+    """Carte sans fichier de collisions : une seule case libre étirée sur tout le monde."""
+    return CollisionGrid(np.zeros((1, 1), dtype=bool), world_size=size)
+
+
+def debug_tile(walls):
+    """Overlay rouge semi-transparent des murs walls (booléens lignes x colonnes)."""
+    h, w = walls.shape
+    rgba = np.zeros((h, w, 4), dtype=np.uint8)
+    rgba[walls] = (255, 0, 0, 100)
+    return pygame.image.frombytes(rgba.tobytes(), (w, h), 'RGBA').convert_alpha()
+
+
+class DebugOverlay:
+    """Overlay debug des murs, construit à la demande par tuiles de DEBUG_TILE_SIZE pixels monde.
+
+    Seules les tuiles passées à l'écran existent ; au-delà de DEBUG_TILE_BUDGET_MB,
+    les moins récemment dessinées sont libérées.
+    """
+
+    def __init__(self, collision, size):
+        self.collision = collision
+        self.width, self.height = size
+        self.tiles = OrderedDict()  # (tx, ty) -> surface
+        self.bytes = 0
+
+    def clear(self):
+        self.tiles.clear()
+        self.bytes = 0
+
+    def nbytes(self):
+        return self.bytes
+
+    def tile(self, tx, ty):
+        tile = self.tiles.get((tx, ty))
+        if tile is not None:
+            self.tiles.move_to_end((tx, ty))
+            return tile
+        ts = DEBUG_TILE_SIZE
+        rect = pygame.Rect(tx * ts, ty * ts, ts, ts).clip(0, 0, self.width, self.height)
+        tile = self.tiles[(tx, ty)] = debug_tile(self.collision.walls_in(rect))
+        self.bytes += surface_bytes(tile)
+        # On garde toujours la tuile la plus récente, même si elle dépasse seule le budget
+        while self.bytes > DEBUG_TILE_BUDGET_MB * 2**20 and len(self.tiles) > 1:
+            _, old = self.tiles.popitem(last=False)
+            self.bytes -= surface_bytes(old)
+        return tile
+
+    def blit(self, surface, dest, area):
+        """Dessine la zone monde area de l'overlay en dest (comme surface.blit(overlay, dest, area))."""
+        inside = area.clip(0, 0, self.width, self.height)
+        if inside.w == 0 or inside.h == 0: return
+        ts = DEBUG_TILE_SIZE
+        for ty in range(inside.top // ts, (inside.bottom - 1) // ts + 1):
+            for tx in range(inside.left // ts, (inside.right - 1) // ts + 1):
+                part = pygame.Rect(tx * ts, ty * ts, ts, ts).clip(inside)
+                pos = (dest[0] + part.x - area.x, dest[1] + part.y - area.y)
+                surface.blit(self.tile(tx, ty), pos, part.move(-tx * ts, -ty * ts))
+
+
+def prepare_map(map_file=None, collision_file=None):
+    """Partie lourde du chargement (décodage, agrandissement, masque) sans convert() :
+    peut tourner sur un thread d'AssetLoader. GameMap(prepared=...) termine le travail."""
+    if map_file is None: map_file = MAP_FILE
+    if collision_file is None: collision_file = COLLISION_FILE
+    data = {'map_file': map_file, 'collision_file': collision_file}
+    # Chargement de l'image visuelle (LA CARTE)
+    img_path = os.path.join(BASE_DIR, map_file)
+    try:
+        raw_image = pygame.image.load(img_path)
+        # Redimensionnement selon le ZOOM_FACTOR
+        width = int(raw_image.get_width() * ZOOM_FACTOR)
+        height = int(raw_image.get_height() * ZOOM_FACTOR)
+        data['image'] = pygame.transform.scale(raw_image, (width, height))
+    except FileNotFoundError:
+        data['image'] = None
+        width, height = 2000, 2000
+    data['size'] = (width, height)
+
+    # Chargement des collisions (PHYSIQUE)
+    # Cette partie doit s'exécuter PEU IMPORTE le Debug Mode
+    col_path = os.path.join(BASE_DIR, collision_file)
+    data['collision'] = None
+    if os.path.exists(col_path):
+        # Masque à la résolution source : CollisionGrid le lit à l'échelle du monde (au pixel
+        # près comme transform.scale), sans image ni masque agrandis. L'overlay debug est
+        # construit plus tard, seulement là où la caméra passe (DebugOverlay).
+        mask = pygame.mask.from_threshold(pygame.image.load(col_path), (0, 0, 0), (2, 2, 2))
+        grid = CollisionGrid.from_mask(mask, build_sdf=COLLISION_SDF, world_size=(width, height))
+        data['collision'] = collision_storage(grid)
+    return data
+
 
 class GameMap:
-    def __init__(self):
-        self.load_map_data()
-
-    def load_map_data(self):
-        # Chargement de l'image visuelle (LA CARTE)
-        img_path = os.path.join(BASE_DIR, MAP_FILE)
-        try:
-            raw_image = pygame.image.load(img_path).convert()
-            # Redimensionnement selon le ZOOM_FACTOR
-            self.width = int(raw_image.get_width() * ZOOM_FACTOR)
-            self.height = int(raw_image.get_height() * ZOOM_FACTOR)
-            self.image = pygame.transform.scale(raw_image, (self.width, self.height))
-        except FileNotFoundError:
-            print(f"ERREUR: Impossible de trouver {MAP_FILE}")
+    def __init__(self, pack=None, prepared=None):
+        if pack is not None and 'map' in pack:
+            self.load_from_pack(pack)
+        else:
+            self.load_map_data(prepared)
+
+    def load_from_pack(self, pack):
+        # Le pack évite le décodage PNG, pas la copie : convert() recopie la carte au format
+        # de l'écran. Blittée telle quelle (RGBX), chaque frame coûterait deux fois plus cher.
+        self.map_file, self.collision_file = MAP_FILE, COLLISION_FILE
+        self.image = pack.surface('map').convert()
+        self.width, self.height = self.image.get_size()
+        self.has_collisions = 'collision' in pack
+        if self.has_collisions:
+            self.collision = collision_storage(pack.collision((self.width, self.height)))
+        else:
+            self.collision = empty_collision((self.width, self.height))
+        self.debug = DebugOverlay(self.collision, (self.width, self.height))
+
+    def load_map_data(self, prepared=None):
+        """Fin du chargement sur le thread principal : seulement les convert()."""
+        data = prepared if prepared is not None else prepare_map()
+        self.map_file, self.collision_file = data['map_file'], data['collision_file']
+        self.width, self.height = data['size']
+        if data['image'] is not None:
+            self.image = data['image'].convert()
+        else:
+            print(f"ERREUR: Impossible de trouver {data['map_file']}")
             # Fallback (carré noir si pas d'image)
-            self.image = pygame.Surface((2000, 2000))
-            self.width, self.height = 2000, 2000
-
-        # Chargement des collisions (PHYSIQUE)
-        # Cette partie doit s'exécuter PEU IMPORTE le Debug Mode
-        col_path = os.path.join(BASE_DIR, COLLISION_FILE)
-        
-        if os.path.exists(col_path):
-            # A. On charge l'image
-            raw_col = pygame.image.load(col_path).convert_alpha()
-            scaled_col = pygame.transform.scale(raw_col, (self.width, self.height))
-            
-            # B. On calcule le masque (OBLIGATOIRE POUR QUE LES MURS EXISTENT)
-            self.collision_mask = pygame.mask.from_threshold(
-                scaled_col, (0, 0, 0), (2, 2, 2)
-            )
-            self.has_collisions = True
-            print("Info: Collisions chargées.")
+            self.image = pygame.Surface((self.width, self.height)).convert()
 
-            # C. Génération visuelle (OPTIONNEL - SEULEMENT SI DEBUG EST TRUE)
-            # C'est uniquement l'image rouge qui dépend du debug, pas la physique.
-            if DEBUG_MODE:
-                self.debug_surface = self.collision_mask.to_surface(
-                    setcolor=(255, 0, 0, 100), # Rouge semi-transparent
-                    unsetcolor=(0, 0, 0, 0)    # Transparent
-                )
+        self.has_collisions = data['collision'] is not None
+        if self.has_collisions:
+            self.collision = data['collision']
+            print("Info: Collisions chargées.")
         else:
-            self.collision_mask = None
-            self.has_collisions = False
+            self.collision = empty_collision((self.width, self.height))
             print("Attention: Pas de fichier collision trouvé.")
+        self.debug = DebugOverlay(self.collision, (self.width, self.height))
+
+    # --- RENDU (même interface que TiledGameMap) ---
+    def blit_area(self, surface, dest, area):
+        """Dessine la zone monde area de la carte (+ overlay debug) en dest sur surface."""
+        surface.blit(self.image, dest, area)
+        if DEBUG_MODE and self.has_collisions:
+            self.debug.blit(surface, dest, area)
+
+    def rescale(self):
+        """Nouveau ZOOM_FACTOR : carte réagrandie depuis le PNG source, redécodé (rien n'est
+        gardé en mémoire entre deux changements).
+
+        Les collisions sont à la résolution source (CollisionGrid les lit à l'échelle
+        du monde) : seule leur correspondance avec le monde change, sans relire leur PNG.
+        """
+        source = pygame.image.load(os.path.join(BASE_DIR, self.map_file))
+        self.width = int(source.get_width() * ZOOM_FACTOR)
+        self.height = int(source.get_height() * ZOOM_FACTOR)
+        self.image = pygame.transform.scale(source, (self.width, self.height)).convert()
+        if self.has_collisions:
+            self.collision = collision_storage(self.collision.rescaled((self.width, self.height)))
+        else:
+            self.collision = empty_collision((self.width, self.height))
+        self.debug = DebugOverlay(self.collision, (self.width, self.height))
+
+    def rebuild_debug(self):
+        """Après un changement de DEBUG_MODE : tuiles debug libérées, refaites à la demande."""
+        self.debug.clear()
+
+    def footprint(self):
+        """Mémoire de chaque composant de la carte, en octets."""
+        return {'image': surface_bytes(self.image),
+                'collision': self.collision.nbytes(),
+                'debug': self.debug.nbytes()}
+
+    def overview(self, size):
+        """Carte entière réduite à size (fond du menu)."""
+        return pygame.transform.smoothscale(self.image, size)
+
+    def prefetch(self, rect):
+        pass  # Tout est déjà en mémoire
 
     def check_wall(self, x, y):
-        """Vérifie si un point (x, y) est dans un mur."""
-        
-        # 1. Vérifie les limites de la carte (Bords de l'écran)
-        if x < 0 or x >= self.width or y < 0 or y >= self.height:
-            return True
-            
-        # 2. Si pas de fichier collision, on ne vérifie pas l'intérieur
-        if not self.has_collisions:
-            return False
-        
-        # 3. Vérifie le masque
-        try:
-            if self.collision_mask.get_at((int(x), int(y))):
-                return True
-        except IndexError:
-            return True
-            
-        return False
\ No newline at end of file
+        """Vérifie si un point (x, y) est dans un mur (les bords de la carte comptent comme des murs)."""
+        return self.collision.is_wall(x, y)
+
+    # --- REQUÊTES GROUPÉES (voir CollisionGrid) ---
+    def walls_at(self, xs, ys):
+        return self.collision.walls_at(xs, ys)
+
+    def any_wall(self, xs, ys):
+        return self.collision.any_wall(xs, ys)
+
+    def any_wall_in(self, rect):
+        return self.collision.any_wall_in(rect)
+
+    def max_shift(self, xs, ys, dx, dy):
+        return self.collision.max_shift(xs, ys, dx, dy)
+
+    def box_walls(self, w, h):
+        return self.collision.box_walls(w, h)
+
+    def move_box(self, rect, dx, dy):
+        return self.collision.move_box(rect, dx, dy)
@@ -0,0 +1,37 @@
+import argparse
+import time
+from game import Game
+from controls import ScriptedInput
+
+def simulate(game, ticks):
+    """Avance la partie de ticks pas, sans rendu. Recommence dès qu'une partie est finie."""
+    stats = {'games': 1, 'deaths': 0, 'waves_cleared': 0}
+    game.state = 'game'
+    for _ in range(ticks):
+        wave = game.wave
+        game.tick()
+        if game.wave > wave:
+            stats['waves_cleared'] += 1
+        if game.state == 'game_over' or (game.wave > game.waves.count and len(game.all_enemies) == 0):
+            if game.state == 'game_over': stats['deaths'] += 1
+            game.start_game()
+            game.state = 'game'
+            stats['games'] += 1
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation sans fenêtre, aussi vite que possible")
+    parser.add_argument("--ticks", type=int, default=10000)
+    args = parser.parse_args()
+
+    game = Game(headless=True, controls=ScriptedInput())
+    t0 = time.perf_counter()
+    stats = simulate(game, args.ticks)
+    elapsed = time.perf_counter() - t0
+    print(f"{args.ticks} ticks en {elapsed:.2f} s -> {args.ticks / elapsed:,.0f} ticks/s")
+    print(f"parties: {stats['games']} | morts: {stats['deaths']} | vagues terminées: {stats['waves_cleared']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,14 @@
+import argparse
 from game import Game
+from controls import KeyboardInput
+from replay import InputRecorder
 
 if __name__ == '__main__':
-    game = Game()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="FICHIER", help="enregistre les entrées (rejeu : python replay.py FICHIER)")
+    args = parser.parse_args()
+
+    controls = InputRecorder(KeyboardInput(), args.record) if args.record else None
+    game = Game(controls=controls)
+    if controls is not None: controls.attach(game)
+    game.run()
@@ -0,0 +1,56 @@
+import math
+import pygame
+from settings import *
+
+class MenuBackground:
+    """Fond flou du menu : la carte est réduite une seule fois, puis on agrandit
+    à chaque frame uniquement la partie visible."""
+
+    def __init__(self, factor=None):
+        if factor is None: factor = BLUR_INTENSITY
+        self.factor = factor
+        self.key = None
+        self.small = None
+        self.buffer = None
+
+    def invalidate(self):
+        self.key = None
+
+    def _build(self, game_map, screen_size):
+        f = self.factor
+        self.small = game_map.overview((max(1, game_map.width // f), max(1, game_map.height // f)))
+        # Zone basse résolution couvrant l'écran, +2 pixels : décalage sous-pixel et arrondi de la réduction
+        cw = min(math.ceil(screen_size[0] / f) + 2, self.small.get_width())
+        ch = min(math.ceil(screen_size[1] / f) + 2, self.small.get_height())
+        self.crop_size = (cw, ch)
+        self.buffer = pygame.Surface((cw * f, ch * f)).convert()
+        self.crop_origin = None
+        self.key = self._key(game_map, screen_size)
+
+    def _key(self, game_map, screen_size):
+        return (id(game_map), getattr(game_map, 'image', None), game_map.width, game_map.height,
+                screen_size, self.factor)
+
+    def draw(self, surface, game_map, cam_x, cam_y):
+        screen_size = surface.get_size()
+        if self._key(game_map, screen_size) != self.key:
+            self._build(game_map, screen_size)
+
+        f = self.factor
+        cw, ch = self.crop_size
+        # Caméra bornée à la carte (si elle est plus grande que l'écran) avant de choisir la zone
+        if game_map.width > screen_size[0]:
+            cam_x = min(max(cam_x, 0), game_map.width - screen_size[0])
+        if game_map.height > screen_size[1]:
+            cam_y = min(max(cam_y, 0), game_map.height - screen_size[1])
+        x0 = min(max(int(cam_x // f), 0), self.small.get_width() - cw)
+        y0 = min(max(int(cam_y // f), 0), self.small.get_height() - ch)
+        pos = (x0 * f - cam_x, y0 * f - cam_y)
+        if not pygame.Rect(pos, self.buffer.get_size()).contains(surface.get_rect()):
+            surface.fill(COLOR_BG)  # Carte plus petite que l'écran, ou bord de la carte réduite
+        # On ne réagrandit que si la zone basse résolution a bougé d'au moins un pixel
+        if (x0, y0) != self.crop_origin:
+            crop = self.small.subsurface((x0, y0, cw, ch))
+            pygame.transform.smoothscale(crop, self.buffer.get_size(), self.buffer)
+            self.crop_origin = (x0, y0)
+        surface.blit(self.buffer, pos)
@@ -0,0 +1,266 @@
+import math
+import numpy as np
+from settings import *
+
+# 8 voisins : (dy, dx) et la direction unitaire correspondante
+NEIGHBOURS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+class FlowField:
+    """Champ de directions vers le joueur, partagé par tous les ennemis.
+
+    La carte est réduite à une grille de navigation (une case = cell_size pixels,
+    bloquée si elle contient un pixel de mur, ou si une hitbox de taille agent_size
+    centrée sur la case touche un mur). Quand le joueur change de case, un parcours
+    en largeur depuis sa case donne à chaque case la direction du voisin le plus
+    proche du joueur ; un ennemi n'a plus qu'à lire sa case.
+
+    Le parcours n'avance qu'à la demande : une requête sur une case pas encore
+    atteinte le prolonge juste assez, et seules les cases des nouveaux fronts (et
+    leurs voisines) recalculent leur direction. Avec des mobs près du joueur, seul
+    leur voisinage est parcouru ; le résultat est celui d'un parcours complet.
+    """
+
+    def __init__(self, game_map, cell_size=None, agent_size=None):
+        if cell_size is None: cell_size = NAV_CELL_SIZE
+        self.cell_size = cell_size
+        self.cols = -(-game_map.width // cell_size)
+        self.rows = -(-game_map.height // cell_size)
+        shape, padded = (self.rows, self.cols), (self.rows + 2, self.cols + 2)
+        # Bordure d'une case (mur / inatteignable) : les voisins d'une zone sont de
+        # simples vues décalées de ces tableaux, sans copie
+        self._passable = np.zeros(padded, dtype=bool)
+        self.passable = self._passable[1:-1, 1:-1]
+        self.passable[:] = self._build_grid(game_map, agent_size or (cell_size, cell_size))
+        self._dist = np.full(padded, UNREACHABLE, dtype=np.int32)
+        self.dist = self._dist[1:-1, 1:-1]
+        self._reached = np.zeros(padded, dtype=bool)
+        self.reached = self._reached[1:-1, 1:-1]  # Case dont la direction est définitive
+        self.dir_x = np.zeros(shape, dtype=np.float64)
+        self.dir_y = np.zeros(shape, dtype=np.float64)
+        self.guided = np.zeros(shape, dtype=bool)  # Case avec une direction à suivre
+        # Tampons réutilisés à chaque calcul de directions (on n'en prend que la zone utile)
+        self._best = np.empty(shape, dtype=np.int32)
+        self._better = np.empty(shape, dtype=bool)
+        self._steps = [(dy, dx, dx / math.hypot(dx, dy), dy / math.hypot(dx, dy)) for dy, dx in NEIGHBOURS]
+        # Parcours en cours, en listes Python sur les indices de la grille bordée
+        w = self.cols + 2
+        self._free = self._passable.ravel().tolist()
+        self._offsets = (-w, w, -1, 1)
+        # Voisins droits libres de chaque case (aussi pour un mur : le joueur peut s'y trouver)
+        n = len(self._free)
+        self._links = [tuple(i + o for o in self._offsets if 0 <= i + o < n and self._free[i + o])
+                       for i in range(n)]
+        self._depth = []  # Distance de chaque case (-1 : pas encore atteinte)
+        self._front = []
+        self.depth = 0
+        self.target = None
+
+    def _build_grid(self, game_map, agent_size):
+        # Bande de cases par bande de cases, pour ne pas sonder toute la carte d'un coup.
+        # Zone testée par case : la case elle-même et la hitbox centrée dessus (les murs
+        # bloquent toute la hitbox, un couloir trop étroit pour elle n'est pas un chemin).
+        cs = self.cell_size
+        w, h = max(agent_size[0], cs), max(agent_size[1], cs)
+        left, top = cs // 2 - w // 2, cs // 2 - h // 2  # Coin de la zone, relatif à la case
+        xs = np.arange(left, (self.cols - 1) * cs + left + w)
+        ys = np.arange(top, (self.rows - 1) * cs + top + h)
+        walls = np.empty((len(ys), len(xs)), dtype=bool)
+        for y in range(0, len(ys), cs):
+            gx, gy = np.meshgrid(xs, ys[y:y + cs])
+            walls[y:y + cs] = game_map.walls_at(gx, gy)  # Hors carte = mur
+        blocked = np.zeros((self.rows, self.cols), dtype=bool)
+        starts = np.arange(self.cols) * cs
+        for row in range(self.rows):
+            band = walls[row * cs:row * cs + h].any(axis=0)
+            # Murs par fenêtre de w colonnes (sommes cumulées)
+            count = np.concatenate(([0], np.cumsum(band)))
+            blocked[row] = count[starts + w] > count[starts]
+        return ~blocked
+
+    def cell_of(self, x, y):
+        return int(y) // self.cell_size, int(x) // self.cell_size
+
+    # --- CALCUL DU CHAMP ---
+    def update(self, target_x, target_y):
+        """A appeler à chaque tick : ne repart de zéro que si la cible a changé de case."""
+        cell = self.cell_of(target_x, target_y)
+        if cell == self.target: return False
+        self.target = cell
+        self._reset(cell)
+        return True
+
+    def _reset(self, cell):
+        self._dist.fill(UNREACHABLE)
+        self._reached.fill(False)
+        self.guided.fill(False)
+        self._depth = [-1] * len(self._free)
+        self._front = []
+        self.depth = 0
+        r, c = cell
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            start = (r + 1) * (self.cols + 2) + c + 1
+            self._depth[start] = 0
+            self._front = [start]
+            self._store([start], [0])
+
+    def _extend(self, cells):
+        """Prolonge le parcours jusqu'à atteindre cells (indices de la grille bordée), ou jusqu'au bout.
+
+        Parcours en largeur 4-connexe (chaque case atteinte a toujours un voisin droit plus
+        proche), arrêté dès que les cases demandées ont leur direction définitive : une case
+        libre quand elle est atteinte, un mur dès qu'un de ses voisins droits l'est.
+        """
+        free, depth, offsets, links = self._free, self._depth, self._offsets, self._links
+        # Case libre qui, une fois atteinte, règle une case demandée
+        waiting = {}
+        for k in cells:
+            for key in ([k] if free[k] else [k + o for o in offsets if free[k + o]]):
+                waiting.setdefault(key, []).append(k)
+        left = len({k for ks in waiting.values() for k in ks})
+        done = set()
+        found, dists = [], []
+        front, d = self._front, self.depth
+        while front and left:
+            d += 1
+            grown = []
+            for i in front:
+                for j in links[i]:
+                    if depth[j] < 0:
+                        depth[j] = d
+                        grown.append(j)
+                        if j in waiting:
+                            for k in waiting.pop(j):
+                                if k not in done:
+                                    done.add(k)
+                                    left -= 1
+            found += grown
+            dists += [d] * len(grown)
+            front = grown
+        self._front, self.depth = front, d
+        if found:
+            self._store(found, dists)
+
+    def _store(self, found, dists):
+        # Distances des nouvelles cases, puis directions de la zone qu'elles touchent
+        w = self.cols + 2
+        found = np.array(found, dtype=np.intp)
+        self._dist.ravel()[found] = dists
+        reached = self._reached.ravel()
+        reached[found] = True
+        for o in self._offsets:
+            # Un mur voisin d'une case atteinte a déjà son voisin le plus proche
+            walls = found + o
+            reached[walls[~self._passable.ravel()[walls]]] = True
+        rows, cols = found // w - 1, found % w - 1
+        self._update_directions(max(int(rows.min()) - 1, 0), min(int(rows.max()) + 2, self.rows),
+                                max(int(cols.min()) - 1, 0), min(int(cols.max()) + 2, self.cols))
+
+    def _update_directions(self, r0, r1, c0, c1):
+        # Direction de chaque case = vers le voisin de plus petite distance.
+        # Les cases bloquées au bord d'un couloir en reçoivent une aussi : un mob dont
+        # le centre est dans une case avec un bout de mur en ressort par là.
+        dist, passable = self._dist, self._passable
+        best, better = self._best[:r1 - r0, :c1 - c0], self._better[:r1 - r0, :c1 - c0]
+        dir_x, dir_y = self.dir_x[r0:r1, c0:c1], self.dir_y[r0:r1, c0:c1]
+        np.copyto(best, self.dist[r0:r1, c0:c1])
+        dir_x.fill(0)
+        dir_y.fill(0)
+        for dy, dx, ux, uy in self._steps:
+            other = dist[r0 + 1 + dy:r1 + 1 + dy, c0 + 1 + dx:c1 + 1 + dx]
+            np.less(other, best, out=better)
+            if dy and dx:
+                # Pas de diagonale qui coupe un coin de mur
+                better &= passable[r0 + 1 + dy:r1 + 1 + dy, c0 + 1:c1 + 1]
+                better &= passable[r0 + 1:r1 + 1, c0 + 1 + dx:c1 + 1 + dx]
+            np.copyto(best, other, where=better)
+            np.copyto(dir_x, ux, where=better)
+            np.copyto(dir_y, uy, where=better)
+        guided = self.guided[r0:r1, c0:c1]
+        np.less(best, UNREACHABLE, out=guided)
+        np.greater(self.dist[r0:r1, c0:c1], NAV_DIRECT_CELLS, out=better)
+        guided &= better
+
+    # --- REQUÊTES ---
+    def direction(self, x, y, default_x, default_y):
+        """Direction à suivre depuis (x, y) ; default si la case n'a pas de chemin (ou touche le joueur)."""
+        r = int(y) // self.cell_size
+        c = int(x) // self.cell_size
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return default_x, default_y
+        if self._front and not self.reached[r, c]:
+            self._extend([(r + 1) * (self.cols + 2) + c + 1])
+        if not self.guided[r, c]:
+            return default_x, default_y
+        return float(self.dir_x[r, c]), float(self.dir_y[r, c])
+
+    def directions(self, xs, ys, default_x, default_y):
+        """Version groupée de direction() pour des tableaux de positions."""
+        r = np.clip(ys.astype(np.intp) // self.cell_size, 0, self.rows - 1)
+        c = np.clip(xs.astype(np.intp) // self.cell_size, 0, self.cols - 1)
+        if self._front:
+            missing = ~self.reached[r, c]
+            if missing.any():
+                self._extend(np.unique((r[missing] + 1) * (self.cols + 2) + c[missing] + 1).tolist())
+        guided = self.guided[r, c]
+        return np.where(guided, self.dir_x[r, c], default_x), np.where(guided, self.dir_y[r, c], default_y)
+
+    def lane_step(self, x, y, speed):
+        """Pas latéral (au plus speed) qui ramène (x, y) sur l'axe de la case suivante du chemin.
+
+        Une case n'est libre que pour une hitbox centrée dessus : un mob décalé de quelques
+        pixels (poussée de la foule, arrondis) bute sur le bord d'un couloir étroit alors
+        que sa direction est bonne. Sans chemin depuis sa case, (0, 0).
+        """
+        r = int(y) // self.cell_size
+        c = int(x) // self.cell_size
+        if not (0 <= r < self.rows and 0 <= c < self.cols and self.guided[r, c]):
+            return 0.0, 0.0
+        ux, uy = float(self.dir_x[r, c]), float(self.dir_y[r, c])
+        # Écart au centre de la case visée, sans sa composante le long de la direction
+        off_x = (c + (ux > 0) - (ux < 0) + 0.5) * self.cell_size - x
+        off_y = (r + (uy > 0) - (uy < 0) + 0.5) * self.cell_size - y
+        along = off_x * ux + off_y * uy
+        side_x, side_y = off_x - along * ux, off_y - along * uy
+        norm = math.hypot(side_x, side_y)
+        if norm > speed:
+            side_x, side_y = side_x * speed / norm, side_y * speed / norm
+        return side_x, side_y
+
+    def lane_steps(self, xs, ys, speed):
+        """Version groupée de lane_step() pour des tableaux de positions."""
+        r = ys.astype(np.intp) // self.cell_size
+        c = xs.astype(np.intp) // self.cell_size
+        inside = (r >= 0) & (r < self.rows) & (c >= 0) & (c < self.cols)
+        r, c = np.clip(r, 0, self.rows - 1), np.clip(c, 0, self.cols - 1)
+        guided = inside & self.guided[r, c]
+        ux, uy = self.dir_x[r, c], self.dir_y[r, c]
+        off_x = (c + np.sign(ux) + 0.5) * self.cell_size - xs
+        off_y = (r + np.sign(uy) + 0.5) * self.cell_size - ys
+        along = off_x * ux + off_y * uy
+        side_x, side_y = off_x - along * ux, off_y - along * uy
+        norm = np.hypot(side_x, side_y)
+        scale = np.where(norm > speed, speed / np.maximum(norm, 1e-9), 1.0)
+        return np.where(guided, side_x * scale, 0.0), np.where(guided, side_y * scale, 0.0)
+
+    def path(self, x, y):
+        """Cases (ligne, colonne) suivies depuis (x, y) jusqu'à la zone où l'on fonce tout droit.
+
+        Liste vide si la case de (x, y) n'a pas de chemin guidé (déjà près de la cible,
+        inatteignable ou hors de la grille).
+        """
+        r = int(y) // self.cell_size
+        c = int(x) // self.cell_size
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return []
+        self.direction(x, y, 0.0, 0.0)  # Prolonge le parcours jusqu'à la case si besoin
+        cells = []
+        # Chaque pas mène à une case déjà atteinte et plus proche : la boucle finit
+        while self.guided[r, c]:
+            cells.append((r, c))
+            ux, uy = float(self.dir_x[r, c]), float(self.dir_y[r, c])
+            r += (uy > 0) - (uy < 0)
+            c += (ux > 0) - (ux < 0)
+        cells.append((r, c))
+        return cells if len(cells) > 1 else []
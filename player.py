@@ -1,11 +1,12 @@
 import pygame
-import os
-import sys
 from settings import *
+from animation import Animator, get_table
+from controls import KeyboardInput
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, start_x, start_y):
+    def __init__(self, start_x, start_y, controls=None):
         super().__init__()
+        self.controls = controls if controls is not None else KeyboardInput()
         self.x = start_x
         self.y = start_y
         
@@ -18,51 +19,25 @@ class Player(pygame.sprite.Sprite):
         self.level = 1
         self.current_xp = 0
         self.max_xp = 100
+        # Gains par niveau (modifiables par les simulations d'équilibrage)
+        self.hp_per_level = LEVEL_HP_GAIN
+        self.damage_per_level = LEVEL_DAMAGE_GAIN
+        self.xp_growth = LEVEL_XP_GROWTH
         # --------------------
 
         self.facing = 'down'
         self.state = 'idle'
         self.is_attacking = False
-        self.frame_index = 0
-        self.animation_speed = 0.2
         
-        self.load_sprites()
-        self.image = self.anims_walk['down'][0]
+        self.anim = Animator(get_table(self.skin_for_level(), idle_speed=0.2))
+        self.image = self.anim.clip.frames[0]
         self.rect = self.image.get_rect()
         self.rect.midbottom = (self.x, self.y)
         self.hitbox = self.rect.inflate(-100, -95)
 
-    def load_sprites(self):
-        path_walk = os.path.join(SPRITE_DIR, WALK_SPRITE)
-        sheet_walk = pygame.image.load(path_walk).convert_alpha()
-        self.anims_walk = self.cut_sheet(sheet_walk, 4, 6)
-        
-        path_attack = os.path.join(SPRITE_DIR, ATTACK_SPRITE)
-        sheet_attack = pygame.image.load(path_attack).convert_alpha()
-        if sheet_attack.get_width() % 8 != 0:
-            new_w = (sheet_attack.get_width() // 8 + 1) * 8
-            sheet_attack = pygame.transform.scale(sheet_attack, (new_w, sheet_attack.get_height()))
-        self.anims_attack = self.cut_sheet(sheet_attack, 4, 8)
-
-    def cut_sheet(self, sheet, rows, cols):
-        w = sheet.get_width() // cols
-        h = sheet.get_height() // rows
-        anims = {}
-        dirs = ['down', 'left', 'right', 'up']
-        for r in range(rows):
-            d = dirs[r]
-            frames = []
-            for c in range(cols):
-                rect = pygame.Rect(c*w, r*h, w, h)
-                sub = sheet.subsurface(rect)
-                scaled = pygame.transform.scale(sub, (int(w * PLAYER_SCALE), int(h * PLAYER_SCALE)))
-                frames.append(scaled)
-            anims[d] = frames
-        return anims
-
     def handle_input(self):
         if self.is_attacking: return 0, 0
-        keys = pygame.key.get_pressed()
+        keys = self.controls.get_pressed()
         dx, dy = 0, 0
         if keys[pygame.K_LEFT]:  dx = -MOVE_SPEED; self.facing = 'left'
         elif keys[pygame.K_RIGHT]: dx = MOVE_SPEED; self.facing = 'right'
@@ -77,7 +52,7 @@ class Player(pygame.sprite.Sprite):
         if not self.is_attacking:
             self.is_attacking = True
             self.state = 'attacking'
-            self.frame_index = 0
+            self.anim.restart()
 
     # --- GESTION XP ---
     def gain_xp(self, amount):
@@ -88,31 +63,39 @@ class Player(pygame.sprite.Sprite):
 
     def level_up(self):
         self.level += 1
-        self.max_health += 20
-        self.damage += 5
+        self.max_health += self.hp_per_level
+        self.damage += self.damage_per_level
         self.health = self.max_health
-        self.max_xp = int(self.max_xp * 1.2)
+        self.max_xp = int(self.max_xp * self.xp_growth)
+        # Variantes préchargées par le jeu : changement de skin instantané
+        self.anim.set_table(get_table(self.skin_for_level(), idle_speed=0.2))
         print(f"NIVEAU {self.level} ! PV: {self.max_health}, DMG: {self.damage}")
 
+    def place(self, x, y):
+        """Replace le joueur (centre de la hitbox en x, y) avec la table actuelle de son skin :
+        carte réagrandie, autre carte ou sprites redécoupés en cours de partie."""
+        self.anim.set_table(get_table(self.skin_for_level(), idle_speed=0.2))
+        self.image = self.anim.clip.frames[0]
+        self.rect = self.image.get_rect()
+        self.hitbox = self.rect.inflate(-100, -95)
+        self.hitbox.center = (x, y)
+        self.rect.center = self.hitbox.center
+        self.x, self.y = self.rect.midbottom
+
+    def skin_for_level(self):
+        return PLAYER_LEVEL_SKINS[min(self.level, len(PLAYER_LEVEL_SKINS)) - 1]
+
     def take_damage(self, amount):
         self.health -= amount
+        self.anim.start_flash(HIT_FLASH_TICKS)
         if self.health <= 0:
             self.health = 0
 
     def update(self, game_map):
         dx, dy = self.handle_input()
 
-        self.hitbox.x += dx
-        if game_map.check_wall(self.hitbox.centerx, self.hitbox.centery) or \
-           game_map.check_wall(self.hitbox.left, self.hitbox.centery) or \
-           game_map.check_wall(self.hitbox.right, self.hitbox.centery):
-            self.hitbox.x -= dx
-        
-        self.hitbox.y += dy
-        if game_map.check_wall(self.hitbox.centerx, self.hitbox.centery) or \
-           game_map.check_wall(self.hitbox.centerx, self.hitbox.top) or \
-           game_map.check_wall(self.hitbox.centerx, self.hitbox.bottom):
-            self.hitbox.y -= dy
+        # Toute la hitbox est balayée : on avance jusqu'au mur au lieu de s'arrêter avant
+        game_map.move_box(self.hitbox, dx, dy)
 
         self.rect.center = self.hitbox.center
         self.x = self.rect.midbottom[0]
@@ -122,37 +105,4 @@ class Player(pygame.sprite.Sprite):
         elif dx != 0 or dy != 0: self.state = 'running'
         else: self.state = 'idle'
 
-        self.animate()
-
-    def animate(self):
-        current_list = []
-        speed = 0.2
-        if self.state == 'attacking':
-            current_list = self.anims_attack[self.facing]
-            speed = 0.35
-        elif self.state == 'running':
-            current_list = self.anims_walk[self.facing]
-        else:
-            current_list = [self.anims_walk[self.facing][0]]
-
-        self.frame_index += speed
-        if self.frame_index >= len(current_list):
-            if self.state == 'attacking':
-                self.is_attacking = False
-                self.state = 'idle'
-                self.frame_index = 0
-            else:
-                self.frame_index = 0
-        
-        idx = int(self.frame_index)
-        if idx >= len(current_list): idx = 0
-        self.image = current_list[idx]
-        
-        old_center = self.hitbox.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
-        
-        if self.state == 'attacking':
-            offset = 30
-            if self.facing == 'right': self.rect.x -= offset
-            elif self.facing == 'left': self.rect.x += offset
\ No newline at end of file
+        self.anim.step(self)
@@ -0,0 +1,153 @@
+import csv
+import json
+import time
+import numpy as np
+import pygame
+from settings import *
+from text_cache import render_text
+
+class _NullSection:
+    # Renvoyé quand le profiler est coupé : aucun appel d'horloge, aucune allocation
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class FrameProfiler:
+    """Temps par sous-système et par frame, avec percentiles glissants.
+
+    Usage : with profiler.section('draw_game_world'): ...  puis end_frame()
+    une fois par frame. Les durées sont gardées dans un tampon circulaire de
+    history frames ; rows et events gardent aussi chaque frame pour l'export CSV / trace.
+    """
+
+    def __init__(self, enabled=None, history=None):
+        if enabled is None: enabled = PROFILER_ENABLED
+        if history is None: history = PROFILER_HISTORY
+        self.enabled = enabled
+        self.history = history
+        self.names = []
+        self.buffers = {}       # nom -> tableau circulaire des durées (ms)
+        self.current = {}       # nom -> durée cumulée sur la frame en cours (ns)
+        self.pos = 0
+        self.filled = 0
+        self.frame_start = time.perf_counter_ns()
+        self.frame_count = 0
+        self.rows = []          # Une ligne par frame pour l'export CSV
+        self.events = []        # Événements "X" du format Chrome trace
+        self._stats = {}
+        self._font = None
+        self._panel = None          # Panneau de l'overlay, refait quand _stats change
+        self._panel_stats = None
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        return _Section(self, name)
+
+    def add(self, name, start, end):
+        self.current[name] = self.current.get(name, 0) + end - start
+        if len(self.events) < PROFILER_MAX_RECORD:
+            self.events.append((name, start, end))
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current.clear()
+        self.frame_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        if not self.enabled: return
+        now = time.perf_counter_ns()
+        self.current['total'] = now - self.frame_start
+        self.frame_start = now
+
+        for name, ns in self.current.items():
+            buf = self.buffers.get(name)
+            if buf is None:
+                buf = self.buffers[name] = np.zeros(self.history, dtype=np.float32)
+                self.names.append(name)
+            buf[self.pos] = ns / 1e6
+        for name in self.names:
+            if name not in self.current:
+                self.buffers[name][self.pos] = 0
+
+        if len(self.rows) < PROFILER_MAX_RECORD:
+            self.rows.append((self.frame_count, {n: ns / 1e6 for n, ns in self.current.items()}))
+        self.current = {}
+        self.pos = (self.pos + 1) % self.history
+        self.filled = min(self.filled + 1, self.history)
+        self.frame_count += 1
+        if self.frame_count % 15 == 0:
+            self._stats = self.stats()
+
+    def stats(self):
+        """{nom: (p50, p95, p99)} en ms sur les dernières frames."""
+        if self.filled == 0: return {}
+        out = {}
+        for name in self.names:
+            p50, p95, p99 = np.percentile(self.buffers[name][:self.filled], (50, 95, 99))
+            out[name] = (float(p50), float(p95), float(p99))
+        return out
+
+    # --- AFFICHAGE ---
+    def draw(self, surface):
+        if not self.enabled: return
+        # Les percentiles ne changent que toutes les 15 frames : le panneau est gardé entre-temps
+        if self._panel is None or self._panel_stats is not self._stats:
+            self._panel = self.render_panel()
+            self._panel_stats = self._stats
+        surface.blit(self._panel, (surface.get_width() - 300, 8))
+
+    def render_panel(self):
+        if self._font is None:
+            self._font = pygame.font.SysFont("Consolas", 14)
+        lines = [f"{'section':<16}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, (p50, p95, p99) in self._stats.items():
+            lines.append(f"{name:<16}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        height = 16 * len(lines) + 8
+        panel = self._panel
+        if panel is None or panel.get_height() != height:
+            panel = pygame.Surface((292, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            panel.blit(render_text(self._font, line, (0, 255, 0)), (6, 4 + i * 16))
+        return panel
+
+    # --- EXPORT ---
+    def dump_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame'] + self.names)
+            for frame, values in self.rows:
+                writer.writerow([frame] + [f"{values.get(n, 0):.4f}" for n in self.names])
+
+    def dump_trace(self, path):
+        """Format chrome://tracing / Perfetto (durées en microsecondes)."""
+        trace = [{'name': name, 'ph': 'X', 'pid': 0, 'tid': 0,
+                  'ts': start / 1000, 'dur': (end - start) / 1000}
+                 for name, start, end in self.events]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+    def dump(self, prefix="profile"):
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        self.dump_csv(f"{prefix}_{stamp}.csv")
+        self.dump_trace(f"{prefix}_{stamp}.json")
+        print(f"Info: Profil enregistré dans {prefix}_{stamp}.csv/.json")
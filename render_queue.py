@@ -0,0 +1,75 @@
+from operator import itemgetter
+import pygame
+from settings import *
+
+# --- COUCHES (dessinées dans cet ordre, puis par y croissant dans une couche) ---
+LAYER_GROUND = 0    # Ombres, effets au sol
+LAYER_ENTITIES = 1  # Joueur et ennemis
+LAYER_OVERLAY = 2   # Barres de vie, au-dessus de toutes les entités
+
+_by_key = itemgetter(0)
+
+
+class RenderQueue:
+    """File de dessin du monde : les entités s'y inscrivent, flush() dessine tout d'un coup.
+
+    Les entrées sont triées par (couche, profondeur) puis envoyées en un seul
+    Surface.blits : plus d'appel blit ni de Rect par entité côté Python.
+    """
+
+    def __init__(self):
+        self.entries = []  # ((couche, profondeur), image, x monde, y monde)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def submit(self, image, x, y, layer=LAYER_ENTITIES, depth=0):
+        self.entries.append(((layer, depth), image, x, y))
+
+    def submit_sprite(self, sprite, layer=LAYER_ENTITIES):
+        """Sprite avec image / rect (monde) ; profondeur = bas de la hitbox (pieds)."""
+        rect = sprite.rect
+        self.entries.append(((layer, sprite.hitbox.bottom), sprite.image, rect.x, rect.y))
+
+    def submit_sprites(self, sprites, layer=LAYER_ENTITIES):
+        """submit_sprite pour toute une liste, en un seul passage."""
+        self.entries.extend([((layer, s.hitbox.bottom), s.image, s.rect.x, s.rect.y) for s in sprites])
+
+    def submit_health(self, sprites, layer=LAYER_OVERLAY):
+        """Barres de vie au-dessus des sprites blessés (rien pour ceux qui ont toute leur vie)."""
+        buckets = HEALTH_BAR_BUCKETS
+        self.entries.extend([((layer, s.hitbox.bottom),
+                              health_bar(s.rect.width, -(-s.health * buckets // s.max_health)),  # Cran supérieur
+                              s.rect.x, s.rect.y - 10)
+                             for s in sprites if s.health < s.max_health])
+
+    def flush(self, surface, offset=(0, 0)):
+        """Dessine la file sur surface (coordonnées monde - offset) et la vide."""
+        ox, oy = offset
+        entries = self.entries
+        entries.sort(key=_by_key)  # Stable : à égalité, ordre d'inscription
+        surface.blits([(image, (x - ox, y - oy)) for _, image, x, y in entries], False)
+        entries.clear()
+
+
+# --- BARRES DE VIE ---
+# Une surface par (largeur, cran de remplissage) : HEALTH_BAR_BUCKETS crans, arrondis au
+# cran supérieur pour qu'un mob presque mort garde un trait de rouge. Partagées : ne pas dessiner dessus.
+_health_bars = {}
+
+
+def health_bar(width, step):
+    """Barre de vie de width pixels remplie à step / HEALTH_BAR_BUCKETS."""
+    key = (width, step)
+    bar = _health_bars.get(key)
+    if bar is None:
+        step = min(HEALTH_BAR_BUCKETS, max(0, step))
+        bar = pygame.Surface((width, HEALTH_BAR_MOB_HEIGHT)).convert()
+        bar.fill((0, 0, 0))
+        bar.fill((255, 0, 0), (0, 0, round(width * step / HEALTH_BAR_BUCKETS), HEALTH_BAR_MOB_HEIGHT))
+        _health_bars[key] = bar
+    return bar
+
+
+def clear_health_bars():
+    _health_bars.clear()
@@ -0,0 +1,59 @@
+import pygame
+from settings import *
+
+class WorldRenderer:
+    """Rendu du monde par zones sales.
+
+    Tant que la caméra ne bouge pas, seules les zones occupées par les
+    éléments mobiles (à la frame précédente et à celle-ci) sont redessinées
+    puis envoyées à l'écran avec pygame.display.update(rects).
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.last_cam = None
+        self.prev_rects = []
+        self.force_full = True
+        self.dirty = None  # None : tout l'écran a changé (flip)
+
+    def invalidate(self):
+        """Prochaine frame redessinée en entier (changement d'état, overlay, ...)."""
+        self.force_full = True
+
+    def plan(self, cam_x, cam_y, rects):
+        """rects : zones écran occupées ce frame. Renvoie les zones à reconstruire (None = tout)."""
+        rects = [r.clip(self.screen_rect) for r in rects]
+        rects = [r for r in rects if r.w and r.h]
+        cam = (cam_x, cam_y)
+        dirty = None
+        if not self.force_full and cam == self.last_cam:
+            dirty = self.prev_rects + rects
+            # Au-delà de la moitié de l'écran, un redessin complet coûte moins cher
+            if sum(r.w * r.h for r in dirty) * 2 > self.screen_rect.w * self.screen_rect.h:
+                dirty = None
+        self.prev_rects = rects
+        self.last_cam = cam
+        self.force_full = False
+        self.dirty = dirty
+        return dirty
+
+    def restore(self, game_map, cam_x, cam_y, rect=None, surface=None):
+        """Redessine le fond (carte + overlay debug) sous une zone écran, sans toucher au reste.
+
+        surface : cible du dessin (vue zoomée de la caméra), l'écran par défaut.
+        """
+        if surface is None: surface = self.screen
+        if rect is None: rect = surface.get_rect()
+        world = rect.move(cam_x, cam_y)
+        area = world.clip(pygame.Rect(0, 0, game_map.width, game_map.height))
+        if area != world:
+            surface.fill(COLOR_BG, rect)  # Hors de la carte
+        if area.w == 0 or area.h == 0: return
+        game_map.blit_area(surface, (area.x - cam_x, area.y - cam_y), area)
+
+    def present(self):
+        if self.dirty is None:
+            pygame.display.flip()
+        elif self.dirty:
+            pygame.display.update(self.dirty)
@@ -0,0 +1,208 @@
+import os
+import sys
+import json
+import time
+import zlib
+import atexit
+import struct
+import hashlib
+import argparse
+import pygame
+from settings import *
+from controls import ScriptedKeys
+
+# --- ENREGISTREMENT DES ENTRÉES ---
+# Format : MAGIC | version (u16) | longueur de l'en-tête (u32) | en-tête JSON | corps zlib
+# Corps : une entrée par appel à get_events() (un tick en jeu, une frame dans les menus) :
+#   touches maintenues (u8, bits de RECORD_KEYS) | nombre d'événements (u8) | événements
+# Événement : code (u8) puis KEYDOWN -> touche (u32), MOUSEBUTTONDOWN -> bouton (u8), x, y (i16)
+MAGIC = b"PALMREC\0"
+RECORD_VERSION = 5  # 2 : dégâts pendant la fenêtre de frappe (combat.py), 3 : mobs recentrés dans les couloirs,
+                    # 4 : pas de poussée de la foule au contact du joueur, 5 : hitbox balayée par l'essaim
+RECORD_KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN]
+EV_QUIT, EV_KEYDOWN, EV_MOUSEDOWN = 1, 2, 3
+
+
+def settings_fingerprint():
+    """Réglages qui changent la simulation : un enregistrement n'est fidèle qu'avec les mêmes."""
+    h = hashlib.sha1()
+    h.update(repr((RECORD_VERSION, FPS, MOVE_SPEED, MOB_SPEED, ZOOM_FACTOR, PLAYER_SCALE, MAP_FILE,
+                   COLLISION_FILE, ENEMY_BATCH_MODE, ENEMY_PATHFINDING, NAV_CELL_SIZE, NAV_DIRECT_CELLS,
+                   LEVEL_HP_GAIN, LEVEL_DAMAGE_GAIN, LEVEL_XP_GROWTH, WAVES_ENDLESS,
+                   WAVE_SPAWNS_PER_TICK, CROWD_SEPARATION, CROWD_RADIUS, CROWD_PUSH,
+                   PLAYER_ATTACK_REACH, ATTACK_HIT_FRAMES)).encode())
+    waves_path = os.path.join(BASE_DIR, WAVES_FILE)
+    if os.path.exists(waves_path):
+        with open(waves_path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def state_digest(game):
+    """Empreinte de l'état de la partie : deux exécutions identiques donnent la même."""
+    player = game.player
+    mobs = sorted((tuple(mob.hitbox), mob.health) for mob in game.all_enemies)
+    state = (game.ticks, game.state, game.wave, tuple(player.hitbox), player.health,
+             player.current_xp, player.level, mobs)
+    return zlib.crc32(repr(state).encode())
+
+
+def encode_entry(held, events):
+    mask = 0
+    for bit, key in enumerate(RECORD_KEYS):
+        if held[key]: mask |= 1 << bit
+    data = []
+    for event in events:
+        if event.type == pygame.QUIT:
+            data.append(struct.pack('<B', EV_QUIT))
+        elif event.type == pygame.KEYDOWN:
+            data.append(struct.pack('<BI', EV_KEYDOWN, event.key))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            data.append(struct.pack('<BBhh', EV_MOUSEDOWN, event.button, *event.pos))
+    return struct.pack('<BB', mask, len(data)) + b''.join(data)
+
+
+def decode_entries(body):
+    """Octets du corps -> liste de (touches maintenues, événements)."""
+    entries = []
+    pos = 0
+    while pos < len(body):
+        mask, count = struct.unpack_from('<BB', body, pos)
+        pos += 2
+        events = []
+        for _ in range(count):
+            code = body[pos]
+            if code == EV_QUIT:
+                events.append(pygame.event.Event(pygame.QUIT))
+                pos += 1
+            elif code == EV_KEYDOWN:
+                (key,) = struct.unpack_from('<I', body, pos + 1)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+                pos += 5
+            elif code == EV_MOUSEDOWN:
+                button, x, y = struct.unpack_from('<Bhh', body, pos + 1)
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y)))
+                pos += 6
+            else:
+                raise ValueError(f"événement inconnu ({code}) à l'octet {pos}")
+        held = ScriptedKeys(key for bit, key in enumerate(RECORD_KEYS) if mask & (1 << bit))
+        entries.append((held, events))
+    return entries
+
+
+class InputRecorder:
+    """Enveloppe une source d'entrées et enregistre tout ce qu'elle renvoie.
+
+    Le fichier est écrit à la fermeture du jeu (ou par save()), avec l'empreinte de
+    l'état final si attach(game) a été appelé.
+    """
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.path = path
+        self.chunks = []
+        self.keys = ScriptedKeys()
+        self.game = None
+        atexit.register(self.save)
+
+    def attach(self, game):
+        self.game = game
+        if hasattr(self.inner, 'attach'): self.inner.attach(game)
+
+    def get_events(self):
+        events = self.inner.get_events()
+        held = self.inner.get_pressed()
+        self.chunks.append(encode_entry(held, events))
+        # Le joueur lit les touches enregistrées, pas le clavier : on rejoue exactement ça
+        self.keys = ScriptedKeys(key for key in RECORD_KEYS if held[key])
+        return events
+
+    def get_pressed(self):
+        return self.keys
+
+    def save(self):
+        if not self.chunks: return
+        header = {'fingerprint': settings_fingerprint(), 'entries': len(self.chunks),
+                  'digest': state_digest(self.game) if self.game is not None else None}
+        raw = json.dumps(header).encode()
+        with open(self.path, 'wb') as f:
+            f.write(MAGIC + struct.pack('<HI', RECORD_VERSION, len(raw)) + raw)
+            f.write(zlib.compress(b''.join(self.chunks), 9))
+        print(f"Info: {len(self.chunks)} entrées enregistrées dans {self.path}")
+        self.chunks = []
+
+
+class ReplayInput:
+    """Rejoue un enregistrement. Une fois à la fin, renvoie QUIT."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} n'est pas un enregistrement")
+        version, size = struct.unpack_from('<HI', data, len(MAGIC))
+        if version != RECORD_VERSION:
+            raise ValueError(f"{path} : version {version} non supportée")
+        start = len(MAGIC) + 6
+        self.header = json.loads(data[start:start + size])
+        self.entries = decode_entries(zlib.decompress(data[start + size:]))
+        if self.header['fingerprint'] != settings_fingerprint():
+            print("Attention: enregistrement fait avec d'autres réglages, le rejeu peut diverger.")
+        self.index = 0
+        self.keys = ScriptedKeys()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def finished(self):
+        return self.index >= len(self.entries)
+
+    def get_events(self):
+        if self.finished:
+            self.keys = ScriptedKeys()
+            return [pygame.event.Event(pygame.QUIT)]
+        self.keys, events = self.entries[self.index]
+        self.index += 1
+        return events
+
+    def get_pressed(self):
+        return self.keys
+
+
+def replay_fast(game):
+    """Rejeu sans rendu ni attente : un appel à tick() par entrée enregistrée."""
+    # Toutes les entrées, même après un QUIT : run() finit la frame en cours avant de sortir
+    while not game.controls.finished:
+        game.tick()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rejoue une partie enregistrée (python main.py --record fichier)")
+    parser.add_argument("path")
+    parser.add_argument("--realtime", action="store_true", help="rejeu affiché, à la vitesse normale")
+    args = parser.parse_args()
+
+    from game import Game
+    controls = ReplayInput(args.path)
+    if args.realtime:
+        Game(controls=controls).run()
+        return
+
+    game = Game(headless=True, controls=controls)
+    t0 = time.perf_counter()
+    replay_fast(game)
+    elapsed = time.perf_counter() - t0
+    print(f"{len(controls)} entrées rejouées en {elapsed:.2f} s ({game.ticks / elapsed:,.0f} ticks/s)")
+    expected = controls.header.get('digest')
+    if expected is None:
+        print("Pas d'empreinte finale dans l'enregistrement.")
+    elif state_digest(game) == expected:
+        print("OK : état final identique à l'enregistrement.")
+    else:
+        print("ERREUR : l'état final diverge de l'enregistrement.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
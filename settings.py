@@ -4,6 +4,8 @@ import os
 SCREEN_WIDTH = 896
 SCREEN_HEIGHT = 900
 FPS = 60
+TICK_MS = 1000 / FPS    # Pas de temps fixe de la simulation
+MAX_CATCHUP_TICKS = 5   # Ticks de rattrapage max par frame si le rendu prend du retard
 TITLE = "RPG Engine: Leveling & UI"
 COLOR_BG = (20, 20, 20)
 
@@ -18,6 +20,9 @@ BLUR_INTENSITY = 10
 UI_BAR_HEIGHT = 20
 HEALTH_BAR_WIDTH = 200
 UI_FONT_SIZE = 18
+TEXT_CACHE_SIZE = 256  # Textes rendus gardés en cache (LRU)
+HEALTH_BAR_BUCKETS = 32     # Crans de remplissage des barres de vie des mobs (une image par cran)
+HEALTH_BAR_MOB_HEIGHT = 5
 
 # Couleurs Vie
 HEALTH_COLOR = (255, 0, 0)
@@ -32,13 +37,54 @@ LEVEL_TEXT_COLOR = (255, 255, 255)
 # --- GAME OVER ---
 COLOR_GAMEOVER = (200, 0, 0)
 
+# --- CAMÉRA ---
+CAMERA_DEAD_ZONE = (160, 120)  # Zone au centre de l'écran où le joueur bouge sans faire défiler
+CAMERA_LERP = 0.15             # Part de l'écart rattrapée par tick (1 : caméra collée au joueur)
+CAMERA_ZOOM = 1.0              # Zoom de départ (molette en jeu)
+CAMERA_ZOOM_MIN = 0.5
+CAMERA_ZOOM_MAX = 2.0
+CAMERA_ZOOM_STEP = 1.25        # Facteur par cran de molette
+CAMERA_PAN_SPEED = (120, 60)   # Balayage du menu, pixels par seconde
+
 # --- GAMEPLAY ---
 MOVE_SPEED = 5
 ZOOM_FACTOR = 1.5
 PLAYER_SCALE = 2.5
 
+PLAYER_ATTACK_REACH = 50    # Décalage de la zone de frappe devant le joueur (pixels)
+ATTACK_HIT_FRAMES = (3, 5)  # Frames de l'animation d'attaque pendant lesquelles le coup porte
+
+# Progression du joueur à chaque niveau
+LEVEL_HP_GAIN = 20
+LEVEL_DAMAGE_GAIN = 5
+LEVEL_XP_GROWTH = 1.2   # max_xp multiplié à chaque niveau
+
 # --- ENNEMIS ---
 MOB_SPEED = 3.5
+ENEMY_BATCH_MODE = False  # True : simulation groupée numpy (EnemySwarm), pour les grosses vagues
+ENEMY_PATHFINDING = True  # Les mobs contournent les murs (champ de flux vers le joueur)
+NAV_CELL_SIZE = 24        # Case de la grille de navigation (pixels monde)
+NAV_DIRECT_CELLS = 1      # A cette distance (en cases) du joueur, le mob fonce tout droit
+CROWD_SEPARATION = True   # Les mobs s'écartent les uns des autres au lieu de s'empiler
+CROWD_RADIUS = 48         # Distance entre centres en dessous de laquelle deux mobs se repoussent
+CROWD_PUSH = 2.0          # Poussée max par tick (pixels), ajoutée au déplacement
+
+# --- VAGUES ---
+WAVES_FILE = "waves.json"   # Définition des vagues (nombre, stats, points d'apparition, rythme)
+WAVES_ENDLESS = False       # True : après la dernière vague, on reboucle avec des stats croissantes
+WAVE_SPAWNS_PER_TICK = 4    # Apparitions max par tick (les grosses vagues sont étalées)
+
+# --- PERFORMANCES ---
+GRID_CELL_SIZE = 128  # Taille d'une case de la grille spatiale (pixels monde)
+GRID_MIN_SPRITES = None  # Grille tenue à jour à partir de ce nombre de mobs (None : jamais).
+                         # bench_spatial.py : avec 2 requêtes par tick (attaque, caméra), le suivi
+                         # des cases coûte plus que le balayage C jusqu'à 40 000 mobs au moins
+CULL_MARGIN = 128     # Marge autour de la caméra (sprite plus grand que sa hitbox)
+COLLISION_SDF = False       # Calcule aussi le champ de distance aux murs (plus long au chargement)
+COLLISION_RLE = False       # Murs en plages par ligne : moins de mémoire (grandes cartes), requêtes ~5x plus lentes
+PROFILER_ENABLED = False     # F3 : active le profiler + overlay, F4 : export CSV / trace
+PROFILER_HISTORY = 300       # Frames gardées pour les percentiles
+PROFILER_MAX_RECORD = 100000 # Frames / événements gardés pour l'export
 
 # --- CHEMINS ---
 BASE_DIR = os.path.dirname(__file__)
@@ -48,5 +94,39 @@ SPRITE_DIR = os.path.join(BASE_DIR, "sprite", "3")
 MAP_FILE = "sale3.png"
 COLLISION_FILE = "colision3.png"
 DEBUG_MODE = True # Mets False pour cacher les hitboxes
+
+# Carte en tuiles chargées à la demande (grandes cartes). Pré-découpe : python tiled_map.py
+MAP_TILED = False
+MAP_TILE_SIZE = 256       # Côté d'une tuile, en pixels de l'image source
+MAP_TILE_BUDGET_MB = 64   # Mémoire max des tuiles agrandies gardées en cache
+DEBUG_TILE_SIZE = 256     # Overlay debug des murs construit par tuiles (pixels monde), là où la caméra passe
+DEBUG_TILE_BUDGET_MB = 16 # Mémoire max des tuiles de l'overlay debug
+
+# Pack d'assets précompilé (python asset_pack.py), utilisé s'il est à jour
+ASSET_PACK = True
+ASSET_LOADER_WORKERS = 4  # Threads de chargement (décodage / agrandissement des images), au plus 1 par coeur ;
+                          # 1 : jobs en série sur le thread principal
+# Cartes disponibles (F5 en mode debug : carte suivante, préchargée en arrière-plan)
+MAPS = [("sale1.png", "colision1.png"), ("sale2.png", "colision2.png"), ("sale3.png", "colision3.png")]
 WALK_SPRITE = "lvl1Walk.png"
-ATTACK_SPRITE = "lvl1Attack.png"
\ No newline at end of file
+ATTACK_SPRITE = "lvl1Attack.png"
+
+# --- SKINS (planche de marche 4x6, planche d'attaque 4x8) ---
+SKIN_DIR = os.path.join(BASE_DIR, "sprite", "PNG")
+SKINS = {
+    'lvl1': (os.path.join(SPRITE_DIR, WALK_SPRITE), os.path.join(SPRITE_DIR, ATTACK_SPRITE)),
+    'lvl2': (os.path.join(SKIN_DIR, "Swordsman_lvl2", "With_shadow", "Swordsman_lvl2_Walk_with_shadow.png"),
+             os.path.join(SKIN_DIR, "Swordsman_lvl2", "With_shadow", "Swordsman_lvl2_attack_with_shadow.png")),
+    'lvl3': (os.path.join(SKIN_DIR, "Swordsman_lvl3", "With_shadow", "Swordsman_lvl3_Walk_with_shadow.png"),
+             os.path.join(SKIN_DIR, "Swordsman_lvl3", "With_shadow", "Swordsman_lvl3_attack_with_shadow.png")),
+}
+DEFAULT_SKIN = 'lvl1'
+PLAYER_LEVEL_SKINS = ['lvl1', 'lvl2', 'lvl3']  # Skin du joueur par niveau (le dernier au-delà)
+SPRITE_VARIANT_BUDGET_MB = 64   # Mémoire max des variantes (skins, teintes) gardées en cache
+SPRITE_RLE = True               # Frames en RLE : blit bien plus rapide (frames surtout transparentes)
+HIT_FLASH_TICKS = 6             # Durée du flash quand un ennemi est touché
+HIT_FLASH_COLOR = (150, 150, 150)
+
+# --- RÉGLAGES À CHAUD (config.py) ---
+CONFIG_WATCH = True     # settings.py relu en jeu quand il change : pas besoin de relancer
+CONFIG_POLL_MS = 500    # Intervalle de vérification du fichier
@@ -0,0 +1,152 @@
+import pygame
+from settings import *
+
+class SpatialGroup(pygame.sprite.Group):
+    """Groupe de sprites indexé par une grille uniforme sur leur hitbox.
+
+    Grille "lâche" : chaque sprite n'est rangé que dans la case du coin haut-gauche de
+    sa hitbox. Une requête élargit sa zone vers le haut / la gauche de la taille de la
+    plus grande hitbox : pas de doublons à éliminer, et un déplacement ne touche au
+    plus que deux cases.
+
+    La grille n'est tenue à jour qu'à partir de min_sprites sprites (GRID_MIN_SPRITES,
+    voir bench_spatial.py) : en dessous, une requête teste toutes les hitbox d'un seul
+    appel C (Rect.collidelistall), moins cher que le suivi des cases à chaque tick.
+    """
+
+    def __init__(self, width, height, cell_size=None, *sprites, min_sprites=None):
+        if cell_size is None: cell_size = GRID_CELL_SIZE
+        if min_sprites is None: min_sprites = GRID_MIN_SPRITES
+        # La grille doit exister avant que Group.__init__ n'ajoute les sprites
+        self.min_sprites = min_sprites if min_sprites is not None else float('inf')
+        self.indexed = False  # Cases remplies et suivies (au moins min_sprites sprites)
+        self.cell_size = cell_size
+        self.cols = max(1, -(-int(width) // cell_size))
+        self.rows = max(1, -(-int(height) // cell_size))
+        # Par case : sprites et hitbox en listes parallèles (Rect.collidelistall teste une case
+        # entière en C), plus la position de chaque sprite pour le retirer en O(1)
+        n = self.cols * self.rows
+        self.cells = [[] for _ in range(n)]
+        self.cell_boxes = [[] for _ in range(n)]
+        self.cell_index = [{} for _ in range(n)]
+        # Tous les sprites, même principe (grandes zones)
+        self.order, self.boxes, self.index = [], [], {}
+        self.sprite_cells = {}  # sprite -> (cx, cy) du coin haut-gauche de la hitbox (non borné)
+        self.spill_x = self.spill_y = 0  # Cases débordées à droite / en bas par la plus grande hitbox
+        super().__init__(*sprites)
+
+    # --- INDEXATION ---
+    def cell_range(self, rect):
+        cs = self.cell_size
+        x0 = min(max(rect.left // cs, 0), self.cols - 1)
+        x1 = min(max((rect.right - 1) // cs, 0), self.cols - 1)
+        y0 = min(max(rect.top // cs, 0), self.rows - 1)
+        y1 = min(max((rect.bottom - 1) // cs, 0), self.rows - 1)
+        return x0, y0, x1, y1
+
+    def _cell(self, cx, cy):
+        return min(max(cy, 0), self.rows - 1) * self.cols + min(max(cx, 0), self.cols - 1)
+
+    @staticmethod
+    def _append(sprites, boxes, index, sprite, box):
+        index[sprite] = len(sprites)
+        sprites.append(sprite)
+        boxes.append(box)
+
+    @staticmethod
+    def _discard(sprites, boxes, index, sprite):
+        # Le dernier élément prend la place de celui qu'on retire
+        i = index.pop(sprite, None)
+        if i is None: return
+        last, box = sprites.pop(), boxes.pop()
+        if last is not sprite:
+            sprites[i], boxes[i] = last, box
+            index[last] = i
+
+    def _insert(self, sprite):
+        hitbox = sprite.hitbox
+        cs = self.cell_size
+        cell = self.sprite_cells[sprite] = (hitbox.x // cs, hitbox.y // cs)
+        i = self._cell(*cell)
+        self._append(self.cells[i], self.cell_boxes[i], self.cell_index[i], sprite, hitbox)
+        # Une hitbox qui commence au dernier pixel d'une case déborde de (taille - 1) pixels
+        self.spill_x = max(self.spill_x, (cs + hitbox.w - 2) // cs)
+        self.spill_y = max(self.spill_y, (cs + hitbox.h - 2) // cs)
+
+    def _remove(self, sprite):
+        cell = self.sprite_cells.pop(sprite, None)
+        if cell is None: return
+        i = self._cell(*cell)
+        self._discard(self.cells[i], self.cell_boxes[i], self.cell_index[i], sprite)
+
+    def set_indexed(self, indexed):
+        """Remplit la grille avec tous les sprites, ou la vide (seuil min_sprites franchi)."""
+        if indexed == self.indexed: return
+        self.indexed = indexed
+        for i in range(len(self.cells)):
+            self.cells[i], self.cell_boxes[i], self.cell_index[i] = [], [], {}
+        self.sprite_cells.clear()
+        self.spill_x = self.spill_y = 0
+        if indexed:
+            for sprite in self.order:
+                self._insert(sprite)
+
+    def relocate(self, sprite):
+        """A appeler après un déplacement de hitbox (ne fait rien si la case est la même)."""
+        old = self.sprite_cells.get(sprite)
+        if old is None: return
+        # Case comparée d'abord : les listes ne sont touchées qu'au changement de case
+        hitbox, cs = sprite.hitbox, self.cell_size
+        if (hitbox.x // cs, hitbox.y // cs) == old:
+            return
+        self._remove(sprite)
+        self._insert(sprite)
+
+    def relocate_all(self):
+        """relocate() de tous les sprites, en un seul passage (tick où tout le monde a bougé)."""
+        if not self.indexed: return
+        cs, cells = self.cell_size, self.sprite_cells
+        for sprite, hitbox in zip(self.order, self.boxes):
+            if (hitbox.x // cs, hitbox.y // cs) != cells[sprite]:
+                self._remove(sprite)
+                self._insert(sprite)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._append(self.order, self.boxes, self.index, sprite, sprite.hitbox)
+        if self.indexed: self._insert(sprite)
+        elif len(self.order) >= self.min_sprites: self.set_indexed(True)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._discard(self.order, self.boxes, self.index, sprite)
+        self._remove(sprite)
+        # Marge de moitié : pas de va-et-vient autour du seuil
+        if self.indexed and len(self.order) * 2 < self.min_sprites: self.set_indexed(False)
+
+    def update(self, *args, **kwargs):
+        # Même contrat que Group.update, la grille suit les hitbox au passage
+        for sprite in self.sprites():
+            sprite.update(*args, **kwargs)
+        self.relocate_all()
+
+    # --- REQUÊTES ---
+    def sprites_in_rect(self, rect):
+        """Sprites dont la hitbox touche rect (attaque, caméra, ...)."""
+        if not self.indexed:
+            order = self.order
+            return [order[j] for j in rect.collidelistall(self.boxes)]
+        x0, y0, x1, y1 = self.cell_range(rect)
+        x0, y0 = max(x0 - self.spill_x, 0), max(y0 - self.spill_y, 0)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * 2 > len(self.cells):
+            # Zone qui couvre la moitié de la carte : un parcours direct coûte moins cher
+            order = self.order
+            return [order[j] for j in rect.collidelistall(self.boxes)]
+        found = []
+        cells, boxes = self.cells, self.cell_boxes
+        for cy in range(y0, y1 + 1):
+            row = cy * self.cols
+            for i in range(row + x0, row + x1 + 1):
+                sprites = cells[i]
+                if sprites: found += [sprites[j] for j in rect.collidelistall(boxes[i])]
+        return found
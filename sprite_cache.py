@@ -0,0 +1,232 @@
+import pygame
+from collections import OrderedDict
+from settings import *
+
+# --- CACHE D'ANIMATIONS (PARTAGÉ PAR TOUT LE PROCESSUS) ---
+# Clé : (chemin de la planche, lignes, colonnes, échelle)
+# Valeur : {direction: tuple de frames}. Les frames sont partagées entre
+# toutes les entités, il ne faut donc jamais les modifier sur place.
+_anim_cache = {}
+# Planches décodées (non converties), gardées si CONFIG_WATCH : un changement de
+# PLAYER_SCALE redécoupe les frames sans redécoder les PNG
+_sheets = {}
+
+DIRECTIONS = ['down', 'left', 'right', 'up']
+
+
+def cut_sheet(sheet, rows, cols, scale=None):
+    if scale is None: scale = PLAYER_SCALE
+    w = sheet.get_width() // cols
+    h = sheet.get_height() // rows
+    size = (int(w * scale), int(h * scale))
+    anims = {}
+    for r in range(rows):
+        frames = []
+        for c in range(cols):
+            sub = sheet.subsurface(pygame.Rect(c*w, r*h, w, h))
+            frames.append(pygame.transform.scale(sub, size))
+        anims[DIRECTIONS[r]] = tuple(frames)
+    return anims
+
+
+def decode_sheet(path, cols):
+    """Décodage seul (pas de convert) : utilisable depuis un thread de chargement."""
+    sheet = _sheets.get((path, cols))
+    if sheet is not None:
+        return sheet
+    sheet = pygame.image.load(path)
+    # Largeur non divisible par le nombre de colonnes : on étire la planche
+    if sheet.get_width() % cols != 0:
+        new_w = (sheet.get_width() // cols + 1) * cols
+        sheet = pygame.transform.scale(sheet, (new_w, sheet.get_height()))
+    if CONFIG_WATCH: _sheets[(path, cols)] = sheet
+    return sheet
+
+
+def load_sheet(path, rows, cols):
+    return decode_sheet(path, cols).convert_alpha()
+
+
+def prepare_animations(path, rows, cols, scale=None):
+    """Découpe et mise à l'échelle hors du thread principal ; finish_animations() convertit ensuite."""
+    return cut_sheet(decode_sheet(path, cols), rows, cols, scale)
+
+
+def finish_animations(anims):
+    """Étape du thread principal : frames converties au format de l'écran."""
+    return {name: tuple(frame.convert_alpha() for frame in frames) for name, frames in anims.items()}
+
+
+def get_animations(path, rows, cols, scale=None):
+    """Renvoie les animations d'une planche, découpées une seule fois."""
+    if scale is None: scale = PLAYER_SCALE
+    key = (path, rows, cols, scale)
+    anims = _anim_cache.get(key)
+    if anims is None:
+        anims = cut_sheet(load_sheet(path, rows, cols), rows, cols, scale)
+        _anim_cache[key] = anims
+    return anims
+
+
+def install(path, rows, cols, scale, anims):
+    """Enregistre des frames déjà prêtes (pack d'assets) sous la clé de get_animations."""
+    _anim_cache[(path, rows, cols, scale)] = anims
+
+
+def clear_cache():
+    """Frames et variantes (les planches décodées restent : voir clear_sheets)."""
+    _anim_cache.clear()
+    clear_variants()
+
+
+def clear_sheets():
+    _sheets.clear()
+
+
+def cache_size_bytes():
+    """Mémoire occupée par les frames en cache (pixels uniquement)."""
+    total = 0
+    for anims in _anim_cache.values():
+        for frames in anims.values():
+            for frame in frames:
+                total += frame.get_width() * frame.get_height() * frame.get_bytesize()
+    return total
+
+
+# --- VARIANTES DE SPRITES (skin, échelle, teinte) ---
+# Chaque combinaison est construite au premier usage puis gardée dans un LRU
+# plafonné à SPRITE_VARIANT_BUDGET_MB. Le skin par défaut à l'échelle normale
+# vient de _anim_cache (pack d'assets) et n'est jamais évincé.
+_variants = OrderedDict()
+_variant_bytes = 0
+
+
+class Variant:
+    """Frames d'un skin (marche 4x6, attaque 4x8) et tables de clips construites dessus."""
+    __slots__ = ('walk', 'attack', 'size', 'tables')
+
+    def __init__(self, walk, attack, size):
+        if SPRITE_RLE:
+            # Blit RLE : les pixels transparents (la majeure partie de la frame) sont sautés.
+            # Une fois par variante : toutes ses tables de clips partagent ces frames
+            for frames in (*walk.values(), *attack.values()):
+                for frame in frames: frame.set_alpha(255, pygame.RLEACCEL)
+        self.walk = walk
+        self.attack = attack
+        self.size = size    # Octets comptés dans le budget (0 : frames possédées par _anim_cache)
+        self.tables = {}    # Rempli par animation.get_table
+
+
+def _frames_bytes(anims):
+    return sum(f.get_width() * f.get_height() * f.get_bytesize() for frames in anims.values() for f in frames)
+
+
+def _tinted(anims, tint, flash):
+    """Copie teintée des frames : tint multiplie les couleurs, flash les éclaircit (alpha conservé)."""
+    out = {}
+    for name, frames in anims.items():
+        copies = []
+        for frame in frames:
+            frame = frame.copy()
+            if tint is not None:
+                frame.fill((*tint, 255), special_flags=pygame.BLEND_RGBA_MULT)
+            if flash:
+                frame.fill(HIT_FLASH_COLOR, special_flags=pygame.BLEND_RGB_ADD)
+            copies.append(frame)
+        out[name] = tuple(copies)
+    return out
+
+
+def get_variant(skin=None, scale=None, tint=None, flash=False):
+    """Renvoie la variante (skin, échelle, teinte), construite une seule fois tant qu'elle reste en cache."""
+    if skin is None: skin = DEFAULT_SKIN
+    if scale is None: scale = PLAYER_SCALE
+    tint = tuple(tint) if tint is not None else None
+    key = (skin, scale, tint, flash)
+    variant = _variants.get(key)
+    if variant is not None:
+        _variants.move_to_end(key)
+        return variant
+
+    if skin not in SKINS:
+        print(f"Attention: skin '{skin}' inconnu, utilisation de '{DEFAULT_SKIN}'")
+        return get_variant(DEFAULT_SKIN, scale, tint, flash)
+    walk_path, attack_path = SKINS[skin]
+    if tint is not None or flash:
+        base = get_variant(skin, scale)
+        walk, attack = _tinted(base.walk, tint, flash), _tinted(base.attack, tint, flash)
+    elif skin == DEFAULT_SKIN and scale == PLAYER_SCALE:
+        walk, attack = get_animations(walk_path, 4, 6, scale), get_animations(attack_path, 4, 8, scale)
+        variant = Variant(walk, attack, 0)
+    else:
+        walk = cut_sheet(load_sheet(walk_path, 4, 6), 4, 6, scale)
+        attack = cut_sheet(load_sheet(attack_path, 4, 8), 4, 8, scale)
+    if variant is None:
+        variant = Variant(walk, attack, _frames_bytes(walk) + _frames_bytes(attack))
+    return _store(key, variant)
+
+
+def _store(key, variant):
+    global _variant_bytes
+    _variants[key] = variant
+    _variant_bytes += variant.size
+    # Éviction des moins récemment utilisées (les entités qui les affichent gardent leurs frames)
+    budget = SPRITE_VARIANT_BUDGET_MB * 1024 * 1024
+    for old in list(_variants):
+        if _variant_bytes <= budget: break
+        if old == key or _variants[old].size == 0: continue
+        _variant_bytes -= _variants.pop(old).size
+    return variant
+
+
+def prepare_skin(skin, scale=None):
+    """Planches d'un skin découpées hors du thread principal (voir AssetLoader)."""
+    walk_path, attack_path = SKINS[skin]
+    return prepare_animations(walk_path, 4, 6, scale), prepare_animations(attack_path, 4, 8, scale)
+
+
+def is_loaded(skin, scale=None):
+    if scale is None: scale = PLAYER_SCALE
+    if (skin, scale, None, False) in _variants:
+        return True
+    walk_path, attack_path = SKINS[skin]
+    return skin == DEFAULT_SKIN and scale == PLAYER_SCALE and \
+        (walk_path, 4, 6, scale) in _anim_cache and (attack_path, 4, 8, scale) in _anim_cache
+
+
+def has_variant(skin, scale, tint=None, flash=False):
+    return (skin, scale, tuple(tint) if tint is not None else None, flash) in _variants
+
+
+def prepare_tint(anims, tint, flash):
+    """Teinte de frames non converties (thread de chargement) : (marche, attaque) -> idem."""
+    return tuple(_tinted(a, tint, flash) for a in anims)
+
+
+def install_variant(skin, scale, walk, attack, tint=None, flash=False):
+    """Enregistre une variante déjà découpée et convertie (chargement en arrière-plan)."""
+    key = (skin, scale, tuple(tint) if tint is not None else None, flash)
+    if key in _variants: return
+    if skin == DEFAULT_SKIN and scale == PLAYER_SCALE and key[2:] == (None, False):
+        walk_path, attack_path = SKINS[skin]
+        install(walk_path, 4, 6, scale, walk)
+        install(attack_path, 4, 8, scale, attack)
+        return  # get_variant le prendra dans _anim_cache
+    _store(key, Variant(walk, attack, _frames_bytes(walk) + _frames_bytes(attack)))
+
+
+def preload_variants(keys):
+    """Construit d'avance des variantes (skin, échelle, teinte, flash) pour éviter un à-coup en jeu."""
+    for key in keys:
+        get_variant(*key)
+
+
+def clear_variants():
+    global _variant_bytes
+    _variants.clear()
+    _variant_bytes = 0
+
+
+def variant_stats():
+    return {'variants': len(_variants), 'bytes': _variant_bytes,
+            'budget': SPRITE_VARIANT_BUDGET_MB * 1024 * 1024}
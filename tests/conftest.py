@@ -0,0 +1,45 @@
+import os
+import sys
+
+# Pas de fenêtre ni de son pendant les tests ; modules du jeu importables depuis tests/
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import pytest
+from collision import CollisionGrid
+
+
+@pytest.fixture(scope="session", autouse=True)
+def display():
+    # Les sprites passent par convert_alpha : il faut un écran, même factice
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+class Target:
+    """Cible factice : les ennemis et le bot ne lisent que sa hitbox."""
+
+    def __init__(self, rect=(0, 0, 20, 20), center=None):
+        self.hitbox = pygame.Rect(rect)
+        if center is not None: self.hitbox.center = center
+
+
+@pytest.fixture
+def target():
+    return Target
+
+
+@pytest.fixture
+def corridor_map():
+    # Salle en haut, salle en bas, reliées par un couloir vertical de 2 cases de navigation
+    # (colonnes 3 et 4) : à droite du couloir, un mur plein sépare les deux salles
+    walls = np.ones((480, 192), dtype=bool)
+    walls[:144] = False
+    walls[144:336, 54:138] = False
+    walls[336:] = False
+    return CollisionGrid(walls)
@@ -0,0 +1,21 @@
+import animation
+from animation import advance_all, pose
+from enemy import Enemy
+
+
+def test_flash_table_fetched_once_per_flash(monkeypatch):
+    enemy = Enemy(200, 200)
+    enemy.take_damage(1)
+    flashed = enemy.anim.flash_table
+    assert flashed is enemy.anim.table.flashed()
+
+    # Pendant le flash, pose() ne repasse plus par le cache de variantes
+    def no_lookup(*args, **kwargs):
+        raise AssertionError("get_table appelé pendant le flash")
+    monkeypatch.setattr(animation, 'get_table', no_lookup)
+    while enemy.anim.flash > 1:
+        advance_all((enemy,))
+        pose(enemy)
+        assert enemy.image is flashed.clips[enemy.anim.clip.index].frames[enemy.anim.frame]
+    enemy.take_damage(1)
+    assert enemy.anim.flash_table is flashed
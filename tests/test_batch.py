@@ -0,0 +1,13 @@
+import batch
+import controls
+import enemy
+
+
+def test_frozen_game_is_flagged_stuck(monkeypatch):
+    # Bot immobile et mobs figés (comme bloqués contre un mur) : plus rien ne bouge
+    monkeypatch.setattr(controls.BotInput, 'get_events', lambda self: [])
+    monkeypatch.setattr(enemy.Enemy, 'update', lambda self, *args, **kwargs: None)
+    rows = batch.play((0, dict(batch.PARAMS), 6000, 100))
+    row = dict(zip(batch.COLUMNS, rows[-1]))
+    assert (row['stuck'], row['died'], row['cleared']) == (1, 0, 0)
+    assert row['ticks'] < 1000  # Arrêtée bien avant max_ticks
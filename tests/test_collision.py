@@ -0,0 +1,71 @@
+import numpy as np
+import pygame
+import pytest
+import game_map
+from collision import CollisionGrid, RunLengthGrid
+from game_map import collision_storage
+
+
+def small_map():
+    # Blocs et pixels isolés, bords pleins et vides : toutes les formes de plages
+    rng = np.random.default_rng(3)
+    walls = rng.random((90, 120)) < 0.05
+    walls[20:45, 30:70] = True
+    walls[60:62, :] = True
+    walls[:, 100:103] = True
+    walls[70:, 110:] = True
+    return walls
+
+
+@pytest.mark.parametrize('zoom', [1.0, 0.7, 1.5])
+def test_run_length_grid_matches_bit_grid(zoom):
+    walls = small_map()
+    world = (int(walls.shape[1] * zoom), int(walls.shape[0] * zoom))
+    bits = CollisionGrid(walls, world_size=world)
+    runs = RunLengthGrid.from_grid(bits)
+    assert (runs.packed_bits() == bits.packed_bits()).all()
+    rng = np.random.default_rng(4)
+
+    xs = rng.integers(-5, world[0] + 5, 5000)
+    ys = rng.integers(-5, world[1] + 5, 5000)
+    assert (runs.walls_at(xs, ys) == bits.walls_at(xs, ys)).all()
+    assert all(runs.is_wall(x, y) == bits.is_wall(x, y) for x, y in zip(xs[:500].tolist(), ys[:500].tolist()))
+
+    for _ in range(100):
+        rect = pygame.Rect(rng.integers(0, world[0] - 1), rng.integers(0, world[1] - 1), 1, 1)
+        rect.size = (rng.integers(1, world[0] - rect.x + 1), rng.integers(1, world[1] - rect.y + 1))
+        assert (runs.walls_in(rect) == bits.walls_in(rect)).all()
+
+        box = pygame.Rect(rng.integers(-5, world[0]), rng.integers(-5, world[1]), rng.integers(1, 20), rng.integers(1, 20))
+        dx, dy = rng.integers(-40, 41, 2).tolist()
+        a, b = box.copy(), box.copy()
+        assert runs.move_box(a, dx, dy) == bits.move_box(b, dx, dy) and a == b
+
+    probes_x = rng.uniform(0, world[0], (200, 3))
+    probes_y = rng.uniform(0, world[1], (200, 3))
+    dx = np.where(rng.random(200) < 0.5, rng.uniform(-12, 12, 200), 0.0)
+    dy = np.where(dx == 0, rng.uniform(-12, 12, 200), 0.0)
+    assert (runs.max_shift(probes_x, probes_y, dx, dy) == bits.max_shift(probes_x, probes_y, dx, dy)).all()
+
+    # Autre ZOOM_FACTOR : mêmes murs lus à la nouvelle taille de monde
+    other = (world[0] * 2, world[1] * 2)
+    xs, ys = xs * 2, ys * 2
+    assert (runs.rescaled(other).walls_at(xs, ys) == bits.rescaled(other).walls_at(xs, ys)).all()
+
+
+def test_collision_storage_round_trip(monkeypatch):
+    walls = small_map()
+    bits = CollisionGrid(walls, build_sdf=True, world_size=(180, 135))
+
+    monkeypatch.setattr(game_map, 'COLLISION_RLE', True)
+    runs = collision_storage(bits)
+    assert isinstance(runs, RunLengthGrid)
+    assert collision_storage(runs) is runs
+    assert (runs.world_w, runs.world_h) == (180, 135) and runs.sdf is bits.sdf
+
+    monkeypatch.setattr(game_map, 'COLLISION_RLE', False)
+    back = collision_storage(runs)
+    assert type(back) is CollisionGrid
+    assert collision_storage(back) is back
+    assert (back.packed_bits() == bits.packed_bits()).all()
+    assert (back.world_w, back.world_h) == (180, 135) and back.sdf is bits.sdf
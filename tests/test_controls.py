@@ -0,0 +1,30 @@
+import math
+from types import SimpleNamespace
+import pygame
+from settings import *
+from controls import BotInput
+from pathfinding import FlowField
+
+HITBOX = (60, 65)
+
+
+def test_bot_goes_around_wall_to_reach_mob(corridor_map, target):
+    grid = corridor_map
+    flow = FlowField(grid, NAV_CELL_SIZE, HITBOX)
+    player = SimpleNamespace(hitbox=pygame.Rect((0, 0), HITBOX), is_attacking=False, facing='down')
+    player.hitbox.center = (160, 400)
+    mob = target(((0, 0), HITBOX), center=(160, 60))  # Juste au-dessus du joueur, de l'autre côté du mur
+    bot = BotInput(seed=0, reaction=0.0)
+    bot.attach(SimpleNamespace(state='game', player=player, all_enemies=[mob], flow=flow, map=grid))
+
+    for tick in range(400):
+        flow.update(*player.hitbox.center)
+        bot.get_events()
+        keys = bot.get_pressed()
+        dx = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * MOVE_SPEED
+        dy = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * MOVE_SPEED
+        grid.move_box(player.hitbox, dx, dy)
+        if math.dist(player.hitbox.center, mob.hitbox.center) <= bot.reach:
+            break
+    # Tout droit, il pousserait vers le haut contre le mur indéfiniment
+    assert math.dist(player.hitbox.center, mob.hitbox.center) <= bot.reach
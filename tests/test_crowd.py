@@ -0,0 +1,22 @@
+import numpy as np
+from collision import CollisionGrid
+from enemy import Enemy
+
+
+def test_push_ignored_in_contact_with_player(target):
+    grid = CollisionGrid(np.zeros((400, 400), dtype=bool))
+    enemy = Enemy(0, 0)
+    enemy.hitbox.center = (200, 200)
+    enemy.rect.center = enemy.hitbox.center
+    player = target(enemy.hitbox.move(0, enemy.hitbox.h - 10))
+    enemy.push = (2.0, -2.0)  # La foule l'écarterait du joueur
+
+    enemy.update(player, grid, 0)
+    assert enemy.hitbox.center == (200, 200)
+    assert enemy.hitbox.colliderect(player.hitbox)
+
+    # Sans contact, la poussée s'ajoute toujours au déplacement
+    player.hitbox.y += 200
+    enemy.push = (2.0, 0.0)
+    enemy.update(player, grid, 0)
+    assert enemy.hitbox.centerx == 202
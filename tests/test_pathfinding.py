@@ -0,0 +1,42 @@
+from settings import *
+from enemy import Enemy
+from enemy_swarm import EnemySwarm
+from pathfinding import FlowField
+from spatial_grid import SpatialGroup
+
+
+def test_off_centre_mob_enters_narrow_corridor(corridor_map, target):
+    grid = corridor_map
+    enemy = Enemy(0, 0)
+    flow = FlowField(grid, NAV_CELL_SIZE, enemy.hitbox.size)
+    assert flow.passable[6:14, 3:5].all() and not flow.passable[6:14, 2].any()
+
+    # Joueur sous la colonne 4 : le mob, au-dessus de l'entrée, doit descendre tout droit
+    player = target(center=(4 * NAV_CELL_SIZE + 12, 420))
+    flow.update(*player.hitbox.center)
+    enemy.hitbox.center = (4 * NAV_CELL_SIZE + 12 + 9, 108)  # 9 px à droite de l'axe de sa case
+    enemy.rect.center = enemy.hitbox.center
+    assert flow.direction(*enemy.hitbox.center, 0, 0) == (0.0, 1.0)
+
+    start = enemy.hitbox.centery
+    for tick in range(60):
+        enemy.update(player, grid, tick * 16, flow)
+        assert not grid.walls_in(enemy.hitbox).any()
+    # Sans recentrage, le coin du couloir le bloque à 2 px du départ
+    assert enemy.hitbox.centery - start > 100
+
+
+def test_swarm_hitbox_stays_out_of_walls_and_enters_corridor(corridor_map, target):
+    grid = corridor_map
+    swarm = EnemySwarm(grid, SpatialGroup(grid.width, grid.height))
+    flow = FlowField(grid, NAV_CELL_SIZE, (swarm.hitbox_w, swarm.hitbox_h))
+    player = target(center=(4 * NAV_CELL_SIZE + 12, 420))
+    flow.update(*player.hitbox.center)
+    # Même départ que le mob ci-dessus : 9 px à droite de l'axe de sa case
+    mob = swarm.spawn(4 * NAV_CELL_SIZE + 12 + 9, 108 + swarm.frame_h / 2)
+
+    start = mob.hitbox.centery
+    for tick in range(60):
+        swarm.step(player, tick * 16, flow)
+        assert not grid.walls_in(mob.hitbox).any()
+    assert mob.hitbox.centery - start > 100
@@ -0,0 +1,30 @@
+from controls import ScriptedInput
+from game import Game
+
+
+def test_hot_reload_keeps_the_run():
+    game = Game(headless=True, controls=ScriptedInput())
+    game.state = 'game'
+    for _ in range(400):
+        game.tick()
+    game.player.gain_xp(150)
+    before = {name: game.config.values[name] for name in ('GRID_CELL_SIZE', 'ZOOM_FACTOR')}
+    player, level, health = game.player, game.player.level, game.player.health
+    x, y = game.player.hitbox.center
+    mobs = sorted(mob.health for mob in game.all_enemies)
+    assert mobs
+
+    try:
+        # Grille refaite : mêmes ennemis, même joueur, même vague
+        game.config.set(GRID_CELL_SIZE=64)
+        assert game.all_enemies.cell_size == 64
+        assert sorted(mob.health for mob in game.all_enemies) == mobs
+        assert game.player is player and game.player.hitbox.center == (x, y)
+
+        # Carte réagrandie : positions à la nouvelle échelle
+        game.config.set(ZOOM_FACTOR=before['ZOOM_FACTOR'] * 2)
+        assert game.player.hitbox.center == (x * 2, y * 2)
+        assert len(game.all_enemies) == len(mobs)
+        assert (game.wave, game.player.level, game.player.health) == (1, level, health)
+    finally:
+        game.config.set(**before)
@@ -0,0 +1,23 @@
+from controls import BotInput
+from game import Game
+from replay import InputRecorder, ReplayInput, replay_fast, state_digest
+
+
+def test_replay_reaches_the_recorded_state(tmp_path):
+    path = tmp_path / 'partie.rec'
+    recorder = InputRecorder(BotInput(seed=3), path)
+    game = Game(headless=True, controls=recorder)
+    recorder.attach(game)
+    game.state = 'game'
+    for _ in range(600):
+        game.tick()
+    recorder.save()
+    expected = state_digest(game)
+
+    controls = ReplayInput(path)
+    assert len(controls) == 600 and controls.header['digest'] == expected
+    replayed = Game(headless=True, controls=controls)
+    replayed.state = 'game'
+    replay_fast(replayed)
+    assert replayed.ticks == game.ticks
+    assert state_digest(replayed) == expected
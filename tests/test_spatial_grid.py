@@ -0,0 +1,32 @@
+import random
+import pygame
+from spatial_grid import SpatialGroup
+
+
+class Mob(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.hitbox = pygame.Rect(x, y, 40, 30)
+
+
+def test_grid_follows_threshold_and_matches_scan():
+    rng = random.Random(0)
+    mobs = [Mob(rng.randint(0, 900), rng.randint(0, 900)) for _ in range(60)]
+    group = SpatialGroup(1000, 1000, 128, *mobs[:20], min_sprites=40)
+    assert not group.indexed
+    group.add(*mobs[20:])
+    assert group.indexed
+
+    for mob in mobs:
+        mob.hitbox.move_ip(rng.randint(-150, 150), rng.randint(-150, 150))
+    group.relocate_all()
+    for _ in range(50):
+        rect = pygame.Rect(rng.randint(-50, 950), rng.randint(-50, 950), rng.randint(1, 300), rng.randint(1, 300))
+        expected = {mob for mob in mobs if rect.colliderect(mob.hitbox)}
+        assert set(group.sprites_in_rect(rect)) == expected
+
+    # Sous la moitié du seuil, la grille est abandonnée : les requêtes balayent tout
+    group.remove(*mobs[:45])
+    assert not group.indexed
+    rect = pygame.Rect(0, 0, 500, 500)
+    assert set(group.sprites_in_rect(rect)) == {mob for mob in mobs[45:] if rect.colliderect(mob.hitbox)}
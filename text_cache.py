@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from settings import *
+
+# --- CACHE DE TEXTES RENDUS (PARTAGÉ PAR TOUT LE PROCESSUS) ---
+# Clé : (police, texte, couleur, antialias). Les plus anciens sont évincés (LRU)
+# au-delà de TEXT_CACHE_SIZE entrées. Comme pour sprite_cache, les surfaces
+# renvoyées sont partagées : ne jamais dessiner dessus.
+_text_cache = OrderedDict()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def render_text(font, text, color, antialias=True):
+    """font.render(text, antialias, color), rendu une seule fois tant qu'il reste en cache."""
+    key = (font, text, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        _stats['hits'] += 1
+        return surface
+    _stats['misses'] += 1
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def clear_cache():
+    _text_cache.clear()
+    _stats['hits'] = _stats['misses'] = 0
+
+
+def cache_stats():
+    return dict(_stats, entries=len(_text_cache))
@@ -0,0 +1,259 @@
+import os
+import sys
+import json
+from collections import OrderedDict
+import numpy as np
+import pygame
+from settings import *
+from collision import CollisionGrid, mask_to_array
+from game_map import collision_storage, debug_tile, empty_collision, surface_bytes
+
+# Tuiles pré-découpées : tiles/<nom de la carte>/meta.json + map_x_y.png + col_x_y.png
+TILES_DIR = os.path.join(BASE_DIR, "tiles")
+
+
+def tile_dir(map_file=None):
+    if map_file is None: map_file = MAP_FILE
+    return os.path.join(TILES_DIR, os.path.splitext(map_file)[0])
+
+
+def cut_tiles(map_file=None, collision_file=None, tile_size=None):
+    """Étape hors-ligne : découpe la carte et les collisions en tuiles PNG (résolution source)."""
+    if map_file is None: map_file = MAP_FILE
+    if collision_file is None: collision_file = COLLISION_FILE
+    if tile_size is None: tile_size = MAP_TILE_SIZE
+    out = tile_dir(map_file)
+    os.makedirs(out, exist_ok=True)
+    layers = [('map', map_file)]
+    col_path = os.path.join(BASE_DIR, collision_file)
+    if os.path.exists(col_path):
+        layers.append(('col', collision_file))
+
+    w = h = None
+    for kind, name in layers:
+        image = pygame.image.load(os.path.join(BASE_DIR, name))
+        if w is None: w, h = image.get_size()
+        for ty in range(-(-h // tile_size)):
+            for tx in range(-(-w // tile_size)):
+                rect = pygame.Rect(tx * tile_size, ty * tile_size, tile_size, tile_size).clip(image.get_rect())
+                pygame.image.save(image.subsurface(rect), os.path.join(out, f"{kind}_{tx}_{ty}.png"))
+
+    meta = {'tile_size': tile_size, 'width': w, 'height': h,
+            'collision': len(layers) == 2, 'source': map_file}
+    with open(os.path.join(out, "meta.json"), 'w') as f:
+        json.dump(meta, f)
+    return out
+
+
+class TileSource:
+    """Tuiles à la résolution source : fichiers pré-découpés, sinon découpe de l'image entière."""
+
+    def __init__(self, map_file=None, collision_file=None, tile_size=None):
+        if map_file is None: map_file = MAP_FILE
+        if collision_file is None: collision_file = COLLISION_FILE
+        if tile_size is None: tile_size = MAP_TILE_SIZE
+        self.dir = tile_dir(map_file)
+        meta_path = os.path.join(self.dir, "meta.json")
+        self.images = {}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            self.tile_size = meta['tile_size']
+            self.width, self.height = meta['width'], meta['height']
+            self.has_collisions = meta['collision']
+        else:
+            # Pas de tuiles sur disque : on garde l'image source (non agrandie) et on la découpe
+            self.dir = None
+            self.tile_size = tile_size
+            self.images['map'] = pygame.image.load(os.path.join(BASE_DIR, map_file)).convert()
+            self.width, self.height = self.images['map'].get_size()
+            col_path = os.path.join(BASE_DIR, collision_file)
+            self.has_collisions = os.path.exists(col_path)
+            if self.has_collisions:
+                self.images['col'] = pygame.image.load(col_path).convert_alpha()
+        self.cols = -(-self.width // self.tile_size)
+        self.rows = -(-self.height // self.tile_size)
+
+    def rect(self, tx, ty):
+        ts = self.tile_size
+        return pygame.Rect(tx * ts, ty * ts, ts, ts).clip(pygame.Rect(0, 0, self.width, self.height))
+
+    def load(self, kind, tx, ty):
+        if self.dir is None:
+            return self.images[kind].subsurface(self.rect(tx, ty))
+        image = pygame.image.load(os.path.join(self.dir, f"{kind}_{tx}_{ty}.png"))
+        return image.convert() if kind == 'map' else image.convert_alpha()
+
+
+class TiledGameMap:
+    """Même interface que GameMap, mais la carte agrandie est découpée en tuiles
+    chargées à la demande et gardées dans un cache LRU à budget mémoire fixe.
+
+    Les collisions restent en mémoire en entier, à la résolution source (1 bit par pixel).
+    """
+
+    def __init__(self):
+        self.source = TileSource(MAP_FILE, COLLISION_FILE, MAP_TILE_SIZE)  # Réglages actuels (config.py)
+        self.width = int(self.source.width * ZOOM_FACTOR)
+        self.height = int(self.source.height * ZOOM_FACTOR)
+        self.budget = MAP_TILE_BUDGET_MB * 2**20
+        self.tiles = OrderedDict()  # (couche, tx, ty) -> surface agrandie
+        self.cache_bytes = 0
+        self.load_collisions()
+
+    def rescale(self):
+        """Nouveau ZOOM_FACTOR : tuiles agrandies oubliées, collisions gardées (résolution source)."""
+        self.width = int(self.source.width * ZOOM_FACTOR)
+        self.height = int(self.source.height * ZOOM_FACTOR)
+        self.drop_tiles()
+        self.collision = collision_storage(self.collision.rescaled((self.width, self.height)))
+
+    def rebuild_debug(self):
+        """Après un changement de DEBUG_MODE : les tuiles debug seront refaites à la demande."""
+        self.drop_tiles('debug')
+
+    def drop_tiles(self, kind=None):
+        for key in [k for k in self.tiles if kind is None or k[0] == kind]:
+            self.cache_bytes -= surface_bytes(self.tiles.pop(key))
+
+    def footprint(self):
+        """Mémoire de chaque composant de la carte, en octets."""
+        tiles = {'map': 0, 'debug': 0}
+        for (kind, _, _), tile in self.tiles.items():
+            tiles[kind] += surface_bytes(tile)
+        return {'tiles': tiles['map'], 'collision': self.collision.nbytes(), 'debug': tiles['debug'],
+                'sources': sum(surface_bytes(s) for s in self.source.images.values())}
+
+    # --- COLLISIONS ---
+    def load_collisions(self):
+        src = self.source
+        self.has_collisions = src.has_collisions
+        if not src.has_collisions:
+            self.collision = empty_collision((self.width, self.height))
+            print("Attention: Pas de fichier collision trouvé.")
+            return
+        # Tuile par tuile : on ne garde jamais plus d'une tuile décodée à la fois
+        stride = -(-src.width // 8)
+        bits = np.zeros((src.height, stride), dtype=np.uint8)
+        for ty in range(src.rows):
+            for tx in range(src.cols):
+                r = src.rect(tx, ty)
+                mask = pygame.mask.from_threshold(src.load('col', tx, ty), (0, 0, 0), (2, 2, 2))
+                walls = np.zeros((r.h, stride * 8), dtype=bool)
+                walls[:, r.x:r.right] = mask_to_array(mask)
+                bits[r.y:r.bottom] |= np.packbits(walls, axis=1)
+        self.collision = collision_storage(CollisionGrid.from_packed(bits, src.width, src.height,
+                                                                     world_size=(self.width, self.height)))
+        print("Info: Collisions chargées (tuiles).")
+
+    def check_wall(self, x, y):
+        """Vérifie si un point (x, y) est dans un mur (les bords de la carte comptent comme des murs)."""
+        return self.collision.is_wall(x, y)
+
+    def walls_at(self, xs, ys):
+        return self.collision.walls_at(xs, ys)
+
+    def any_wall(self, xs, ys):
+        return self.collision.any_wall(xs, ys)
+
+    def any_wall_in(self, rect):
+        return self.collision.any_wall_in(rect)
+
+    def max_shift(self, xs, ys, dx, dy):
+        return self.collision.max_shift(xs, ys, dx, dy)
+
+    def box_walls(self, w, h):
+        return self.collision.box_walls(w, h)
+
+    def move_box(self, rect, dx, dy):
+        return self.collision.move_box(rect, dx, dy)
+
+    # --- TUILES ---
+    def _edge(self, t, size, src_size, world_size):
+        # Premier pixel monde dont le pixel source appartient à la tuile t
+        return min(-(-(t * size * world_size) // src_size), world_size)
+
+    def tile_world_rect(self, tx, ty):
+        src, ts = self.source, self.source.tile_size
+        x0 = self._edge(tx, ts, src.width, self.width)
+        x1 = self._edge(tx + 1, ts, src.width, self.width)
+        y0 = self._edge(ty, ts, src.height, self.height)
+        y1 = self._edge(ty + 1, ts, src.height, self.height)
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+
+    def tiles_in(self, rect):
+        src, ts = self.source, self.source.tile_size
+        area = rect.clip(pygame.Rect(0, 0, self.width, self.height))
+        if area.w == 0 or area.h == 0: return
+        tx0 = area.left * src.width // self.width // ts
+        tx1 = (area.right - 1) * src.width // self.width // ts
+        ty0 = area.top * src.height // self.height // ts
+        ty1 = (area.bottom - 1) * src.height // self.height // ts
+        for ty in range(ty0, min(ty1, src.rows - 1) + 1):
+            for tx in range(tx0, min(tx1, src.cols - 1) + 1):
+                yield tx, ty
+
+    def get_tile(self, kind, tx, ty):
+        key = (kind, tx, ty)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            return tile
+        size = self.tile_world_rect(tx, ty).size
+        if kind == 'map':
+            tile = pygame.transform.scale(self.source.load('map', tx, ty), size)
+        else:
+            tile = self._debug_tile(tx, ty, size)
+        self.tiles[key] = tile
+        self.cache_bytes += surface_bytes(tile)
+        self._evict()
+        return tile
+
+    def _debug_tile(self, tx, ty, size):
+        # Overlay rouge construit depuis les collisions, seulement pour cette tuile
+        return debug_tile(self.collision.walls_in(self.tile_world_rect(tx, ty)))
+
+    def _evict(self):
+        # On garde toujours la tuile la plus récente, même si elle dépasse seule le budget
+        while self.cache_bytes > self.budget and len(self.tiles) > 1:
+            _, old = self.tiles.popitem(last=False)
+            self.cache_bytes -= surface_bytes(old)
+
+    def prefetch(self, rect):
+        """Charge d'avance les tuiles sous rect (zone monde autour de la caméra)."""
+        for tx, ty in self.tiles_in(rect):
+            self.get_tile('map', tx, ty)
+
+    # --- RENDU ---
+    def blit_area(self, surface, dest, area):
+        layers = ['map']
+        if DEBUG_MODE and self.has_collisions: layers.append('debug')
+        for tx, ty in self.tiles_in(area):
+            tile_rect = self.tile_world_rect(tx, ty)
+            part = tile_rect.clip(area)
+            pos = (dest[0] + part.x - area.x, dest[1] + part.y - area.y)
+            part.move_ip(-tile_rect.x, -tile_rect.y)
+            for kind in layers:
+                surface.blit(self.get_tile(kind, tx, ty), pos, part)
+
+    def overview(self, size):
+        """Carte entière réduite à size, tuile par tuile (fond du menu)."""
+        out = pygame.Surface(size).convert()
+        src = self.source
+        for ty in range(src.rows):
+            for tx in range(src.cols):
+                r = src.rect(tx, ty)
+                x0, x1 = r.left * size[0] // src.width, r.right * size[0] // src.width
+                y0, y1 = r.top * size[1] // src.height, r.bottom * size[1] // src.height
+                if x1 > x0 and y1 > y0:
+                    small = pygame.transform.smoothscale(src.load('map', tx, ty), (x1 - x0, y1 - y0))
+                    out.blit(small, (x0, y0))
+        return out
+
+
+if __name__ == '__main__':
+    # python tiled_map.py [carte.png collision.png] : pré-découpe les tuiles
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    args = sys.argv[1:] or [MAP_FILE, COLLISION_FILE]
+    print(f"Tuiles écrites dans {cut_tiles(*args)}")
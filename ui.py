@@ -1,39 +1,59 @@
 import pygame
 from settings import *
+from text_cache import render_text
 
 class UI:
     def __init__(self):
         self.display_surface = pygame.display.get_surface()
         self.font = pygame.font.SysFont("Arial", UI_FONT_SIZE, bold=True)
-        
+
         # Rectangle Vie
         self.health_bar_rect = pygame.Rect(10, 10, HEALTH_BAR_WIDTH, UI_BAR_HEIGHT)
         # Rectangle XP (Juste en dessous)
         self.xp_bar_rect = pygame.Rect(10, 35, HEALTH_BAR_WIDTH, 15)
+        # Zone écran couverte par les barres et leurs textes (pour le rendu par zones sales)
+        self.area = pygame.Rect(0, 0, HEALTH_BAR_WIDTH + 150, 60)
+
+        # Calque HUD transparent, redessiné seulement quand les valeurs affichées changent
+        self.layer = pygame.Surface(self.area.size, pygame.SRCALPHA)
+        self.layer_key = None
 
-    def show_bar(self, current, max_amount, bg_rect, color):
+    def show_bar(self, surface, current, max_amount, bg_rect, color):
         # Fond
-        pygame.draw.rect(self.display_surface, HEALTH_BG_COLOR, bg_rect)
-        
+        pygame.draw.rect(surface, HEALTH_BG_COLOR, bg_rect)
+
         # Partie remplie
         ratio = current / max_amount
         current_width = bg_rect.width * ratio
         current_rect = bg_rect.copy()
         current_rect.width = current_width
-        
+
         # Dessin
-        pygame.draw.rect(self.display_surface, color, current_rect)
-        pygame.draw.rect(self.display_surface, UI_BORDER_COLOR, bg_rect, 2)
+        pygame.draw.rect(surface, color, current_rect)
+        pygame.draw.rect(surface, UI_BORDER_COLOR, bg_rect, 2)
 
-    def display(self, player):
+    def blit_text(self, surface, text, pos):
+        # MAX sur un calque vide = copie exacte du texte et de son alpha (pas de franges sombres)
+        surface.blit(text, pos, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def redraw(self, player):
+        layer = self.layer
+        layer.fill((0, 0, 0, 0))
         # 1. Barre de Vie
-        self.show_bar(player.health, player.max_health, self.health_bar_rect, HEALTH_COLOR)
-        txt_hp = self.font.render(f"{int(player.health)}/{player.max_health}", True, UI_BORDER_COLOR)
-        self.display_surface.blit(txt_hp, (self.health_bar_rect.right + 10, 10))
+        self.show_bar(layer, player.health, player.max_health, self.health_bar_rect, HEALTH_COLOR)
+        txt_hp = render_text(self.font, f"{int(player.health)}/{player.max_health}", UI_BORDER_COLOR)
+        self.blit_text(layer, txt_hp, (self.health_bar_rect.right + 10, 10))
 
         # 2. Barre d'XP
-        self.show_bar(player.current_xp, player.max_xp, self.xp_bar_rect, XP_COLOR)
-        
+        self.show_bar(layer, player.current_xp, player.max_xp, self.xp_bar_rect, XP_COLOR)
+
         # 3. Texte du Niveau
-        txt_lvl = self.font.render(f"Lvl {player.level}", True, LEVEL_TEXT_COLOR)
-        self.display_surface.blit(txt_lvl, (self.xp_bar_rect.right + 10, 32))
\ No newline at end of file
+        txt_lvl = render_text(self.font, f"Lvl {player.level}", LEVEL_TEXT_COLOR)
+        self.blit_text(layer, txt_lvl, (self.xp_bar_rect.right + 10, 32))
+
+    def display(self, player):
+        key = (player.health, player.max_health, player.current_xp, player.max_xp, player.level)
+        if key != self.layer_key:
+            self.redraw(player)
+            self.layer_key = key
+        self.display_surface.blit(self.layer, self.area)
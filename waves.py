@@ -0,0 +1,148 @@
+import os
+import json
+import math
+from collections import deque
+from settings import *
+from enemy import Enemy
+
+
+class EnemyPool:
+    """Réserve d'ennemis morts, réutilisés par les vagues suivantes au lieu d'en recréer."""
+
+    def __init__(self, group):
+        self.group = group
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, x, y, **stats):
+        if self.free:
+            mob = self.free.pop()
+            mob.reset(x, y, **stats)
+            self.reused += 1
+        else:
+            mob = Enemy(x, y, **stats)
+            mob.pool = self
+            self.created += 1
+        mob.pooled = False
+        self.group.add(mob)
+        return mob
+
+    def release(self, mob):
+        if mob.pooled: return
+        mob.pooled = True
+        self.free.append(mob)
+
+    def release_all(self):
+        for mob in self.group.sprites():
+            mob.kill()
+            self.release(mob)
+
+    def reserve(self, n):
+        """Crée d'avance de quoi remplir la plus grosse vague (pas d'allocation en jeu)."""
+        while len(self.free) < n:
+            mob = Enemy(0, 0)
+            mob.pool = self
+            mob.pooled = True
+            self.free.append(mob)
+            self.created += 1
+
+
+class WaveScheduler:
+    """Vagues lues depuis WAVES_FILE. Les apparitions d'une vague sont étalées dans le temps.
+
+    Une vague = une liste de groupes :
+        count   : nombre d'ennemis
+        stats   : arguments d'Enemy (max_health, damage, xp_reward, skin et tint optionnels)
+        points  : points d'apparition [x, y] (bas du sprite), utilisés à tour de rôle
+        step    : décalage [dx, dy] ajouté à chaque nouvel ennemi (optionnel)
+        delay   : ticks avant le premier ennemi du groupe (optionnel)
+        every   : ticks entre deux ennemis du groupe (optionnel, 0 = tous ensemble)
+    """
+
+    def __init__(self, path=None, endless=None):
+        if path is None: path = WAVES_FILE
+        if endless is None: endless = WAVES_ENDLESS
+        self.waves = []
+        self.loop = None
+        full_path = os.path.join(BASE_DIR, path)
+        try:
+            with open(full_path) as f:
+                data = json.load(f)
+            self.waves = data['waves']
+            if endless: self.loop = data.get('endless')
+        except (OSError, ValueError, KeyError) as e:
+            print(f"ERREUR: Impossible de lire les vagues {path} ({e})")
+        self.pending = deque()  # (tick, x, y, stats), triés par tick
+        self.tick = 0
+
+    @property
+    def count(self):
+        """Nombre de vagues (infini en mode sans fin)."""
+        return math.inf if self.loop and self.waves else len(self.waves)
+
+    @property
+    def idle(self):
+        """Plus aucun ennemi en attente d'apparition pour la vague en cours."""
+        return not self.pending
+
+    def definition(self, number):
+        """Groupes de la vague number (à partir de 1), ou [] après la dernière."""
+        if number <= len(self.waves):
+            return self.waves[number - 1]['groups']
+        if not self.loop or not self.waves:
+            return []
+        # Mode sans fin : on reprend les vagues à partir de 'from', de plus en plus fortes
+        start = self.loop.get('from', 1) - 1
+        span = len(self.waves) - start
+        k = number - 1 - len(self.waves)
+        base = self.waves[start + k % span]['groups']
+        power = k // span + 1
+        scale = {name: factor ** power for name, factor in self.loop.get('scale', {}).items()}
+        groups = []
+        for group in base:
+            group = dict(group)
+            group['count'] = max(1, round(group['count'] * scale.get('count', 1)))
+            group['stats'] = {name: type(value)(value * scale[name]) if name in scale else value
+                              for name, value in group['stats'].items()}
+            groups.append(group)
+        return groups
+
+    def peak(self):
+        """Taille de la plus grosse vague définie (pour préremplir la réserve d'ennemis)."""
+        return max((sum(g['count'] for g in wave['groups']) for wave in self.waves), default=0)
+
+    def variants(self):
+        """Variantes de sprite (skin, teinte) utilisées par les vagues, pour les précharger."""
+        looks = {(DEFAULT_SKIN, None)}
+        for wave in self.waves:
+            for group in wave['groups']:
+                tint = group['stats'].get('tint')
+                looks.add((group['stats'].get('skin', DEFAULT_SKIN), tuple(tint) if tint else None))
+        return looks
+
+    def begin(self, number):
+        spawns = []
+        for group in self.definition(number):
+            points = group['points']
+            step_x, step_y = group.get('step', (0, 0))
+            delay, every = group.get('delay', 0), group.get('every', 0)
+            for i in range(group['count']):
+                x, y = points[i % len(points)]
+                spawns.append((delay + i * every, x + i * step_x, y + i * step_y, group['stats']))
+        spawns.sort(key=lambda s: s[0])
+        self.pending = deque(spawns)
+        self.tick = 0
+
+    def update(self, spawn):
+        """Un tick : fait apparaître les ennemis dus (WAVE_SPAWNS_PER_TICK au plus) via spawn(x, y, **stats)."""
+        done = 0
+        while self.pending and self.pending[0][0] <= self.tick and done < WAVE_SPAWNS_PER_TICK:
+            _, x, y, stats = self.pending.popleft()
+            spawn(x, y, **stats)
+            done += 1
+        self.tick += 1
+
+    def clear(self):
+        self.pending.clear()
+        self.tick = 0